@@ -7,31 +7,46 @@ Each bot (dev, ops, monitor) subclasses BotBase and registers its handlers.
 
 Components:
     BotConfig       — loads YAML config, resolves token, sets up paths
-    ParamValidator   — validates & coerces command parameters against schema
-    TaskWriter       — writes task YAML files and polls for executor results
+    ParamValidator   — validates & coerces command parameters (bot_parse.py)
+    TaskWriter       — writes task files and polls for executor results
     AuditLogger      — appends structured JSON lines to audit log
     BotBase          — base class with auth, parsing, execution, confirmation
 
 Dependencies:
     pip install python-telegram-bot==20.* pyyaml
+    pip install uvloop   # optional, faster event loop
 
 Usage:
     See dev_bot.py, ops_bot.py, monitor_bot.py
 """
 
 import asyncio
+import functools
+import hashlib
 import json
 import logging
 import os
-import re
 import sys
 import time
 import uuid
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import yaml
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 from telegram import Update, BotCommand
 from telegram.ext import (
     Application,
@@ -42,6 +57,24 @@ from telegram.ext import (
     filters,
 )
 
+# Parsing/validation lives in its own module so it can be mypyc-compiled.
+# Imported as bots.bot_base (python -m bots.dev_bot) or top-level bot_base
+# (scripts that put bots/ on sys.path, tests).
+try:
+    from .bot_parse import (
+        ParamValidator,
+        ValidationError,
+        parse_command_args,
+        parse_command_tokens,
+    )
+except ImportError:
+    from bot_parse import (
+        ParamValidator,
+        ValidationError,
+        parse_command_args,
+        parse_command_tokens,
+    )
+
 # Kanban system
 from pkg.kanban.store import KanbanStore
 from pkg.kanban.telegram_bridge import TelegramKanbanBridge
@@ -58,9 +91,17 @@ AWAITING_CONFIRM = 1
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 
+# Last formatted second — audit bursts within one second reuse the string
+_last_ts: tuple[int, str] = (0, "")
+
+
 def utc_now() -> str:
     """ISO-8601 UTC timestamp."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    global _last_ts
+    s = int(time.time())
+    if s != _last_ts[0]:
+        _last_ts = (s, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(s)))
+    return _last_ts[1]
 
 
 def make_task_id() -> str:
@@ -77,6 +118,54 @@ def truncate(text: str, max_chars: int = 3500) -> str:
     return text[:max_chars] + f"\n…[truncated, {len(text) - max_chars} chars omitted]"
 
 
+def dump_task(task: dict) -> bytes:
+    """
+    Serialize a task for the wire.
+
+    Task files keep their .yaml name but hold JSON, which every YAML loader
+    (including the executor's) reads as-is and which parses far faster.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(task, option=orjson.OPT_INDENT_2)
+    return json.dumps(task, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def load_task_data(data: bytes) -> dict:
+    """Parse a task file written as JSON (bots) or YAML (executor results)."""
+    if data[:1] == b"{":
+        try:
+            return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+        except ValueError:
+            pass
+    return yaml.safe_load(data)
+
+
+def authorized(handler):
+    """
+    Decorator for bot handlers: reject senders outside the allowlist.
+
+    Wraps ``async def handler(self, update, context, ...)``; unauthorized
+    updates get ``self._reject_unauthorized(update)`` and its return value.
+    """
+    @functools.wraps(handler)
+    async def wrapper(self, update, context, *args, **kwargs):
+        if update.effective_user.id not in self._authorized_ids:
+            return await self._reject_unauthorized(update)
+        return await handler(self, update, context, *args, **kwargs)
+    return wrapper
+
+
+@functools.lru_cache(maxsize=None)
+def _get_store(db_path: str) -> KanbanStore:
+    """
+    Process-wide KanbanStore per database path.
+
+    Bots sharing a process (or a bot restarted in-process) reuse the same
+    store, so schema setup and connection pragmas only run once.
+    """
+    return KanbanStore(db_path)
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Exceptions
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -87,16 +176,27 @@ class ConfigError(Exception):
     pass
 
 
-class ValidationError(Exception):
-    """Raised when command parameters fail validation."""
-    pass
-
-
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # BotConfig — configuration loader
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 
+@functools.lru_cache(maxsize=8)
+def _load_cfg(path: str, mtime_ns: int, size: int) -> dict:
+    with open(path, "rb") as f:
+        return yaml.safe_load(f)
+
+
+def load_config(config_path: str) -> dict:
+    """
+    Parse a config file, reusing the previous parse while the file is
+    unchanged (keyed on mtime + size). The result is shared: treat it as
+    read-only.
+    """
+    st = os.stat(config_path)
+    return _load_cfg(str(config_path), st.st_mtime_ns, st.st_size)
+
+
 class BotConfig:
     """
     Loads and exposes config for a single bot.
@@ -106,8 +206,7 @@ class BotConfig:
     """
 
     def __init__(self, config_path: str, bot_name: str):
-        with open(config_path) as f:
-            raw = yaml.safe_load(f)
+        raw = load_config(config_path)
 
         self.global_cfg = raw.get("global", {})
         self.bot_name = bot_name
@@ -138,10 +237,11 @@ class BotConfig:
         self.task_path = Path(self.bot_cfg["task_path"])
         self.task_path.mkdir(parents=True, exist_ok=True)
 
-        # ── Allowlist (numeric Telegram user IDs as strings for comparison) ──
+        # ── Allowlist (numeric Telegram user IDs) ──
         self.allowed_users = [
             str(uid) for uid in self.bot_cfg.get("allowed_users", [])
         ]
+        self.allowed_user_ids = frozenset(int(uid) for uid in self.allowed_users)
         self.commands = self.bot_cfg.get("commands", {})
 
         # ── Audit log path ──
@@ -158,123 +258,40 @@ class BotConfig:
             fallback.touch(exist_ok=True)
             self.audit_log = fallback
             logger.warning(
-                f"Cannot write to {audit_path_str}, using {fallback}"
+                "Cannot write to %s, using %s", audit_path_str, fallback
             )
 
         self.result_timeout = self.global_cfg.get("result_timeout", 30)
 
-    def is_authorized(self, user_id: int) -> bool:
-        """Check if a Telegram user ID is in the allowlist."""
-        return str(user_id) in self.allowed_users
-
-    def get_command(self, name: str) -> dict | None:
-        """Return a command config dict, or None if not found."""
-        return self.commands.get(name)
-
-
-# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-# ParamValidator — input validation & coercion
-# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-
-class ParamValidator:
-    """
-    Validates and coerces command parameters against config schema.
-
-    Supports:
-        - required / optional with defaults
-        - type coercion (string, integer)
-        - allowed-value lists
-        - regex pattern matching
-        - min/max bounds for integers
-        - rejection of unknown parameters
-    """
-
-    def validate(self, params: dict, schema: dict) -> dict:
-        """
-        Validate and coerce params against schema.
-
-        Returns:
-            dict of validated, coerced parameters.
+        # ── Long polling: one getUpdates call held open up to this long ──
+        self.polling_timeout = self._setting("polling_timeout", 50)
 
-        Raises:
-            ValidationError with a user-friendly message on failure.
-        """
-        result = {}
+        # ── Webhook mode (enabled when webhook_url is set) ──
+        self.webhook_url = self._setting("webhook_url", None)
+        self.webhook_host = self._setting("webhook_host", "127.0.0.1")
+        self.webhook_port = int(self._setting("webhook_port", 8443))
 
-        for param_name, param_schema in schema.items():
-            value = params.get(param_name)
-            param_type = param_schema.get("type", "string")
-            required = param_schema.get("required", False)
-            default = param_schema.get("default")
+        # ── Known projects (empty = accept any name the schema allows) ──
+        self.projects = frozenset(
+            str(p) for p in self._setting("projects", None) or ()
+        )
 
-            # ── Missing value handling ──
-            if value is None or value == "":
-                if required:
-                    raise ValidationError(
-                        f"Missing required parameter: {param_name}"
-                    )
-                if default is not None:
-                    result[param_name] = default
-                continue
-
-            # ── Type: string ──
-            if param_type == "string":
-                value = str(value)
-
-                allowed = param_schema.get("allowed")
-                if allowed and value not in allowed:
-                    raise ValidationError(
-                        f"Invalid value for {param_name}: '{value}'. "
-                        f"Allowed: {', '.join(str(a) for a in allowed)}"
-                    )
-
-                pattern = param_schema.get("pattern")
-                if pattern and not re.fullmatch(pattern, value):
-                    raise ValidationError(
-                        f"Invalid format for {param_name}: '{value}' "
-                        f"does not match pattern {pattern}"
-                    )
-
-            # ── Type: integer ──
-            elif param_type == "integer":
-                try:
-                    value = int(value)
-                except (ValueError, TypeError):
-                    raise ValidationError(
-                        f"Parameter {param_name} must be an integer, "
-                        f"got: '{value}'"
-                    )
-
-                min_val = param_schema.get("min")
-                max_val = param_schema.get("max")
-                if min_val is not None and value < min_val:
-                    raise ValidationError(
-                        f"Parameter {param_name} must be >= {min_val}, "
-                        f"got: {value}"
-                    )
-                if max_val is not None and value > max_val:
-                    raise ValidationError(
-                        f"Parameter {param_name} must be <= {max_val}, "
-                        f"got: {value}"
-                    )
-
-            else:
-                raise ValidationError(
-                    f"Unknown parameter type in schema: {param_type}"
-                )
+        # ── Worker threads for blocking work (SQLite, audit file) ──
+        self.max_parallel_commands = int(
+            self._setting("max_parallel_commands", 4)
+        )
 
-            result[param_name] = value
+    def _setting(self, key: str, default: Any) -> Any:
+        """Per-bot value, falling back to the global section, then default."""
+        return self.bot_cfg.get(key, self.global_cfg.get(key, default))
 
-        # ── Reject unknown parameters ──
-        known = set(schema.keys())
-        unknown = set(params.keys()) - known
-        if unknown:
-            raise ValidationError(
-                f"Unknown parameters: {', '.join(sorted(unknown))}"
-            )
+    def is_authorized(self, user_id: int) -> bool:
+        """Check if a Telegram user ID is in the allowlist."""
+        return user_id in self.allowed_user_ids
 
-        return result
+    def get_command(self, name: str) -> dict | None:
+        """Return a command config dict, or None if not found."""
+        return self.commands.get(name)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -284,18 +301,22 @@ class ParamValidator:
 
 class TaskWriter:
     """
-    Writes task YAML files and polls for results.
+    Writes task files and polls for results.
 
     The bot writes a "pending" task file. The executor picks it up,
     marks it "running", executes, and writes the result back.
-    This class polls the file for terminal status.
+    One shared poller watches all outstanding task files for a terminal
+    status.
     """
 
     def __init__(self, task_path: Path, timeout: int):
         self.task_path = task_path
+        self.task_path_str = str(task_path)
         self.timeout = timeout
+        self._pending_tasks: dict[Path, list] = {}
+        self._poller: asyncio.Task | None = None
 
-    def write(
+    async def write(
         self,
         task_id: str,
         bot_name: str,
@@ -308,7 +329,12 @@ class TaskWriter:
         service: str = None,
         card_id: str = None,
     ) -> Path:
-        """Write a task YAML file and return its path."""
+        """
+        Write a task file and return its path.
+
+        The dump + rename runs in a worker thread so the event loop keeps
+        serving other updates while the file is flushed.
+        """
         task = {
             "id": task_id,
             "bot": bot_name,
@@ -330,48 +356,88 @@ class TaskWriter:
         if card_id:
             task["card_id"] = card_id
 
-        task_file = self.task_path / f"{task_id}.yaml"
-
-        # Atomic write: write to temp, then rename
-        tmp_file = task_file.with_suffix(".yaml.tmp")
-        with open(tmp_file, "w") as f:
-            yaml.dump(task, f, default_flow_style=False, sort_keys=False)
-        tmp_file.rename(task_file)
+        task_file = f"{self.task_path_str}/{task_id}.yaml"
+        await asyncio.to_thread(self._write_sync, task, task_file)
 
         logger.info(
-            f"Task written: {task_file} "
-            f"(command={command}, user={username})"
+            "Task written: %s (command=%s, user=%s)",
+            task_file, command, username,
         )
-        return task_file
+        return Path(task_file)
 
-    async def poll_result(self, task_file: Path) -> dict | None:
+    @staticmethod
+    def _write_sync(task: dict, task_file: str):
+        """Atomic write: write to temp, then rename."""
+        tmp_file = task_file + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(dump_task(task))
+        os.replace(tmp_file, task_file)
+
+    def register(self, task_file: Path) -> asyncio.Future:
         """
-        Poll a task file for status change to a terminal state.
+        Register a task file with the shared poller.
 
-        Uses exponential backoff: 0.5s → 1s → 1.5s → … → 3s max.
-        Returns the updated task dict, or None on timeout.
+        Returns a future resolved with the task dict once the file reaches
+        a terminal status. Cancel the future to stop watching the file.
+        """
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        # [future, next check (monotonic), current backoff interval]
+        self._pending_tasks[task_file] = [fut, time.monotonic() + 0.5, 0.5]
+        if self._poller is None or self._poller.done():
+            self._poller = loop.create_task(self._poll_loop())
+        return fut
+
+    async def _poll_loop(self):
+        """
+        Single poller for every outstanding task file.
+
+        Each file keeps its own backoff (0.5s → 0.75s → … → 3s max), but all
+        due files are checked in one pass per tick instead of one sleeping
+        coroutine per command. Exits when nothing is left to watch.
         """
-        start = time.monotonic()
-        interval = 0.5
         max_interval = 3.0
 
-        while (time.monotonic() - start) < self.timeout:
-            await asyncio.sleep(interval)
+        while self._pending_tasks:
+            await asyncio.sleep(0.5)
+            now = time.monotonic()
 
-            try:
-                with open(task_file) as f:
-                    task = yaml.safe_load(f)
-            except Exception:
-                continue
+            for task_file, entry in list(self._pending_tasks.items()):
+                fut, due, interval = entry
+                if fut.done():  # waiter timed out or was cancelled
+                    del self._pending_tasks[task_file]
+                    continue
+                if now < due:
+                    continue
 
-            status = task.get("status", "")
-            if status in ("complete", "failed", "rejected", "timeout"):
-                return task
+                try:
+                    with open(task_file, "rb") as f:
+                        task = load_task_data(f.read())
+                    status = task.get("status", "")
+                except Exception:
+                    status = ""
+
+                if status in ("complete", "failed", "rejected", "timeout"):
+                    del self._pending_tasks[task_file]
+                    fut.set_result(task)
+                    continue
 
-            # Backoff: 0.5 → 0.75 → 1.125 → … → 3.0
-            interval = min(interval * 1.5, max_interval)
+                interval = min(interval * 1.5, max_interval)
+                entry[1] = now + interval
+                entry[2] = interval
+
+    async def poll_result(self, task_file: Path) -> dict | None:
+        """
+        Wait for a task file to reach a terminal state.
 
-        return None
+        Returns the updated task dict, or None on timeout.
+        """
+        try:
+            return await asyncio.wait_for(
+                self.register(task_file), self.timeout
+            )
+        except asyncio.TimeoutError:
+            return None
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -402,6 +468,7 @@ class AuditLogger:
         """Append one audit entry. Extra kwargs are merged in."""
         entry = {
             "ts": utc_now(),
+            "ts_ns": time.time_ns(),  # for sorting/rendering without parsing ts
             "user_id": user_id,
             "username": username,
             "bot": bot,
@@ -414,11 +481,15 @@ class AuditLogger:
             if v is not None:
                 entry[k] = v
 
+        if HAS_ORJSON:
+            line = orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+        else:
+            line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
         try:
-            with open(self.log_path, "a") as f:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            with open(self.log_path, "ab") as f:
+                f.write(line)
         except Exception as e:
-            logger.error(f"Failed to write audit log: {e}")
+            logger.error("Failed to write audit log: %s", e)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -452,15 +523,41 @@ class BotBase:
             self.cfg.task_path, self.cfg.result_timeout
         )
         self.audit = AuditLogger(self.cfg.audit_log)
+        # Fixed for the life of the process; restart to pick up config edits
+        self._authorized_ids = self.cfg.allowed_user_ids
+        self._projects = self.cfg.projects
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.cfg.max_parallel_commands,
+            thread_name_prefix=f"{bot_name}-io",
+        )
         
         # Kanban integration
         db_path = os.environ.get("PICOCLAW_DB", "/var/lib/picoclaw/kanban.db")
-        self.kanban_store = KanbanStore(db_path)
+        self.kanban_store = _get_store(db_path)
         self.kanban_bridge = TelegramKanbanBridge(self.kanban_store)
         
         # user_id → {task_id, command, params, project, service}
         self._pending_confirms: dict[int, dict] = {}
 
+        # Commands running in the background (strong refs until done)
+        self._bg_tasks: set[asyncio.Task] = set()
+
+        # Autocomplete menu, plus a hash so unchanged menus aren't re-sent
+        self._bot_commands = [
+            (cmd_name, cmd_cfg.get("description", cmd_name)[:256])
+            for cmd_name, cmd_cfg in self.cfg.commands.items()
+        ]
+        self._bot_commands.append(("help", "Show available commands"))
+        self._bot_commands.append(("kanban", "Show Kanban board"))
+        bot_id = self.cfg.token.partition(":")[0]
+        self._cmds_hash = hashlib.sha256(
+            json.dumps([bot_id, self._bot_commands]).encode()
+        ).hexdigest()
+        cache_dir = Path(
+            os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+        ) / "picoclaw"
+        self._cmds_hash_file = cache_dir / f"cmds.{bot_name}.hash"
+
         logging.basicConfig(
             level=logging.INFO,
             format=f"%(asctime)s [{bot_name}] %(levelname)s: %(message)s",
@@ -473,16 +570,17 @@ class BotBase:
 
     def _is_authorized(self, update: Update) -> bool:
         """Check if the message sender is in the allowlist."""
-        return self.cfg.is_authorized(update.effective_user.id)
+        return update.effective_user.id in self._authorized_ids
 
     async def _reject_unauthorized(self, update: Update):
         """Log and reply to unauthorized access attempts."""
         user = update.effective_user
         logger.warning(
-            f"Unauthorized access attempt: user_id={user.id}, "
-            f"username={user.username}, name={user.full_name}"
+            "Unauthorized access attempt: user_id=%s, username=%s, name=%s",
+            user.id, user.username, user.full_name,
         )
-        self.audit.log(
+        await self._run_blocking(
+            self.audit.log,
             user_id=user.id,
             username=user.username or "",
             bot=self.cfg.bot_name,
@@ -495,35 +593,43 @@ class BotBase:
         )
 
     def _parse_command_args(self, text: str, command_schema: dict) -> dict:
-        """
-        Parse command text into a params dict.
+        """Parse command text into a params dict (see bot_parse)."""
+        return parse_command_args(text, command_schema)
 
-        Supports three forms:
-            /cmd arg1 arg2            → positional, matched to schema key order
-            /cmd key1=val1 key2=val2  → named
-            /cmd arg1 key2=val2       → mixed
+    def _parse_command_args_from_tokens(
+        self, tokens: list[str] | None, command_schema: dict
+    ) -> dict | None:
+        """
+        Parse the arguments PTB already split into context.args.
+        Returns None when no token list is available (non-command update),
+        in which case callers fall back to _parse_command_args.
+        """
+        if tokens is None:
+            return None
+        return parse_command_tokens(tokens, command_schema)
 
-        Returns:
-            dict of param_name → raw string value
+    def _spawn(self, coro, user_id: int) -> asyncio.Task:
         """
-        parts = text.split()[1:]  # drop the /command itself
-        schema_keys = list(command_schema.keys())
-        result = {}
-        positional_idx = 0
-
-        for part in parts:
-            if "=" in part:
-                # Named param: key=value
-                key, _, value = part.partition("=")
-                result[key] = value
-            else:
-                # Positional: assign to next schema key in order
-                if positional_idx < len(schema_keys):
-                    result[schema_keys[positional_idx]] = part
-                    positional_idx += 1
-                # Extra positional args beyond schema size are silently dropped
-
-        return result
+        Run a command coroutine in the background so the handler returns
+        to PTB's dispatcher immediately. Tagged with the user for /cancel.
+        """
+        task = asyncio.create_task(coro, name=f"user:{user_id}")
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_task_done)
+        return task
+
+    def _bg_task_done(self, task: asyncio.Task):
+        """Drop the reference and surface errors PTB no longer sees."""
+        self._bg_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Background command failed: %r", task.exception())
+
+    async def _run_blocking(self, fn, *args, **kwargs):
+        """Run a blocking call on the bot's worker pool and await it."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(fn, *args, **kwargs)
+        )
 
     # ──────────────────────────────────────────
     # Core command execution flow
@@ -617,7 +723,8 @@ class BotBase:
         if service:
             task_title += f" / {service}"
         
-        kanban_card = self.kanban_bridge.create_card_from_telegram(
+        kanban_card = await self._run_blocking(
+            self.kanban_bridge.create_card_from_telegram,
             title=task_title,
             telegram_message_id=str(update.message.message_id),
             telegram_user_id=str(user.id),
@@ -631,7 +738,7 @@ class BotBase:
         card_id = kanban_card.card_id if kanban_card else None
 
         # ── Write task file (with card_id linked) ──
-        task_file = self.task_writer.write(
+        task_file = await self.task_writer.write(
             task_id=task_id,
             bot_name=self.cfg.bot_name,
             command=command_name,
@@ -644,7 +751,8 @@ class BotBase:
         )
 
         # ── Audit: submitted ──
-        self.audit.log(
+        await self._run_blocking(
+            self.audit.log,
             user_id=user.id,
             username=user.username or "",
             bot=self.cfg.bot_name,
@@ -680,7 +788,8 @@ class BotBase:
         result = await self.task_writer.poll_result(task_file)
 
         if result is None:
-            self.audit.log(
+            await self._run_blocking(
+                self.audit.log,
                 user_id=user.id,
                 username=user.username or "",
                 bot=self.cfg.bot_name,
@@ -699,7 +808,8 @@ class BotBase:
 
         # ── Audit + reply with result ──
         status = result.get("status", "unknown")
-        self.audit.log(
+        await self._run_blocking(
+            self.audit.log,
             user_id=user.id,
             username=user.username or "",
             bot=self.cfg.bot_name,
@@ -717,14 +827,11 @@ class BotBase:
     # Confirmation handlers
     # ──────────────────────────────────────────
 
+    @authorized
     async def handle_confirm(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         """Handle /confirm — execute a previously-held command."""
-        if not self._is_authorized(update):
-            await self._reject_unauthorized(update)
-            return
-
         user = update.effective_user
         pending = self._pending_confirms.pop(user.id, None)
 
@@ -734,7 +841,8 @@ class BotBase:
             )
             return
 
-        self.audit.log(
+        await self._run_blocking(
+            self.audit.log,
             user_id=user.id,
             username=user.username or "",
             bot=self.cfg.bot_name,
@@ -752,24 +860,36 @@ class BotBase:
             service=pending.get("service"),
         )
 
+    @authorized
     async def handle_cancel(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
-        """Handle /cancel — discard a confirmation-held command."""
-        if not self._is_authorized(update):
-            await self._reject_unauthorized(update)
-            return
-
+        """
+        Handle /cancel — discard a confirmation-held command, or if none is
+        held, stop this user's in-flight commands.
+        """
         user = update.effective_user
         pending = self._pending_confirms.pop(user.id, None)
 
         if not pending:
+            # Nothing held for confirmation: stop waiting on running commands
+            name = f"user:{user.id}"
+            running = [t for t in self._bg_tasks if t.get_name() == name]
+            if not running:
+                await update.message.reply_text(
+                    "ℹ️ Nothing pending to cancel."
+                )
+                return
+            for t in running:
+                t.cancel()
             await update.message.reply_text(
-                "ℹ️ Nothing pending to cancel."
+                f"❌ Stopped waiting on {len(running)} running command(s).\n"
+                "Tasks already handed to the executor may still finish."
             )
             return
 
-        self.audit.log(
+        await self._run_blocking(
+            self.audit.log,
             user_id=user.id,
             username=user.username or "",
             bot=self.cfg.bot_name,
@@ -788,14 +908,11 @@ class BotBase:
     # Help handler
     # ──────────────────────────────────────────
 
+    @authorized
     async def handle_help(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         """Handle /help — auto-generate usage from config schema."""
-        if not self._is_authorized(update):
-            await self._reject_unauthorized(update)
-            return
-
         lines = [f"*{self.cfg.bot_name} — Commands*\n"]
 
         for cmd_name, cmd_cfg in self.cfg.commands.items():
@@ -891,15 +1008,14 @@ class BotBase:
     # Kanban handler
     # ──────────────────────────────────────────
 
+    @authorized
     async def handle_kanban(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         """Handle /kanban — display Kanban board summary."""
-        if not self._is_authorized(update):
-            await self._reject_unauthorized(update)
-            return
-
-        summary = self.kanban_bridge.list_cards_summary(state=None, limit=10)
+        summary = await self._run_blocking(
+            self.kanban_bridge.list_cards_summary, state=None, limit=10
+        )
         await update.message.reply_text(summary, parse_mode="Markdown")
 
     # ──────────────────────────────────────────
@@ -912,30 +1028,92 @@ class BotBase:
         Subclasses MUST call super().register_handlers(app)
         before adding their own handlers.
         """
-        app.add_handler(CommandHandler("help", self.handle_help))
-        app.add_handler(CommandHandler("start", self.handle_help))
-        app.add_handler(CommandHandler("confirm", self.handle_confirm))
-        app.add_handler(CommandHandler("cancel", self.handle_cancel))
-        app.add_handler(CommandHandler("kanban", self.handle_kanban))
+        app.add_handlers([
+            CommandHandler("help", self.handle_help),
+            CommandHandler("start", self.handle_help),
+            CommandHandler("confirm", self.handle_confirm),
+            CommandHandler("cancel", self.handle_cancel),
+            CommandHandler("kanban", self.handle_kanban),
+        ])
 
     async def set_bot_commands(self, app: Application):
-        """Set command suggestions in Telegram UI (autocomplete menu)."""
-        commands = []
-        for cmd_name, cmd_cfg in self.cfg.commands.items():
-            desc = cmd_cfg.get("description", cmd_name)
-            commands.append(BotCommand(cmd_name, desc[:256]))
-        commands.append(BotCommand("help", "Show available commands"))
-        commands.append(BotCommand("kanban", "Show Kanban board"))
-        await app.bot.set_my_commands(commands)
+        """
+        Set command suggestions in Telegram UI (autocomplete menu).
+
+        Skipped when the menu hash matches the one last sent for this bot,
+        so restarts with an unchanged config make no API call.
+        """
+        try:
+            if self._cmds_hash_file.read_text() == self._cmds_hash:
+                return
+        except OSError:
+            pass
+
+        await app.bot.set_my_commands(
+            [BotCommand(name, desc) for name, desc in self._bot_commands]
+        )
+
+        try:
+            self._cmds_hash_file.parent.mkdir(parents=True, exist_ok=True)
+            self._cmds_hash_file.write_text(self._cmds_hash)
+        except OSError as e:
+            logger.warning("Cannot cache command menu hash: %s", e)
+
+    async def post_init(self, app: Application):
+        """
+        Runs once the Application is initialized, before polling starts.
+        Subclasses may extend it (call super()) to start background tasks.
+        """
+        await self.set_bot_commands(app)
+
+    def _build_application(self) -> Application:
+        """Build the Telegram Application with handlers and post_init wired."""
+        if HAS_UVLOOP:
+            # run_polling/run_webhook build their loop from the active policy
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
-    def run(self):
-        """Build Telegram Application, register handlers, and start polling."""
         app = Application.builder().token(self.cfg.token).build()
         self.register_handlers(app)
+        app.post_init = self.post_init
+        return app
 
-        async def post_init(application):
-            await self.set_bot_commands(application)
+    def run(self):
+        """Start the bot: webhook if webhook_url is configured, else polling."""
+        if self.cfg.webhook_url:
+            self.run_webhook()
+        else:
+            self.run_polling()
 
-        app.post_init = post_init
-        logger.info(f"Starting {self.cfg.bot_name}…")
-        app.run_polling(drop_pending_updates=True)
+    def run_polling(self):
+        """Build Telegram Application, register handlers, and start polling."""
+        app = self._build_application()
+        logger.info("Starting %s (polling)…", self.cfg.bot_name)
+        app.run_polling(
+            drop_pending_updates=True,
+            timeout=self.cfg.polling_timeout,
+            poll_interval=0.0,
+            bootstrap_retries=-1,
+        )
+
+    def run_webhook(self):
+        """
+        Build Telegram Application and serve updates via webhook.
+
+        Listens on webhook_host:webhook_port (normally behind a TLS reverse
+        proxy) under a path derived from the bot token, and registers
+        <webhook_url>/<token> with Telegram.
+        """
+        app = self._build_application()
+        url_path = self.cfg.token
+        logger.info(
+            "Starting %s (webhook on %s:%s)…",
+            self.cfg.bot_name, self.cfg.webhook_host, self.cfg.webhook_port,
+        )
+        app.run_webhook(
+            listen=self.cfg.webhook_host,
+            port=self.cfg.webhook_port,
+            url_path=url_path,
+            webhook_url=f"{self.cfg.webhook_url.rstrip('/')}/{url_path}",
+            drop_pending_updates=True,
+            bootstrap_retries=-1,
+        )
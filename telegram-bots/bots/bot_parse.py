@@ -0,0 +1,171 @@
+"""
+PicoClaw Command Parsing
+────────────────────────
+Argument parsing and parameter validation shared by all bots.
+
+Kept free of Telegram and I/O imports so it can be compiled with mypyc:
+    make compile        # builds bot_parse.*.so next to this file
+
+When the extension is present Python imports it instead of this source;
+nothing else changes. Delete the .so to go back to the pure-Python module.
+"""
+
+import re
+from typing import Any
+
+
+# Schema pattern string → compiled regex, filled on first use
+_PATTERNS: dict[str, re.Pattern[str]] = {}
+
+
+def _compiled_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a schema pattern once; later calls are a dict hit."""
+    compiled = _PATTERNS.get(pattern)
+    if compiled is None:
+        compiled = _PATTERNS[pattern] = re.compile(pattern)
+    return compiled
+
+
+class ValidationError(Exception):
+    """Raised when command parameters fail validation."""
+    pass
+
+
+def parse_command_tokens(parts: list[str], command_schema: dict) -> dict:
+    """
+    Parse already-split command arguments into a params dict.
+
+    Supports three forms:
+        arg1 arg2            → positional, matched to schema key order
+        key1=val1 key2=val2  → named
+        arg1 key2=val2       → mixed
+
+    Returns:
+        dict of param_name → raw string value
+    """
+    schema_keys: list[str] = list(command_schema.keys())
+    n_keys: int = len(schema_keys)
+    result: dict[str, str] = {}
+    positional_idx: int = 0
+
+    for part in parts:
+        if "=" in part:
+            # Named param: key=value
+            key, _, value = part.partition("=")
+            result[key] = value
+        else:
+            # Positional: assign to next schema key in order
+            if positional_idx < n_keys:
+                result[schema_keys[positional_idx]] = part
+                positional_idx += 1
+            # Extra positional args beyond schema size are silently dropped
+
+    return result
+
+
+def parse_command_args(text: str, command_schema: dict) -> dict:
+    """Parse full command text (``/cmd arg1 key=val …``) into a params dict."""
+    return parse_command_tokens(text.split()[1:], command_schema)
+
+
+class ParamValidator:
+    """
+    Validates and coerces command parameters against config schema.
+
+    Supports:
+        - required / optional with defaults
+        - type coercion (string, integer)
+        - allowed-value lists
+        - regex pattern matching
+        - min/max bounds for integers
+        - rejection of unknown parameters
+    """
+
+    def validate(self, params: dict, schema: dict) -> dict:
+        """
+        Validate and coerce params against schema.
+
+        Returns:
+            dict of validated, coerced parameters.
+
+        Raises:
+            ValidationError with a user-friendly message on failure.
+        """
+        result: dict[str, Any] = {}
+        param_name: str
+        param_schema: dict
+
+        for param_name, param_schema in schema.items():
+            value: Any = params.get(param_name)
+            param_type: str = param_schema.get("type", "string")
+            required: bool = param_schema.get("required", False)
+            default: Any = param_schema.get("default")
+
+            # ── Missing value handling ──
+            if value is None or value == "":
+                if required:
+                    raise ValidationError(
+                        f"Missing required parameter: {param_name}"
+                    )
+                if default is not None:
+                    result[param_name] = default
+                continue
+
+            # ── Type: string ──
+            if param_type == "string":
+                value = str(value)
+
+                allowed = param_schema.get("allowed")
+                if allowed and value not in allowed:
+                    raise ValidationError(
+                        f"Invalid value for {param_name}: '{value}'. "
+                        f"Allowed: {', '.join(str(a) for a in allowed)}"
+                    )
+
+                pattern = param_schema.get("pattern")
+                if pattern and not _compiled_pattern(pattern).fullmatch(value):
+                    raise ValidationError(
+                        f"Invalid format for {param_name}: '{value}' "
+                        f"does not match pattern {pattern}"
+                    )
+
+            # ── Type: integer ──
+            elif param_type == "integer":
+                try:
+                    value = int(value)
+                except (ValueError, TypeError):
+                    raise ValidationError(
+                        f"Parameter {param_name} must be an integer, "
+                        f"got: '{value}'"
+                    )
+
+                min_val = param_schema.get("min")
+                max_val = param_schema.get("max")
+                if min_val is not None and value < min_val:
+                    raise ValidationError(
+                        f"Parameter {param_name} must be >= {min_val}, "
+                        f"got: {value}"
+                    )
+                if max_val is not None and value > max_val:
+                    raise ValidationError(
+                        f"Parameter {param_name} must be <= {max_val}, "
+                        f"got: {value}"
+                    )
+
+            else:
+                raise ValidationError(
+                    f"Unknown parameter type in schema: {param_type}"
+                )
+
+            result[param_name] = value
+
+        # ── Reject unknown parameters ──
+        # Subset test on the key views allocates nothing; the difference is
+        # only materialized for the error message.
+        if params and not params.keys() <= schema.keys():
+            unknown = params.keys() - schema.keys()
+            raise ValidationError(
+                f"Unknown parameters: {', '.join(sorted(unknown))}"
+            )
+
+        return result
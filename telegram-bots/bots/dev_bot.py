@@ -6,7 +6,7 @@ Handles development commands: run_tests, deploy, scaffold, git_status.
 
 Setup:
     export PICOCLAW_DEV_BOT_TOKEN=your_token_here
-    python dev_bot.py
+    python -m bots.dev_bot        # from telegram-bots/
 
 Commands:
     /run_tests <project> [suite=all|unit|integration]
@@ -16,159 +16,93 @@ Commands:
     /help
 """
 
-import sys
+import functools
 from pathlib import Path
 
 from telegram import Update
 from telegram.ext import CommandHandler, ContextTypes
 
-# Allow running from project root or bots/ directory
-sys.path.insert(0, str(Path(__file__).parent))
-from bot_base import BotBase
+from .bot_base import BotBase, authorized
 
 CONFIG_PATH = Path(__file__).parent.parent / "config" / "picoclaw.yaml"
 
+# Usage replies (plain text), built once at import
+USAGE_RUN_TESTS = (
+    "Usage: /run_tests <project> [suite=all|unit|integration]\n"
+    "Example: /run_tests glass-walls suite=integration"
+)
+USAGE_DEPLOY = (
+    "Usage: /deploy <project> [env=staging|production]\n"
+    "Example: /deploy glass-walls env=staging"
+)
+USAGE_SCAFFOLD = (
+    "Usage: /scaffold <project> <component>\n"
+    "Example: /scaffold glass-walls auth/email-validator"
+)
+USAGE_GIT_STATUS = (
+    "Usage: /git_status <project>\n"
+    "Example: /git_status glass-walls"
+)
+
+# command → usage reply + params that must be given before validation
+_COMMANDS = {
+    "run_tests": {"usage": USAGE_RUN_TESTS, "required": ("project",)},
+    "deploy": {"usage": USAGE_DEPLOY, "required": ("project",)},
+    "scaffold": {"usage": USAGE_SCAFFOLD, "required": ("project", "component")},
+    "git_status": {"usage": USAGE_GIT_STATUS, "required": ("project",)},
+}
+
 
 class DevBot(BotBase):
 
     def __init__(self):
         super().__init__(str(CONFIG_PATH), "dev_bot")
+        # Param schemas looked up once, not per update
+        self._param_specs = {
+            name: self.cfg.commands[name]["params"] for name in _COMMANDS
+        }
 
     def register_handlers(self, app):
         super().register_handlers(app)  # registers /help, /confirm, /cancel
-        app.add_handler(CommandHandler("run_tests", self.cmd_run_tests))
-        app.add_handler(CommandHandler("deploy", self.cmd_deploy))
-        app.add_handler(CommandHandler("scaffold", self.cmd_scaffold))
-        app.add_handler(CommandHandler("git_status", self.cmd_git_status))
-
-    # ──────────────────────────────────────────
-    # /run_tests <project> [suite=all|unit|integration]
-    # ──────────────────────────────────────────
-
-    async def cmd_run_tests(
-        self, update: Update, context: ContextTypes.DEFAULT_TYPE
-    ):
-        if not self._is_authorized(update):
-            await self._reject_unauthorized(update)
-            return
-
-        text = update.message.text
-        raw = self._parse_command_args(
-            text, self.cfg.commands["run_tests"]["params"]
-        )
-
-        project = raw.pop("project", None)
-        if not project:
-            await update.message.reply_text(
-                "Usage: `/run_tests <project> [suite=all|unit|integration]`\n"
-                "Example: `/run_tests glass-walls suite=integration`",
-                parse_mode="Markdown",
-            )
-            return
-
-        await self.execute_command(
-            update,
-            command_name="run_tests",
-            raw_params=raw,
-            project=project,
-        )
-
-    # ──────────────────────────────────────────
-    # /deploy <project> [env=staging|production]
-    # ──────────────────────────────────────────
-
-    async def cmd_deploy(
-        self, update: Update, context: ContextTypes.DEFAULT_TYPE
-    ):
-        if not self._is_authorized(update):
-            await self._reject_unauthorized(update)
-            return
-
-        text = update.message.text
-        raw = self._parse_command_args(
-            text, self.cfg.commands["deploy"]["params"]
-        )
-
-        project = raw.pop("project", None)
-        if not project:
-            await update.message.reply_text(
-                "Usage: `/deploy <project> [env=staging|production]`\n"
-                "Example: `/deploy glass-walls env=staging`",
-                parse_mode="Markdown",
-            )
-            return
-
-        await self.execute_command(
-            update,
-            command_name="deploy",
-            raw_params=raw,
-            project=project,
-        )
+        app.add_handlers([
+            CommandHandler(name, functools.partial(self._cmd, name=name))
+            for name in _COMMANDS
+        ])
 
     # ──────────────────────────────────────────
-    # /scaffold <project> <component>
+    # /run_tests, /deploy, /scaffold, /git_status
     # ──────────────────────────────────────────
 
-    async def cmd_scaffold(
-        self, update: Update, context: ContextTypes.DEFAULT_TYPE
+    @authorized
+    async def _cmd(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE, name: str
     ):
-        if not self._is_authorized(update):
-            await self._reject_unauthorized(update)
-            return
-
-        text = update.message.text
-        raw = self._parse_command_args(
-            text, self.cfg.commands["scaffold"]["params"]
-        )
-
-        project = raw.pop("project", None)
-        component = raw.get("component")
-
-        if not project or not component:
-            await update.message.reply_text(
-                "Usage: `/scaffold <project> <component>`\n"
-                "Example: `/scaffold glass-walls auth/email-validator`",
-                parse_mode="Markdown",
-            )
-            return
-
-        await self.execute_command(
-            update,
-            command_name="scaffold",
-            raw_params=raw,
-            project=project,
-        )
-
-    # ──────────────────────────────────────────
-    # /git_status <project>
-    # ──────────────────────────────────────────
-
-    async def cmd_git_status(
-        self, update: Update, context: ContextTypes.DEFAULT_TYPE
-    ):
-        if not self._is_authorized(update):
-            await self._reject_unauthorized(update)
-            return
-
-        text = update.message.text
-        raw = self._parse_command_args(
-            text, self.cfg.commands["git_status"]["params"]
-        )
-
-        project = raw.pop("project", None)
-        if not project:
-            await update.message.reply_text(
-                "Usage: `/git_status <project>`\n"
-                "Example: `/git_status glass-walls`",
-                parse_mode="Markdown",
-            )
+        """Shared handler: authorize → parse → usage check → execute."""
+        spec = _COMMANDS[name]
+        params_spec = self._param_specs[name]
+        raw = self._parse_command_args_from_tokens(context.args, params_spec)
+        if raw is None:
+            raw = self._parse_command_args(update.message.text, params_spec)
+
+        for field in spec["required"]:
+            if not raw.get(field):
+                await update.message.reply_text(spec["usage"])
+                return
+
+        project = raw["project"]
+        if self._projects and project not in self._projects:
+            await update.message.reply_text(f"❌ Unknown project: {project}")
             return
 
-        await self.execute_command(
-            update,
-            command_name="git_status",
-            raw_params={},
-            project=project,
+        # project stays in raw_params: it is part of every dev schema
+        self._spawn(
+            self.execute_command(
+                update,
+                command_name=name,
+                raw_params=raw,
+                project=project,
+            ),
+            update.effective_user.id,
         )
 
 
@@ -24,18 +24,31 @@ Design constraints:
     - Subprocess timeout enforcement
 """
 
+import atexit
+import functools
 import json
 import logging
+import math
 import os
+import pwd
+import queue
 import re
+import selectors
+import stat
 import subprocess
 import sys
+import threading
 import time
-from datetime import datetime, timezone
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
 
+# libyaml C emitter/parser when PyYAML was built with it (the default wheels
+# are); the pure-Python classes produce identical output, just slower.
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 try:
     from inotify_simple import INotify, flags as inotify_flags
     HAS_INOTIFY = True
@@ -46,6 +59,13 @@ except ImportError:
         "Run: pip install inotify-simple"
     )
 
+try:
+    from pystemd.dbuslib import DBus
+    from pystemd.systemd1 import Unit as SystemdUnit
+    HAS_PYSTEMD = True
+except ImportError:
+    HAS_PYSTEMD = False
+
 # Kanban integration
 from pkg.kanban.store import KanbanStore
 from pkg.kanban.events import KanbanEventBridge
@@ -72,6 +92,17 @@ AUDIT_LOG_PATH = Path(os.environ.get("PICOCLAW_AUDIT_LOG", "/var/log/picoclaw/au
 MAX_OUTPUT = 4096       # chars; truncate stdout/stderr in task file
 TASK_TIMEOUT = 300      # seconds; kill subprocess after this
 ALLOWED_SERVICES = ["nginx", "postgresql", "docker", "redis"]
+AUDIT_BATCH_MAX = 64          # entries per audit write() at most
+AUDIT_FLUSH_INTERVAL = 0.05   # seconds to gather a batch before writing
+RUNNING_WRITE_DELAY = 0.25    # tasks finishing sooner skip the "running" write
+WORKERS = int(os.environ.get("PICOCLAW_WORKERS", "8"))  # concurrent tasks
+# After the first inotify event, wait this long so a burst of writes is
+# drained with one read() instead of one wakeup per event
+INOTIFY_READ_DELAY_MS = int(os.environ.get("PICOCLAW_INOTIFY_DELAY_MS", "5"))
+# PICOCLAW_PIN=1: keep the executor on one CPU and run commands on the
+# others at lower priority, so watching/dispatch stays responsive under load
+PIN_CPUS = os.environ.get("PICOCLAW_PIN") == "1"
+CHILD_NICE = 5
 
 logging.basicConfig(
     level=logging.INFO,
@@ -86,14 +117,29 @@ logger = logging.getLogger("executor")
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 
+# Last formatted second — the several timestamps of one task reuse it
+_last_ts: tuple[int, str] = (0, "")
+
+
 def utc_now() -> str:
     """ISO-8601 UTC timestamp."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    global _last_ts
+    s = int(time.time())
+    if s != _last_ts[0]:
+        _last_ts = (s, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(s)))
+    return _last_ts[1]
+
+
+# Input validators, compiled once
+_PROJECT_RE = re.compile(r"[a-zA-Z0-9_-]+")
+_COMPONENT_RE = re.compile(r"[a-zA-Z0-9_/-]+")
+_PATH_RE = re.compile(r"/[a-zA-Z0-9/_.-]*")
+_NAME_RE = re.compile(r"[a-zA-Z0-9_-]+")
 
 
 def validate_project_name(name: str) -> bool:
     """Only alphanumeric, hyphens, underscores."""
-    return bool(name and re.fullmatch(r"[a-zA-Z0-9_-]+", name))
+    return bool(name and _PROJECT_RE.fullmatch(name))
 
 
 def validate_service_name(name: str, allowed: list[str]) -> bool:
@@ -101,18 +147,26 @@ def validate_service_name(name: str, allowed: list[str]) -> bool:
     return name in allowed
 
 
+@functools.lru_cache(maxsize=16)
+def _resolved_base(base: Path) -> tuple[str, str]:
+    """(realpath, realpath + separator) of a base dir; bases never move."""
+    real = os.path.realpath(base)
+    return real, os.path.join(real, "")
+
+
 def safe_path(base: Path, *parts: str) -> Path:
     """
     Resolve a path and assert it stays within base.
     Prevents path traversal attacks (../../etc/passwd).
     """
-    resolved = (base / Path(*parts)).resolve()
-    base_resolved = base.resolve()
-    if not str(resolved).startswith(str(base_resolved)):
+    base_real, base_prefix = _resolved_base(base)
+    resolved = os.path.realpath(os.path.join(base_real, *parts))
+    # Compare against base + separator so /projects2 is not inside /projects
+    if resolved != base_real and not resolved.startswith(base_prefix):
         raise ValueError(
             f"Path traversal detected: {parts} escapes {base}"
         )
-    return resolved
+    return Path(resolved)
 
 
 def truncate_output(text: str) -> str:
@@ -127,10 +181,123 @@ def truncate_output(text: str) -> str:
     )
 
 
+_child_cpus: set[int] | None = None  # set by pin_executor()
+
+
+def pin_executor():
+    """
+    Pin the executor to its lowest CPU; commands get the remaining ones.
+
+    Threads started afterwards (the worker pool) inherit the pinning;
+    command processes are moved off it by _deprioritize_child().
+    """
+    global _child_cpus
+    cpus = os.sched_getaffinity(0)
+    if len(cpus) < 2:
+        logger.info("PICOCLAW_PIN ignored: only one CPU available")
+        return
+    own = min(cpus)
+    _child_cpus = cpus - {own}
+    os.sched_setaffinity(0, {own})
+    logger.info("Executor pinned to CPU %d; commands use %s", own, sorted(_child_cpus))
+
+
+def _deprioritize_child(pid: int):
+    """Move a command process to the command CPUs at CHILD_NICE."""
+    if _child_cpus is None:
+        return
+    # Done from the parent after spawn: preexec_fn is unsafe with threads
+    try:
+        os.sched_setaffinity(pid, _child_cpus)
+        os.setpriority(os.PRIO_PROCESS, pid, CHILD_NICE)
+    except OSError:
+        pass  # already exited
+
+
+def _decode_bounded(data: bytes, dropped: int, limit: int) -> str:
+    """
+    Decode captured output, truncated (with marker) to at most limit chars.
+
+    Keeping the marker inside the limit means truncate_output() leaves the
+    result alone instead of truncating it a second time.
+    """
+    text = data.decode("utf-8", errors="replace")
+    if not dropped and len(text) <= limit:
+        return text
+    marker = f"\n…[truncated, {len(data) + dropped} bytes total]"
+    return text[:max(0, limit - len(marker))] + marker
+
+
+def run_bounded(
+    cmd: list[str],
+    *,
+    timeout: float,
+    cwd: str | None = None,
+    limit: int = MAX_OUTPUT,
+) -> subprocess.CompletedProcess:
+    """
+    subprocess.run(capture_output=True, text=True) with bounded memory.
+
+    Only the first ``limit`` chars of stdout/stderr are kept; the rest is
+    read and discarded as it arrives so a noisy command (a verbose test
+    suite) cannot balloon the executor. Raises subprocess.TimeoutExpired
+    after killing the process, like subprocess.run.
+    """
+    keep = limit * 4  # bytes; worst-case UTF-8 width
+    proc = subprocess.Popen(
+        cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    _deprioritize_child(proc.pid)
+    bufs = {proc.stdout: bytearray(), proc.stderr: bytearray()}
+    dropped = {proc.stdout: 0, proc.stderr: 0}
+    deadline = time.monotonic() + timeout
+
+    try:
+        with selectors.DefaultSelector() as sel:
+            for pipe in bufs:
+                sel.register(pipe, selectors.EVENT_READ)
+            while sel.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+                for key, _ in sel.select(remaining):
+                    chunk = os.read(key.fd, 65536)
+                    if not chunk:
+                        sel.unregister(key.fileobj)
+                        continue
+                    buf = bufs[key.fileobj]
+                    room = keep - len(buf)
+                    if room > 0:
+                        buf += chunk[:room]
+                    dropped[key.fileobj] += max(0, len(chunk) - max(room, 0))
+        returncode = proc.wait(max(0.0, deadline - time.monotonic()))
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout) from None
+    finally:
+        proc.stdout.close()
+        proc.stderr.close()
+
+    return subprocess.CompletedProcess(
+        cmd,
+        returncode,
+        _decode_bounded(bufs[proc.stdout], dropped[proc.stdout], limit),
+        _decode_bounded(bufs[proc.stderr], dropped[proc.stderr], limit),
+    )
+
+
 def audit_log(task_id: str, command: str, status: str, **extra):
-    """Append an audit entry from the executor side."""
+    """
+    Queue an audit entry from the executor side.
+
+    Entries are written by a background thread in batches (up to
+    AUDIT_BATCH_MAX lines or AUDIT_FLUSH_INTERVAL seconds) with a single
+    write() on a long-lived O_APPEND descriptor.
+    """
     entry = {
         "ts": utc_now(),
+        "ts_ns": time.time_ns(),
         "source": "executor",
         "task_id": task_id,
         "command": command,
@@ -140,12 +307,79 @@ def audit_log(task_id: str, command: str, status: str, **extra):
         if v is not None:
             entry[k] = v
 
-    try:
-        AUDIT_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with open(AUDIT_LOG_PATH, "a") as f:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
-    except Exception as e:
-        logger.error(f"Failed to write audit log: {e}")
+    _start_audit_writer()
+    _audit_queue.put(entry)
+
+
+_audit_queue: "queue.Queue[dict | None]" = queue.Queue()
+_audit_thread: threading.Thread | None = None
+_audit_thread_lock = threading.Lock()
+
+
+def _start_audit_writer():
+    """Start the audit writer thread on first use (or after a flush)."""
+    global _audit_thread
+    if _audit_thread is not None and _audit_thread.is_alive():
+        return
+    with _audit_thread_lock:
+        if _audit_thread is None or not _audit_thread.is_alive():
+            _audit_thread = threading.Thread(
+                target=_audit_writer, name="audit-writer", daemon=True
+            )
+            _audit_thread.start()
+
+
+def _audit_writer():
+    """Drain the audit queue in batches until a None sentinel arrives."""
+    fd = None
+    while True:
+        batch = [_audit_queue.get()]
+        deadline = time.monotonic() + AUDIT_FLUSH_INTERVAL
+        while len(batch) < AUDIT_BATCH_MAX and batch[-1] is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_audit_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        stop = batch[-1] is None
+        lines = [
+            json.dumps(e, ensure_ascii=False) for e in batch if e is not None
+        ]
+        if lines:
+            try:
+                if fd is None:
+                    AUDIT_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+                    # O_APPEND: each write() lands atomically at EOF, even
+                    # alongside the bots appending to the same file.
+                    # O_CLOEXEC: command subprocesses never inherit it.
+                    fd = os.open(
+                        AUDIT_LOG_PATH,
+                        os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC,
+                        0o644,
+                    )
+                os.write(fd, ("\n".join(lines) + "\n").encode("utf-8"))
+            except OSError as e:
+                logger.error(f"Failed to write audit log: {e}")
+
+        if stop:
+            if fd is not None:
+                os.close(fd)
+            return
+
+
+def flush_audit_log(timeout: float = 5.0):
+    """Write out every queued audit entry and stop the writer thread."""
+    thread = _audit_thread
+    if thread is None or not thread.is_alive():
+        return
+    _audit_queue.put(None)
+    thread.join(timeout)
+
+
+atexit.register(flush_audit_log)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -182,11 +416,9 @@ def run_tests(task: dict) -> tuple[int, str, str, str]:
     }
     args = suite_args.get(suite, [])
 
-    result = subprocess.run(
+    result = run_bounded(
         ["python", "-m", "pytest", "--tb=short", *args],
         cwd=str(project_dir),
-        capture_output=True,
-        text=True,
         timeout=TASK_TIMEOUT,
     )
 
@@ -216,10 +448,8 @@ def deploy(task: dict) -> tuple[int, str, str, str]:
             "Deploy script missing",
         )
 
-    result = subprocess.run(
+    result = run_bounded(
         [str(deploy_script), project, env],
-        capture_output=True,
-        text=True,
         timeout=TASK_TIMEOUT,
     )
 
@@ -238,7 +468,7 @@ def scaffold(task: dict) -> tuple[int, str, str, str]:
 
     if not validate_project_name(project):
         return (1, "", f"Invalid project name: {project}", "Validation failed")
-    if not component or not re.fullmatch(r"[a-zA-Z0-9_/-]+", component):
+    if not component or not _COMPONENT_RE.fullmatch(component):
         return (
             1, "",
             f"Invalid component name: {component}",
@@ -253,10 +483,8 @@ def scaffold(task: dict) -> tuple[int, str, str, str]:
             "Scaffold script missing",
         )
 
-    result = subprocess.run(
+    result = run_bounded(
         [str(scaffold_script), project, component],
-        capture_output=True,
-        text=True,
         timeout=TASK_TIMEOUT,
     )
 
@@ -282,11 +510,9 @@ def git_status(task: dict) -> tuple[int, str, str, str]:
             f"Project '{project}' not found",
         )
 
-    result = subprocess.run(
+    result = run_bounded(
         ["git", "status", "--short", "--branch"],
         cwd=str(project_dir),
-        capture_output=True,
-        text=True,
         timeout=30,
     )
 
@@ -294,36 +520,154 @@ def git_status(task: dict) -> tuple[int, str, str, str]:
     return (result.returncode, result.stdout, result.stderr, summary)
 
 
+def service_states(services: list[str]) -> dict[str, str]:
+    """
+    ActiveState of each systemd service ("active", "inactive", …).
+
+    With pystemd installed this is one D-Bus connection for all services;
+    otherwise a single ``systemctl is-active svc1 svc2 …`` call, which
+    prints one state per line in argument order.
+    """
+    if HAS_PYSTEMD:
+        try:
+            states = {}
+            with DBus() as bus:
+                for svc in services:
+                    unit = SystemdUnit(f"{svc}.service".encode(), bus=bus)
+                    unit.load()
+                    states[svc] = unit.Unit.ActiveState.decode()
+            return states
+        except Exception as e:
+            logger.debug("pystemd query failed, using systemctl: %s", e)
+
+    try:
+        r = subprocess.run(
+            ["systemctl", "is-active", *services],
+            capture_output=True, text=True, timeout=10,
+        )
+        lines = r.stdout.splitlines()
+    except (OSError, subprocess.TimeoutExpired):
+        lines = []
+    return {
+        svc: (lines[i].strip() if i < len(lines) else "") or "unknown"
+        for i, svc in enumerate(services)
+    }
+
+
+def _human(n: float) -> str:
+    """Bytes → df/du -h style size (1024-based, rounded up: 512K, 3.9G, 120G)."""
+    for unit in "BKMGT":
+        if n < 1024:
+            break
+        n /= 1024
+    else:
+        unit = "P"
+    if unit == "B":
+        return f"{int(n)}B"
+    if n < 10:
+        n = math.ceil(n * 10) / 10
+        if n < 10:
+            return f"{n:.1f}{unit}"
+    return f"{math.ceil(n)}{unit}"
+
+
+def _disk(path: str = "/") -> tuple[int, int, int, int]:
+    """(size, used, avail, use%) in bytes for the filesystem holding path, as df."""
+    st = os.statvfs(path)
+    size = st.f_blocks * st.f_frsize
+    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    avail = st.f_bavail * st.f_frsize
+    # df rounds the percentage up and ignores root-reserved blocks
+    pct = -(-used * 100 // (used + avail)) if used + avail else 0
+    return size, used, avail, pct
+
+
+def _mem(path: str = "/proc/meminfo") -> dict[str, int]:
+    """/proc/meminfo fields in bytes (MemTotal, MemAvailable, SwapFree, …)."""
+    info = {}
+    with open(path, "rb") as f:
+        for line in f:
+            key, _, rest = line.partition(b":")
+            fields = rest.split()
+            if fields:
+                info[key.decode()] = int(fields[0]) * 1024
+    return info
+
+
+def _load(path: str = "/proc/loadavg") -> tuple[float, float, float]:
+    """1, 5 and 15 minute load averages."""
+    with open(path, "rb") as f:
+        l1, l5, l15 = f.read().split()[:3]
+    return float(l1), float(l5), float(l15)
+
+
+def _cores() -> int:
+    """
+    CPUs this process may run on (what nproc prints), counted from before
+    pin_executor() narrowed the executor itself to one.
+    """
+    if _child_cpus is not None:
+        return len(_child_cpus) + 1
+    try:
+        return len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        return os.cpu_count() or 1
+
+
 def status(_task: dict) -> tuple[int, str, str, str]:
     """Aggregate system status: disk, memory, load, services."""
     lines = []
 
     # Disk usage
-    result = subprocess.run(
-        ["df", "-h", "/workspace", "/"],
-        capture_output=True, text=True,
-    )
     lines.append("=== Disk ===")
-    lines.append(result.stdout.strip())
+    lines.append(f"{'Mounted on':<12} {'Size':>6} {'Used':>6} {'Avail':>6} Use%")
+    for mount in ("/workspace", "/"):
+        try:
+            size, used, avail, pct = _disk(mount)
+        except OSError:
+            continue
+        lines.append(
+            f"{mount:<12} {_human(size):>6} {_human(used):>6} "
+            f"{_human(avail):>6} {pct:>3}%"
+        )
 
     # Memory
-    result = subprocess.run(["free", "-h"], capture_output=True, text=True)
     lines.append("\n=== Memory ===")
-    lines.append(result.stdout.strip())
+    try:
+        mem = _mem()
+        total, avail = mem["MemTotal"], mem.get("MemAvailable", mem["MemFree"])
+        swap_total = mem.get("SwapTotal", 0)
+        swap_used = swap_total - mem.get("SwapFree", 0)
+        lines.append(f"{'':<6} {'total':>6} {'used':>6} {'avail':>6}")
+        lines.append(
+            f"{'Mem:':<6} {_human(total):>6} {_human(total - avail):>6} "
+            f"{_human(avail):>6}"
+        )
+        lines.append(
+            f"{'Swap:':<6} {_human(swap_total):>6} {_human(swap_used):>6} "
+            f"{_human(swap_total - swap_used):>6}"
+        )
+    except (OSError, KeyError, ValueError):
+        lines.append("unable to read /proc/meminfo")
 
     # Load average
-    result = subprocess.run(["uptime"], capture_output=True, text=True)
     lines.append("\n=== Load ===")
-    lines.append(result.stdout.strip())
+    try:
+        with open("/proc/uptime", "rb") as f:
+            up = int(float(f.read().split()[0]))
+        days, rem = divmod(up, 86400)
+        hours, rem = divmod(rem, 3600)
+        l1, l5, l15 = _load()
+        lines.append(
+            f"up {days}d {hours}h {rem // 60}m, "
+            f"load average: {l1:.2f}, {l5:.2f}, {l15:.2f}"
+        )
+    except (OSError, ValueError):
+        lines.append("unable to read /proc/loadavg")
 
     # Key systemd services
     lines.append("\n=== Services ===")
-    for svc in ALLOWED_SERVICES:
-        r = subprocess.run(
-            ["systemctl", "is-active", svc],
-            capture_output=True, text=True,
-        )
-        state = r.stdout.strip() or "unknown"
+    for svc, state in service_states(ALLOWED_SERVICES).items():
         icon = "●" if state == "active" else "○"
         lines.append(f"  {icon} {svc}: {state}")
 
@@ -343,10 +687,8 @@ def restart_service(task: dict) -> tuple[int, str, str, str]:
             "Rejected: service not allowed",
         )
 
-    result = subprocess.run(
+    result = run_bounded(
         ["sudo", "/bin/systemctl", "restart", service],
-        capture_output=True,
-        text=True,
         timeout=60,
     )
 
@@ -357,13 +699,67 @@ def restart_service(task: dict) -> tuple[int, str, str, str]:
     return (result.returncode, result.stdout, result.stderr, summary)
 
 
+DU_TIMEOUT = 60  # seconds for a disk_usage walk
+
+
+def _du_blocks(st: os.stat_result, seen: set, lock: threading.Lock) -> int:
+    """
+    Allocated bytes for one entry, or 0 for a hard link to an inode that
+    was already counted (du counts each inode once).
+    """
+    if st.st_nlink > 1 and not stat.S_ISDIR(st.st_mode):
+        key = (st.st_dev, st.st_ino)
+        with lock:
+            if key in seen:
+                return 0
+            seen.add(key)
+    return st.st_blocks * 512
+
+
+def _du_tree(path: str, deadline: float, seen: set, lock: threading.Lock) -> int:
+    """
+    Allocated bytes under path (st_blocks, like du), not following links.
+
+    `seen` holds the hard-linked inodes already counted, shared (under
+    `lock`) with the other walkers of the same disk_usage call.
+    """
+    total = 0
+    stack = [path]
+    while stack:
+        if time.monotonic() > deadline:
+            raise subprocess.TimeoutExpired(["du", path], DU_TIMEOUT)
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue  # unreadable directory: du warns and skips it too
+        with entries:
+            for entry in entries:
+                try:
+                    total += _du_blocks(
+                        entry.stat(follow_symlinks=False), seen, lock
+                    )
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                except OSError:
+                    continue
+    return total
+
+
 def disk_usage(task: dict) -> tuple[int, str, str, str]:
-    """Show disk usage for a path."""
+    """
+    Show disk usage for a path and each of its top-level entries.
+
+    Walks the tree in-process (os.scandir, one thread per top-level
+    subdirectory) instead of forking du. Output matches
+    ``du -h --max-depth=1``: size, tab, path per subdirectory, total last.
+    Hard-linked files count once, as in du; with the parallel walk, which
+    subdirectory a shared inode is charged to is not fixed, the total is.
+    """
     params = task.get("params", {})
     path = params.get("path", "/workspace")
 
     # Validate path: must start with / and contain only safe chars
-    if not re.fullmatch(r"/[a-zA-Z0-9/_.-]*", path):
+    if not _PATH_RE.fullmatch(path):
         return (1, "", f"Invalid path: {path}", "Validation failed")
 
     # Additional check: resolve and ensure no traversal
@@ -371,45 +767,131 @@ def disk_usage(task: dict) -> tuple[int, str, str, str]:
     if not resolved.exists():
         return (1, "", f"Path does not exist: {path}", "Path not found")
 
-    result = subprocess.run(
-        ["du", "-sh", "--max-depth=1", str(resolved)],
-        capture_output=True,
-        text=True,
-        timeout=60,
-    )
+    root = str(resolved)
+    deadline = time.monotonic() + DU_TIMEOUT
+    root_st = os.stat(root)
+    if not resolved.is_dir():
+        return (
+            0, f"{_human(root_st.st_blocks * 512)}\t{root}", "",
+            f"Disk usage for {path}",
+        )
+
+    sizes: dict[str, int] = {}
+    subdirs: list[str] = []
+    seen: set = set()  # (st_dev, st_ino) of hard-linked files counted so far
+    lock = threading.Lock()
+    with os.scandir(root) as entries:
+        for entry in entries:
+            try:
+                sizes[entry.path] = _du_blocks(
+                    entry.stat(follow_symlinks=False), seen, lock
+                )
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+            except OSError:
+                continue
+
+    if subdirs:
+        with ThreadPoolExecutor(
+            max_workers=min(8, len(subdirs)), thread_name_prefix="du"
+        ) as pool:
+            futures = {
+                d: pool.submit(_du_tree, d, deadline, seen, lock)
+                for d in subdirs
+            }
+            try:
+                for d, future in futures.items():
+                    sizes[d] += future.result()
+            except subprocess.TimeoutExpired:
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+
+    total = root_st.st_blocks * 512 + sum(sizes.values())
+    lines = [f"{_human(sizes[d])}\t{d}" for d in sorted(subdirs)]
+    lines.append(f"{_human(total)}\t{root}")
 
     summary = f"Disk usage for {path}"
-    return (result.returncode, result.stdout, result.stderr, summary)
+    return (0, "\n".join(lines), "", summary)
+
+
+@functools.lru_cache(maxsize=64)
+def _username(uid: int) -> str:
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
 
 
 def process_info(task: dict) -> tuple[int, str, str, str]:
-    """Show info about running processes matching a name."""
+    """
+    Show info about running processes matching a name.
+
+    Walks /proc instead of forking ``ps aux``: each process's short
+    ``comm`` name is checked first, then its full cmdline (comm is cut to
+    15 chars and is just "python3" for scripts); only matches have their
+    status read. Columns follow ps aux (a subset of them).
+    """
     params = task.get("params", {})
     name = params.get("name")
 
-    if not name or not re.fullmatch(r"[a-zA-Z0-9_-]+", name):
+    if not name or not _NAME_RE.fullmatch(name):
         return (1, "", f"Invalid process name: {name}", "Validation failed")
 
-    result = subprocess.run(
-        ["ps", "aux"],
-        capture_output=True,
-        text=True,
-        timeout=10,
-    )
-
-    all_lines = result.stdout.splitlines()
-    header = all_lines[0] if all_lines else ""
-    # Filter for matching process lines, excluding the grep/ps itself
-    matches = [
-        line for line in all_lines[1:]
-        if name.lower() in line.lower()
-        and "ps aux" not in line
-    ]
+    needle = name.lower().encode()
+    try:
+        mem_total = _mem().get("MemTotal", 0)
+    except (OSError, ValueError):
+        mem_total = 0
+
+    matches = []
+    with os.scandir("/proc") as entries:
+        for entry in entries:
+            pid = entry.name
+            if not pid.isdigit():
+                continue
+            try:
+                with open(f"/proc/{pid}/comm", "rb") as f:
+                    comm = f.read().rstrip(b"\n")
+                with open(f"/proc/{pid}/cmdline", "rb") as f:
+                    cmdline = f.read()
+                if needle not in comm.lower() and needle not in (
+                    cmdline.replace(b"\0", b" ").lower()
+                ):
+                    continue
+                with open(f"/proc/{pid}/status", "rb") as f:
+                    status_lines = f.read().splitlines()
+            except OSError:
+                continue  # exited while we were looking
+
+            fields = {}
+            for line in status_lines:
+                key, _, value = line.partition(b":")
+                fields[key] = value.split()
+            rss = int(fields.get(b"VmRSS", [0])[0])
+            vsz = int(fields.get(b"VmSize", [0])[0])
+            uid = int(fields.get(b"Uid", [0])[0])
+            state = fields.get(b"State", [b"?"])[0].decode()
+            pmem = rss * 1024 * 100 / mem_total if mem_total else 0.0
+            command = (
+                b" ".join(cmdline.replace(b"\0", b" ").split())
+                .decode(errors="replace")
+                or f"[{comm.decode(errors='replace')}]"
+            )
+            matches.append((
+                int(pid),
+                f"{_username(uid):<10} {pid:>7} {pmem:>4.1f} {vsz:>8} "
+                f"{rss:>7} {state:<4} {command}",
+            ))
 
     if not matches:
         output = f"No processes found matching '{name}'"
     else:
-        output = header + "\n" + "\n".join(matches)
+        header = (
+            f"{'USER':<10} {'PID':>7} {'%MEM':>4} {'VSZ':>8} "
+            f"{'RSS':>7} {'STAT':<4} COMMAND"
+        )
+        matches.sort()
+        output = header + "\n" + "\n".join(line for _, line in matches)
 
     summary = f"Process info for '{name}' ({len(matches)} matches)"
     return (0, output, "", summary)
@@ -421,55 +903,34 @@ def health(_task: dict) -> tuple[int, str, str, str]:
     all_ok = True
 
     # ── Disk space ──
-    result = subprocess.run(
-        ["df", "-h", "/"], capture_output=True, text=True
-    )
-    for line in result.stdout.strip().splitlines()[1:]:
-        parts = line.split()
-        if len(parts) >= 6:
-            try:
-                usage_pct = int(parts[4].rstrip("%"))
-            except ValueError:
-                continue
-            disk_ok = usage_pct < 90
-            if not disk_ok:
-                all_ok = False
-            icon = "✅" if disk_ok else "🔴"
-            checks.append(
-                f"{icon} Disk ({parts[5]}): {parts[4]} used"
-            )
+    try:
+        _, _, _, usage_pct = _disk("/")
+        disk_ok = usage_pct < 90
+        if not disk_ok:
+            all_ok = False
+        icon = "✅" if disk_ok else "🔴"
+        checks.append(f"{icon} Disk (/): {usage_pct}% used")
+    except OSError:
+        checks.append("⚠️ Disk: unable to stat /")
 
     # ── Memory ──
-    result = subprocess.run(
-        ["free", "-m"], capture_output=True, text=True
-    )
-    for line in result.stdout.strip().splitlines():
-        if line.startswith("Mem:"):
-            parts = line.split()
-            if len(parts) >= 3:
-                total = int(parts[1])
-                used = int(parts[2])
-                pct = (used / total * 100) if total > 0 else 0
-                mem_ok = pct < 90
-                if not mem_ok:
-                    all_ok = False
-                icon = "✅" if mem_ok else "🔴"
-                checks.append(
-                    f"{icon} Memory: {pct:.0f}% ({used}M / {total}M)"
-                )
-
-    # ── Load average ──
     try:
-        result = subprocess.run(
-            ["nproc"], capture_output=True, text=True
-        )
-        cores = int(result.stdout.strip()) if result.stdout.strip().isdigit() else 1
-    except Exception:
-        cores = 1
+        mem = _mem()
+        total = mem["MemTotal"] // 1048576
+        used = (mem["MemTotal"] - mem.get("MemAvailable", mem["MemFree"])) // 1048576
+        pct = (used / total * 100) if total > 0 else 0
+        mem_ok = pct < 90
+        if not mem_ok:
+            all_ok = False
+        icon = "✅" if mem_ok else "🔴"
+        checks.append(f"{icon} Memory: {pct:.0f}% ({used}M / {total}M)")
+    except (OSError, KeyError, ValueError):
+        checks.append("⚠️ Memory: unable to read /proc/meminfo")
 
+    # ── Load average ──
+    cores = _cores()
     try:
-        with open("/proc/loadavg") as f:
-            load1 = float(f.read().split()[0])
+        load1 = _load()[0]
         load_ok = load1 < cores * 2
         if not load_ok:
             all_ok = False
@@ -479,12 +940,7 @@ def health(_task: dict) -> tuple[int, str, str, str]:
         checks.append("⚠️ Load: unable to read /proc/loadavg")
 
     # ── Key services ──
-    for svc in ALLOWED_SERVICES:
-        r = subprocess.run(
-            ["systemctl", "is-active", svc],
-            capture_output=True, text=True,
-        )
-        state = r.stdout.strip()
+    for svc, state in service_states(ALLOWED_SERVICES).items():
         svc_ok = state == "active"
         # Warn but don't fail overall for missing optional services
         icon = "✅" if svc_ok else "⚠️"
@@ -495,6 +951,27 @@ def health(_task: dict) -> tuple[int, str, str, str]:
     return (0, output, "", "Health check complete")
 
 
+def _tail(path: str | Path, n: int, chunk: int = 8192) -> list[str]:
+    """Last n lines of a file, read backwards from EOF in chunks."""
+    if n <= 0:
+        return []
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        pos = os.lseek(fd, 0, os.SEEK_END)
+        data = b""
+        # n lines need n+1 newlines in view (one is the file's trailing one)
+        while pos > 0 and data.count(b"\n") <= n:
+            step = min(chunk, pos)
+            pos -= step
+            data = os.pread(fd, step, pos) + data
+    finally:
+        os.close(fd)
+    return [
+        line.decode("utf-8", errors="replace")
+        for line in data.strip().splitlines()[-n:]
+    ]
+
+
 def recent(task: dict) -> tuple[int, str, str, str]:
     """Read recent entries from the audit log."""
     params = task.get("params", {})
@@ -504,8 +981,7 @@ def recent(task: dict) -> tuple[int, str, str, str]:
         return (0, "No audit log found.", "", "No activity")
 
     try:
-        lines = AUDIT_LOG_PATH.read_text().strip().splitlines()
-        entries = lines[-limit:]
+        entries = _tail(AUDIT_LOG_PATH, int(limit))
         output = "\n".join(entries)
         return (0, output, "", f"Last {len(entries)} audit entries")
     except Exception as e:
@@ -532,6 +1008,19 @@ COMMAND_TABLE: dict[str, callable] = {
     "recent": recent,
 }
 
+# Commands that finish in well under a second. They skip the interim
+# "running" file write and audit entry; the task goes straight from
+# pending to its final state.
+FAST_COMMANDS = frozenset({
+    "git_status",
+    "status",
+    "restart_service",
+    "disk_usage",
+    "process_info",
+    "health",
+    "recent",
+})
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Kanban integration
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -539,12 +1028,17 @@ COMMAND_TABLE: dict[str, callable] = {
 # Initialize Kanban bridge (lazy; created on first import)
 kanban_store: KanbanStore | None = None
 kanban_bridge: KanbanEventBridge | None = None
+_kanban_lock = threading.Lock()
 
 
 def get_kanban_bridge() -> KanbanEventBridge | None:
     """Lazy-initialize and return Kanban bridge."""
     global kanban_store, kanban_bridge
-    if kanban_bridge is None:
+    if kanban_bridge is not None:
+        return kanban_bridge
+    with _kanban_lock:
+        if kanban_bridge is not None:
+            return kanban_bridge
         try:
             db_path = os.environ.get("PICOCLAW_DB", "/var/lib/picoclaw/kanban.db")
             kanban_store = KanbanStore(db_path)
@@ -555,28 +1049,195 @@ def get_kanban_bridge() -> KanbanEventBridge | None:
     return kanban_bridge
 
 
+# Bridge calls are SQLite writes; they are queued and applied in order by one
+# writer thread so task latency never waits on kanban.db.
+_kanban_queue: "queue.Queue[tuple[str, str, dict] | None]" = queue.Queue()
+_kanban_thread: threading.Thread | None = None
+_kanban_thread_lock = threading.Lock()
+
+
+def emit_kanban(method: str, card_id: str, **kwargs):
+    """Queue ``bridge.<method>(card_id, **kwargs)`` for the Kanban writer."""
+    global _kanban_thread
+    if _kanban_thread is None or not _kanban_thread.is_alive():
+        with _kanban_thread_lock:
+            if _kanban_thread is None or not _kanban_thread.is_alive():
+                _kanban_thread = threading.Thread(
+                    target=_kanban_writer, name="kanban-writer", daemon=True
+                )
+                _kanban_thread.start()
+    _kanban_queue.put((method, card_id, kwargs))
+
+
+def _kanban_writer():
+    """Apply queued bridge calls in order until a None sentinel arrives."""
+    while True:
+        item = _kanban_queue.get()
+        if item is None:
+            return
+        bridge = get_kanban_bridge()
+        if bridge is None:
+            continue
+        method, card_id, kwargs = item
+        try:
+            getattr(bridge, method)(card_id, **kwargs)
+        except Exception as e:
+            logger.error("Kanban %s failed for %s: %s", method, card_id, e)
+
+
+def flush_kanban_events(timeout: float = 5.0):
+    """Apply every queued Kanban event and stop the writer thread."""
+    thread = _kanban_thread
+    if thread is None or not thread.is_alive():
+        return
+    _kanban_queue.put(None)
+    thread.join(timeout)
+
+
+atexit.register(flush_kanban_events)
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Task processing
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 
 def load_task(task_file: Path) -> dict | None:
-    """Load a task dict from YAML. Returns None on error."""
+    """
+    Load a task dict from a task file. Returns None on error.
+
+    Bots write pending tasks as JSON (a YAML subset); results written back
+    here are YAML. JSON gets the fast parser, everything else goes to YAML.
+    """
     try:
-        with open(task_file) as f:
-            return yaml.safe_load(f)
+        with open(task_file, "rb") as f:
+            data = f.read()
+        if data[:1] == b"{":
+            try:
+                return json.loads(data)
+            except ValueError:
+                pass
+        return yaml.load(data, Loader=_YamlLoader)
     except Exception as e:
         logger.error(f"Failed to load task {task_file}: {e}")
         return None
 
 
+# ── Result emitter ──
+# Task results are a flat mapping of strings/numbers plus the small params
+# dict, so they are emitted directly instead of through PyYAML's generic
+# representer. Anything outside that shape returns None and goes to
+# yaml.dump. Strings are always double-quoted, which needs escapes only
+# for backslash, quote and characters YAML won't take raw.
+_YAML_ESCAPES = {
+    c: f"\\x{c:02x}" for c in (*range(0x20), *range(0x7F, 0xA0))
+}
+_YAML_ESCAPES.update({
+    0x00: "\\0", 0x09: "\\t", 0x0A: "\\n", 0x0D: "\\r",
+    0x22: '\\"', 0x5C: "\\\\",
+    0x85: "\\N", 0x2028: "\\L", 0x2029: "\\P", 0xFEFF: "\\ufeff",
+})
+# Lone surrogates and U+FFFE/FFFF can't be written as UTF-8 YAML at all
+_YAML_UNSAFE_RE = re.compile("[\ud800-\udfff\ufffe\uffff]")
+_YAML_KEY_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+# YAML 1.1 words that would load back as booleans/null if used as keys
+_YAML_RESERVED = frozenset({
+    "y", "yes", "n", "no", "true", "false", "on", "off", "null",
+})
+
+
+def _yaml_scalar(value) -> str | None:
+    """One YAML scalar, or None if the value needs the generic dumper."""
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        text = repr(value)
+        # PyYAML only reads floats back with a '.' and no exponent
+        if "." in text and "e" not in text and "n" not in text:
+            return text
+        return None
+    if isinstance(value, str):
+        if _YAML_UNSAFE_RE.search(value):
+            return None
+        return '"' + value.translate(_YAML_ESCAPES) + '"'
+    return None
+
+
+def _yaml_key(key) -> bool:
+    return (
+        isinstance(key, str)
+        and _YAML_KEY_RE.fullmatch(key) is not None
+        and key.lower() not in _YAML_RESERVED
+    )
+
+
+def _emit_task_yaml(task: dict) -> bytes | None:
+    """
+    Emit a task dict as block YAML, or None if it has a shape this
+    emitter doesn't handle (deeper nesting, odd keys, other types).
+    """
+    out = []
+    for key, value in task.items():
+        if not _yaml_key(key):
+            return None
+        if isinstance(value, dict):
+            if not value:
+                out.append(f"{key}: {{}}")
+                continue
+            out.append(f"{key}:")
+            for sub_key, sub_value in value.items():
+                text = _yaml_scalar(sub_value)
+                if text is None or not _yaml_key(sub_key):
+                    return None
+                out.append(f"  {sub_key}: {text}")
+        elif isinstance(value, list):
+            if not value:
+                out.append(f"{key}: []")
+                continue
+            out.append(f"{key}:")
+            for item in value:
+                text = _yaml_scalar(item)
+                if text is None:
+                    return None
+                out.append(f"- {text}")
+        else:
+            text = _yaml_scalar(value)
+            if text is None:
+                return None
+            out.append(f"{key}: {text}")
+    out.append("")
+    return "\n".join(out).encode("utf-8")
+
+
 def write_result(task_file: Path, task: dict):
-    """Write updated task dict back to the task file (atomic)."""
+    """
+    Write updated task dict back to the task file (atomic).
+
+    The YAML is rendered to bytes first (by _emit_task_yaml for the usual
+    flat result, yaml.dump otherwise) and written with one os.write()
+    to ``<task_file>.tmp``, which os.replace() then swaps into place.
+    """
     try:
-        tmp_file = task_file.with_suffix(".yaml.tmp")
-        with open(tmp_file, "w") as f:
-            yaml.dump(task, f, default_flow_style=False, sort_keys=False)
-        tmp_file.rename(task_file)
+        path = os.fspath(task_file)
+        tmp_path = path + ".tmp"
+        data = _emit_task_yaml(task)
+        if data is None:
+            data = yaml.dump(
+                task, Dumper=_YamlDumper, encoding="utf-8",
+                default_flow_style=False, sort_keys=False,
+            )
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
     except Exception as e:
         logger.error(f"Failed to write result to {task_file}: {e}")
 
@@ -586,7 +1247,8 @@ def process_task(task_file: Path):
     Process a single task file through the full lifecycle:
         1. Load and validate
         2. Check command is in dispatch table
-        3. Mark as running
+        3. Mark as running (on disk only if still running after
+           RUNNING_WRITE_DELAY — fast commands get a single write)
         4. Execute command handler
         5. Write result (complete/failed/timeout/rejected)
         6. Audit log every state transition
@@ -595,16 +1257,17 @@ def process_task(task_file: Path):
     if task is None:
         return
 
-    task_id = task.get("id", "unknown")
-    command = task.get("command")
-    current_status = task.get("status")
+    _get = task.get
+    task_id = _get("id", "unknown")
+    command = _get("command")
+    current_status = _get("status")
 
     # Only process pending tasks
     if current_status != "pending":
-        logger.debug(f"Skipping {task_file.name}: status={current_status}")
+        logger.debug("Skipping %s: status=%s", task_file.name, current_status)
         return
 
-    logger.info(f"Processing task {task_id}: command={command}")
+    logger.info("Processing task %s: command=%s", task_id, command)
 
     # ── Validate command exists in dispatch table ──
     handler = COMMAND_TABLE.get(command)
@@ -616,115 +1279,135 @@ def process_task(task_file: Path):
         write_result(task_file, task)
         audit_log(task_id, command or "UNKNOWN", "rejected",
                   reason="unknown_command")
-        logger.warning(f"Rejected unknown command: {command}")
+        logger.warning("Rejected unknown command: %s", command)
         return
 
     # ── Mark as running ──
+    # FAST_COMMANDS never get an interim write. For the rest the write is
+    # deferred: if the handler returns within RUNNING_WRITE_DELAY the timer
+    # is cancelled and the task goes pending → final state in one write.
     task["status"] = "running"
     task["started_at"] = utc_now()
-    write_result(task_file, task)
-    audit_log(task_id, command, "running")
-    
+
+    write_lock = threading.Lock()
+    finished = False
+    running_timer = None
+    if command not in FAST_COMMANDS:
+        audit_log(task_id, command, "running")
+        running_snapshot = dict(task)
+
+        def _write_running():
+            with write_lock:
+                if not finished:
+                    write_result(task_file, running_snapshot)
+
+        running_timer = threading.Timer(RUNNING_WRITE_DELAY, _write_running)
+        running_timer.daemon = True
+        running_timer.start()
+
     # ── Emit Kanban started event ──
-    card_id = task.get("card_id")
+    card_id = _get("card_id")
     if card_id:
-        bridge = get_kanban_bridge()
-        if bridge:
-            bridge.on_task_started(card_id, executor="executor")
+        emit_kanban("on_task_started", card_id, executor="executor")
 
     # ── Execute ──
     start_time = time.monotonic()
     try:
         exit_code, stdout, stderr, summary = handler(task)
-        duration = time.monotonic() - start_time
-
-        task["status"] = "complete" if exit_code == 0 else "failed"
-        task["exit_code"] = exit_code
-        task["stdout"] = truncate_output(stdout)
-        task["stderr"] = truncate_output(stderr)
-        task["summary"] = summary
-        task["duration_s"] = round(duration, 2)
-        task["completed_at"] = utc_now()
+        status = "complete" if exit_code == 0 else "failed"
+        stdout = truncate_output(stdout)
+        stderr = truncate_output(stderr)
 
     except subprocess.TimeoutExpired:
-        duration = time.monotonic() - start_time
-        task["status"] = "timeout"
-        task["exit_code"] = -1
-        task["stdout"] = ""
-        task["stderr"] = f"Command timed out after {TASK_TIMEOUT}s"
-        task["summary"] = f"Command timed out after {TASK_TIMEOUT}s"
-        task["duration_s"] = round(duration, 2)
-        task["completed_at"] = utc_now()
-        logger.error(f"Task {task_id} timed out after {TASK_TIMEOUT}s")
+        status, exit_code, stdout = "timeout", -1, ""
+        stderr = summary = f"Command timed out after {TASK_TIMEOUT}s"
+        logger.error("Task %s timed out after %ss", task_id, TASK_TIMEOUT)
 
     except ValueError as e:
         # Path traversal or validation error
-        duration = time.monotonic() - start_time
-        task["status"] = "failed"
-        task["exit_code"] = 1
-        task["stdout"] = ""
-        task["stderr"] = str(e)
-        task["summary"] = f"Security violation: {type(e).__name__}"
-        task["duration_s"] = round(duration, 2)
-        task["completed_at"] = utc_now()
-        logger.error(f"Task {task_id} security violation: {e}")
+        status, exit_code, stdout, stderr = "failed", 1, "", str(e)
+        summary = f"Security violation: {type(e).__name__}"
+        logger.error("Task %s security violation: %s", task_id, e)
 
     except Exception as e:
-        duration = time.monotonic() - start_time
-        task["status"] = "failed"
-        task["exit_code"] = -1
-        task["stdout"] = ""
-        task["stderr"] = str(e)
-        task["summary"] = f"Executor error: {type(e).__name__}"
-        task["duration_s"] = round(duration, 2)
-        task["completed_at"] = utc_now()
+        status, exit_code, stdout, stderr = "failed", -1, "", str(e)
+        summary = f"Executor error: {type(e).__name__}"
         logger.error(
-            f"Task {task_id} failed with exception: {e}", exc_info=True
+            "Task %s failed with exception: %s", task_id, e, exc_info=True
         )
 
-    write_result(task_file, task)
+    duration_s = round(time.monotonic() - start_time, 2)
+    task.update(
+        status=status,
+        exit_code=exit_code,
+        stdout=stdout,
+        stderr=stderr,
+        summary=summary,
+        duration_s=duration_s,
+        completed_at=utc_now(),
+    )
+
+    if running_timer is not None:
+        running_timer.cancel()
+    with write_lock:
+        finished = True
+        write_result(task_file, task)
     audit_log(
-        task_id, command, task["status"],
-        exit_code=task.get("exit_code"),
-        duration_s=task.get("duration_s"),
-        summary=task.get("summary"),
+        task_id, command, status,
+        exit_code=exit_code,
+        duration_s=duration_s,
+        summary=summary,
     )
-    
+
     # ── Emit Kanban events ──
-    card_id = task.get("card_id")
     if card_id:
-        bridge = get_kanban_bridge()
-        if bridge:
-            final_status = task["status"]
-            if final_status == "running":
-                bridge.on_task_started(card_id, executor="executor")
-            elif final_status == "complete":
-                bridge.on_task_completed(
-                    card_id, 
-                    result=task.get("summary", ""),
-                    log_url=""
-                )
-            elif final_status in ("failed", "timeout"):
-                error_msg = task.get("stderr", task.get("summary", "Unknown error"))
-                bridge.on_task_failed(
-                    card_id,
-                    error=error_msg,
-                    log_url=""
-                )
-            elif final_status == "rejected":
-                bridge.on_task_failed(
-                    card_id,
-                    error="Command rejected",
-                    log_url=""
-                )
-    
+        if status == "complete":
+            emit_kanban(
+                "on_task_completed", card_id, result=summary, log_url=""
+            )
+        elif status in ("failed", "timeout"):
+            emit_kanban("on_task_failed", card_id, error=stderr, log_url="")
+
     logger.info(
-        f"Task {task_id} completed: status={task['status']}, "
-        f"exit_code={task.get('exit_code')}, "
-        f"duration={task.get('duration_s')}s"
+        "Task %s completed: status=%s, exit_code=%s, duration=%ss",
+        task_id, status, exit_code, duration_s,
     )
 
 
+# Tasks run on a worker pool so a long command (a 300s test suite) does not
+# hold up cheap ones queued behind it. Workers mostly wait on subprocesses.
+EXECUTOR = ThreadPoolExecutor(
+    max_workers=WORKERS, thread_name_prefix="picoclaw-task"
+)
+_inflight: set[str] = set()
+_inflight_lock = threading.Lock()
+
+
+def submit_task(task_file: Path) -> Future | None:
+    """
+    Queue a task file on the worker pool.
+
+    Returns None if the same file is already queued or running (inotify can
+    report one task more than once, e.g. CLOSE_WRITE followed by MOVED_TO).
+    """
+    key = str(task_file)
+    with _inflight_lock:
+        if key in _inflight:
+            return None
+        _inflight.add(key)
+
+    def _run():
+        try:
+            process_task(task_file)
+        except Exception as e:
+            logger.error(f"Error processing task {task_file}: {e}")
+        finally:
+            with _inflight_lock:
+                _inflight.discard(key)
+
+    return EXECUTOR.submit(_run)
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # File watchers
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -737,17 +1420,47 @@ def _process_existing_tasks():
             try:
                 task = load_task(task_file)
                 if task and task.get("status") == "pending":
-                    process_task(task_file)
+                    submit_task(task_file)
             except Exception as e:
                 logger.error(f"Error processing existing task {task_file}: {e}")
 
 
+class RecentPaths:
+    """
+    Per-path TTL filter for watcher events.
+
+    One atomic task write can be reported more than once (CLOSE_WRITE on a
+    direct write, MOVED_TO on the rename, then our own result writes).
+    Repeats within ``ttl`` seconds are dropped before any load/parse.
+    """
+
+    def __init__(self, ttl: float = 0.5, evict_after: float = 5.0):
+        self.ttl = ttl
+        self.evict_after = evict_after
+        self._seen: dict[str, float] = {}
+        self._last_evict = time.monotonic()
+
+    def seen(self, key: str) -> bool:
+        """Record key; True if it was already recorded within ttl."""
+        now = time.monotonic()
+        last = self._seen.get(key)
+        if last is not None and now - last < self.ttl:
+            return True
+        self._seen[key] = now
+        if now - self._last_evict > self.evict_after:
+            cutoff = now - self.evict_after
+            self._seen = {k: t for k, t in self._seen.items() if t > cutoff}
+            self._last_evict = now
+        return False
+
+
 def run_inotify():
     """
     Watch task directories using inotify (efficient, event-driven).
 
     Uses CLOSE_WRITE | MOVED_TO to catch both direct writes and
-    atomic rename operations.
+    atomic rename operations. Each read() coalesces events arriving within
+    INOTIFY_READ_DELAY_MS, so bursts cost one syscall rather than many.
     """
     inotify = INotify()
     wd_to_dir: dict[int, Path] = {}
@@ -765,40 +1478,69 @@ def run_inotify():
     _process_existing_tasks()
     logger.info("Executor ready — waiting for tasks…")
 
+    recent_events = RecentPaths()
     while True:
-        events = inotify.read()
-        for event in events:
-            # event.name may be str or bytes depending on library version
-            name = event.name
-            if isinstance(name, bytes):
-                name = name.decode("utf-8", errors="replace")
-
-            if not name or not name.endswith(".yaml"):
-                continue
-            # Skip temp files from atomic writes
-            if name.endswith(".yaml.tmp"):
+        events = inotify.read(read_delay=INOTIFY_READ_DELAY_MS)
+        # Drain the whole read first, then dispatch each distinct task once
+        for task_file in _event_task_files(events, wd_to_dir):
+            if recent_events.seen(str(task_file)):
                 continue
+            if task_file.exists():
+                submit_task(task_file)
 
-            watch_dir = wd_to_dir.get(event.wd)
-            if not watch_dir:
-                continue
 
-            task_file = watch_dir / name
-            if task_file.exists():
-                try:
-                    process_task(task_file)
-                except Exception as e:
-                    logger.error(
-                        f"Error processing task {task_file}: {e}"
-                    )
+def _event_task_files(events, wd_to_dir: dict[int, Path]) -> list[Path]:
+    """Distinct task files named by a batch of inotify events, in order."""
+    batch: dict[tuple[int, str], Path] = {}
+    for event in events:
+        # event.name may be str or bytes depending on library version
+        name = event.name
+        if isinstance(name, bytes):
+            name = name.decode("utf-8", errors="replace")
+
+        # Only task files; this also skips .yaml.tmp from atomic writes
+        if not name or not name.endswith(".yaml"):
+            continue
+
+        key = (event.wd, name)
+        if key in batch:
+            continue
+        watch_dir = wd_to_dir.get(event.wd)
+        if watch_dir:
+            batch[key] = watch_dir / name
+    return list(batch.values())
+
+
+# Directory mtimes this recent are rescanned even if unchanged: a file
+# created in the same clock tick as our last scan leaves mtime as it was.
+_MTIME_SLACK_NS = 2_000_000_000
+
+
+def _dir_changed(watch_dir: Path, dir_mtimes: dict[Path, int]) -> bool:
+    """True if watch_dir's entries may have changed since the last call."""
+    try:
+        mtime = os.stat(watch_dir).st_mtime_ns
+    except OSError:
+        return False
+    if (
+        dir_mtimes.get(watch_dir) == mtime
+        and time.time_ns() - mtime > _MTIME_SLACK_NS
+    ):
+        return False
+    dir_mtimes[watch_dir] = mtime
+    return True
 
 
 def run_polling(interval: float = 1.0):
     """
     Fallback: poll task directories for new .yaml files.
     Used when inotify_simple is not installed.
+
+    Each pass is one stat() per directory; a directory is only listed when
+    its mtime moved (new files and renames into it both update it).
     """
     seen: set[str] = set()
+    dir_mtimes: dict[Path, int] = {}
 
     for watch_dir in WATCH_DIRS:
         watch_dir.mkdir(parents=True, exist_ok=True)
@@ -806,12 +1548,13 @@ def run_polling(interval: float = 1.0):
 
     # Track existing files and process pending ones
     for watch_dir in WATCH_DIRS:
+        _dir_changed(watch_dir, dir_mtimes)
         for task_file in sorted(watch_dir.glob("*.yaml")):
             seen.add(str(task_file))
             try:
                 task = load_task(task_file)
                 if task and task.get("status") == "pending":
-                    process_task(task_file)
+                    submit_task(task_file)
             except Exception as e:
                 logger.error(
                     f"Error processing existing task {task_file}: {e}"
@@ -822,16 +1565,16 @@ def run_polling(interval: float = 1.0):
     while True:
         time.sleep(interval)
         for watch_dir in WATCH_DIRS:
-            for task_file in sorted(watch_dir.glob("*.yaml")):
-                path_str = str(task_file)
-                if path_str not in seen:
-                    seen.add(path_str)
-                    try:
-                        process_task(task_file)
-                    except Exception as e:
-                        logger.error(
-                            f"Error processing task {task_file}: {e}"
-                        )
+            if not _dir_changed(watch_dir, dir_mtimes):
+                continue
+            with os.scandir(watch_dir) as entries:
+                new_files = sorted(
+                    e.path for e in entries
+                    if e.name.endswith(".yaml") and e.path not in seen
+                )
+            for path_str in new_files:
+                seen.add(path_str)
+                submit_task(Path(path_str))
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -841,6 +1584,9 @@ def run_polling(interval: float = 1.0):
 if __name__ == "__main__":
     logger.info("PicoClaw Executor starting…")
 
+    if PIN_CPUS:
+        pin_executor()
+
     # Ensure watch directories exist
     for d in WATCH_DIRS:
         d.mkdir(parents=True, exist_ok=True)
@@ -854,6 +1600,12 @@ if __name__ == "__main__":
             "audit logging from executor may fail"
         )
 
+    if not getattr(yaml, "__with_libyaml__", False):
+        logger.warning(
+            "PyYAML is running without libyaml; task files will be "
+            "parsed and written with the slower pure-Python codec"
+        )
+
     if HAS_INOTIFY:
         logger.info("Using inotify for file watching (recommended)")
         run_inotify()
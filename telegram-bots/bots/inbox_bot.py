@@ -26,12 +26,14 @@ Usage examples (from Telegram):
     /board
 """
 
+import heapq
 import json
 import logging
 import os
 import re
 import sqlite3
 import sys
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -48,8 +50,7 @@ from telegram.ext import (
 
 sys.path.insert(0, str(Path(__file__).parent))
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from bot_base import BotBase, utc_now, make_task_id
-from pkg.kanban.store import KanbanStore
+from bot_base import BotBase, authorized, utc_now, make_task_id
 from pkg.kanban.telegram_bridge import TelegramKanbanBridge
 from pkg.kanban.schema import TaskMode
 
@@ -64,16 +65,42 @@ DB_PATH        = Path(os.environ.get("PICOCLAW_DB", "/var/lib/picoclaw/kanban.db
 # Conversation state for /save flow
 AWAITING_CONTENT = 1
 
-# ── Lazy KanbanStore singleton ───────────────────────────────────────────────
-
-_STORE: Optional[KanbanStore] = None
-
-
-def _get_store() -> KanbanStore:
-    global _STORE
-    if _STORE is None:
-        _STORE = KanbanStore(str(DB_PATH))
-    return _STORE
+# Inbox files are created new, never overwritten
+_CREATE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_CLOEXEC
+
+# Patterns used on every message, compiled once
+_SAFE_NAME_RE = re.compile(r"[^\w\-_. ]")
+_WS_RE        = re.compile(r"\s+")
+_PROJECT_RE   = re.compile(r"[a-zA-Z0-9_-]+")
+_PRIORITY_RE  = re.compile(r"\bpriority=(high|medium|low|normal)\b", re.I)
+
+# ── Shared sqlite connection (mode + board queries) ──────────────────────────
+
+_CONN: Optional[sqlite3.Connection] = None
+# Handlers may run on executor threads; one statement/transaction at a time
+_CONN_LOCK = threading.RLock()
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Open the kanban DB once and keep it (and SQLite's page cache) warm."""
+    global _CONN
+    if _CONN is None:
+        with _CONN_LOCK:
+            if _CONN is None:
+                # No schema setup: BotBase's KanbanStore (same PICOCLAW_DB
+                # path) creates the tables and indexes at bot startup.
+                # Autocommit: every statement here is a single read or UPSERT,
+                # so skip the implicit BEGIN/COMMIT pair around writes
+                conn = sqlite3.connect(
+                    str(DB_PATH), check_same_thread=False, isolation_level=None
+                )
+                conn.row_factory = sqlite3.Row
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA cache_size=-20000")
+                conn.execute("PRAGMA busy_timeout=30000")
+                _CONN = conn
+    return _CONN
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
@@ -85,8 +112,10 @@ def detect_extension(content: str, hint: str = "") -> str:
     if hint and "." in hint:
         return ""  # filename already has extension
 
+    stripped = content.strip()
+
     # Check for shebang
-    first_line = content.strip().split("\n")[0]
+    first_line = stripped.partition("\n")[0]
     if "python" in first_line or "#!/usr/bin/env py" in first_line:
         return ".py"
     if "bash" in first_line or "sh" in first_line:
@@ -95,14 +124,17 @@ def detect_extension(content: str, hint: str = "") -> str:
         return ".js"
 
     # Check content patterns
-    stripped = content.strip()
-    if stripped.startswith("<!DOCTYPE") or stripped.startswith("<html"):
+    if stripped.startswith(("<!DOCTYPE", "<html")):
         return ".html"
-    if stripped.startswith("{") or stripped.startswith("["):
+    head, tail = stripped[:1], stripped[-1:]
+    if head and head in "{[" and tail and tail in "}]":
+        # Bracketed is good enough for big pastes; only parse small ones
+        if len(stripped) >= 4096:
+            return ".json"
         try:
             json.loads(stripped)
             return ".json"
-        except Exception:
+        except ValueError:
             pass
     if "def " in content and "import " in content:
         return ".py"
@@ -118,8 +150,8 @@ def detect_extension(content: str, hint: str = "") -> str:
 
 def sanitize_filename(name: str) -> str:
     """Strip anything that could cause path issues."""
-    name = re.sub(r"[^\w\-_. ]", "", name).strip()
-    name = re.sub(r"\s+", "_", name)
+    name = _SAFE_NAME_RE.sub("", name).strip()
+    name = _WS_RE.sub("_", name)
     return name[:80] or "untitled"
 
 
@@ -146,28 +178,38 @@ def save_to_inbox(content: str, project: Optional[str],
 
     dest_dir.mkdir(parents=True, exist_ok=True)
 
-    # Don't overwrite — add suffix if conflict
+    # Don't overwrite — add suffix if conflict. O_EXCL makes the existence
+    # check and the create one atomic step.
     dest = dest_dir / filename
-    if dest.exists():
-        stem = Path(filename).stem
-        suffix = Path(filename).suffix
+    try:
+        fd = os.open(dest, _CREATE_FLAGS, 0o644)
+    except FileExistsError:
+        stem, suffix = os.path.splitext(filename)
         dest = dest_dir / f"{stem}-{ts}{suffix}"
-
-    dest.write_text(content, encoding="utf-8")
+        n = 1
+        while True:
+            try:
+                fd = os.open(dest, _CREATE_FLAGS, 0o644)
+                break
+            except FileExistsError:
+                n += 1
+                dest = dest_dir / f"{stem}-{ts}-{n}{suffix}"
+
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(content)
     return dest
 
 
-def create_kanban_card(title: str, project: Optional[str],
+def create_kanban_card(bridge: TelegramKanbanBridge,
+                       title: str, project: Optional[str],
                        user_id: str, priority: str = "normal",
                        source: str = "telegram",
                        tags: list = None) -> Optional[str]:
     """
-    Create a card via TelegramKanbanBridge (single DB path,
+    Create a card via the bot's TelegramKanbanBridge (single DB path,
     persistent card IDs, state_history flushed to TABLE).
     """
     try:
-        store = _get_store()
-        bridge = TelegramKanbanBridge(store)
         card = bridge.create_card_from_telegram(
             title=title,
             telegram_message_id="",
@@ -185,72 +227,66 @@ def create_kanban_card(title: str, project: Optional[str],
 
 def get_mode() -> str:
     try:
-        db_path = str(DB_PATH)
-        with sqlite3.connect(db_path) as conn:
+        conn = _get_conn()
+        with _CONN_LOCK:
             cur = conn.execute("SELECT value FROM system_state WHERE key='mode' LIMIT 1")
             row = cur.fetchone()
-            return row[0] if row else "local"
+        return row["value"] if row else "local"
     except Exception:
         return "local"
 
 
 def set_mode(mode: str) -> bool:
     try:
-        DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-        db_path = str(DB_PATH)
+        conn = _get_conn()
         now = utc_now()
-        with sqlite3.connect(db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS system_state (
-                    key TEXT PRIMARY KEY,
-                    value TEXT,
-                    updated_at TEXT
-                )
-            """)
+        with _CONN_LOCK:
             conn.execute("""
                 INSERT INTO system_state (key, value, updated_at)
                 VALUES (?, ?, ?)
                 ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=excluded.updated_at
             """, ("mode", mode, now))
-            conn.commit()
         return True
     except Exception as e:
         logging.getLogger(__name__).error(f"set_mode failed: {e}")
         return False
 
 
+_BOARD_STATES = ("inbox", "planned", "running", "blocked", "review", "done")
+# One pass over idx_kanban_state_created: one row holding a count per state
+# (in _BOARD_STATES order), then the newest running card's title
+_BOARD_SQL = (
+    "SELECT "
+    + ", ".join(
+        f"COUNT(CASE WHEN state='{state}' THEN 1 END)" for state in _BOARD_STATES
+    )
+    + ", (SELECT title FROM kanban_cards WHERE state='running'"
+    " ORDER BY created_at DESC LIMIT 1)"
+    " FROM kanban_cards WHERE state IN ("
+    + ", ".join(f"'{state}'" for state in _BOARD_STATES)
+    + ")"
+)
+
+
 def get_board_summary(limit: int = 12) -> str:
     """Return a Telegram-formatted board summary."""
     try:
-        db_path = str(DB_PATH)
-        with sqlite3.connect(db_path) as conn:
-            rows = conn.execute("""
-                SELECT state, COUNT(*) as cnt FROM kanban_cards WHERE state != 'archived'
-                GROUP BY state
-            """).fetchall()
-
-            counts = {"inbox": 0, "planned": 0, "running": 0, "blocked": 0, "review": 0, "done": 0}
-            for state, cnt in rows:
-                if state in counts:
-                    counts[state] = cnt
-
-            # Get current running card
-            active_row = conn.execute("""
-                SELECT card_id, title FROM kanban_cards WHERE state='running' ORDER BY created_at DESC LIMIT 1
-            """).fetchone()
-            active = active_row[1] if active_row else None
+        conn = _get_conn()
+        with _CONN_LOCK:
+            row = conn.execute(_BOARD_SQL).fetchone()
+        inbox, planned, running, blocked, review, done, active = row
 
         mode = get_mode()
         mode_icon = "🏠" if mode == "local" else "🔒"
 
         lines = [
             f"📋 *Kanban Board* {mode_icon} `{mode}`\n",
-            f"📥 Inbox: {counts['inbox']}  "
-            f"📐 Planned: {counts['planned']}  "
-            f"⚡ Running: {counts['running']}",
-            f"🚧 Blocked: {counts['blocked']}  "
-            f"👁 Review: {counts['review']}  "
-            f"✅ Done: {counts['done']}",
+            f"📥 Inbox: {inbox}  "
+            f"📐 Planned: {planned}  "
+            f"⚡ Running: {running}",
+            f"🚧 Blocked: {blocked}  "
+            f"👁 Review: {review}  "
+            f"✅ Done: {done}",
         ]
 
         if active:
@@ -262,25 +298,43 @@ def get_board_summary(limit: int = 12) -> str:
         return f"❌ Board unavailable: {e}"
 
 
+def _walk_files(top: str):
+    """Yield (stat_result, path) for every regular file under top."""
+    try:
+        entries = os.scandir(top)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _walk_files(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry.stat(follow_symlinks=False), entry.path
+            except OSError:
+                continue
+
+
 def get_recent_inbox(limit: int = 8) -> str:
     """Return Telegram-formatted list of recent inbox files."""
     inbox = INBOX_DIR
     if not inbox.exists():
         return "📂 Inbox is empty."
 
-    files = sorted(inbox.rglob("*"), key=lambda f: f.stat().st_mtime, reverse=True)
-    files = [f for f in files if f.is_file()][:limit]
+    # One stat per file; only the newest `limit` are ever kept
+    files = heapq.nlargest(limit, _walk_files(str(inbox)), key=lambda t: t[0].st_mtime)
 
     if not files:
         return "📂 Inbox is empty."
 
-    lines = ["📂 *Recent inbox files:*\n"]
-    for f in files:
-        rel = f.relative_to(inbox)
-        mtime = datetime.fromtimestamp(f.stat().st_mtime).strftime("%m/%d %H:%M")
-        size = f.stat().st_size
+    lines = [None] * (len(files) + 1)
+    lines[0] = "📂 *Recent inbox files:*\n"
+    for i, (st, path) in enumerate(files, 1):
+        rel = os.path.relpath(path, inbox)
+        mtime = datetime.fromtimestamp(st.st_mtime).strftime("%m/%d %H:%M")
+        size = st.st_size
         size_str = f"{size}B" if size < 1024 else f"{size//1024}KB"
-        lines.append(f"`{rel}` — {size_str} @ {mtime}")
+        lines[i] = f"`{rel}` — {size_str} @ {mtime}"
 
     return "\n".join(lines)
 
@@ -297,6 +351,11 @@ class InboxBot(BotBase):
         super().__init__(str(CONFIG_PATH), "inbox_bot")
         self._save_context: dict = {}  # user_id → {project, filename}
 
+    async def _reject_unauthorized(self, update: Update):
+        """Log and reply as BotBase does; END also closes a /save conversation."""
+        await super()._reject_unauthorized(update)
+        return ConversationHandler.END
+
     def register_handlers(self, app: Application):
         super().register_handlers(app)
 
@@ -319,12 +378,9 @@ class InboxBot(BotBase):
 
     # ── /save ────────────────────────────────────────────────────────────────
 
+    @authorized
     async def cmd_save_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Step 1: parse args, wait for content to be pasted."""
-        if not self._is_authorized(update):
-            await update.message.reply_text("❌ Unauthorized")
-            return ConversationHandler.END
-
         text = update.message.text.strip()
         parts = text.split(None, 3)
 
@@ -341,7 +397,7 @@ class InboxBot(BotBase):
             return ConversationHandler.END
 
         # Validate project name
-        if not re.fullmatch(r"[a-zA-Z0-9_-]+", project):
+        if not _PROJECT_RE.fullmatch(project):
             await update.message.reply_text(
                 f"❌ Project name must be alphanumeric (got: `{project}`)",
                 parse_mode="Markdown",
@@ -364,12 +420,9 @@ class InboxBot(BotBase):
         )
         return AWAITING_CONTENT
 
+    @authorized
     async def cmd_save_content(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Step 2: receive pasted content and save it."""
-        if not self._is_authorized(update):
-            await update.message.reply_text("❌ Unauthorized")
-            return ConversationHandler.END
-
         user_id = update.effective_user.id
         ctx = self._save_context.pop(user_id, None)
         if not ctx:
@@ -390,10 +443,15 @@ class InboxBot(BotBase):
         """Actually write the file and report back."""
         user = update.effective_user
         try:
-            dest = save_to_inbox(content, project, filename)
+            # File write + SQLite insert run off the event loop
+            dest = await self._run_blocking(
+                save_to_inbox, content, project, filename
+            )
             
             # Also create a Kanban card
-            card_id = create_kanban_card(
+            card_id = await self._run_blocking(
+                create_kanban_card,
+                self.kanban_bridge,
                 title=f"Saved: {dest.name}",
                 project=project,
                 user_id=str(user.id),
@@ -415,6 +473,7 @@ class InboxBot(BotBase):
 
     # ── /task ────────────────────────────────────────────────────────────────
 
+    @authorized
     async def cmd_task(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """
         /task <project> <title>  [priority=high|medium|low]
@@ -423,10 +482,6 @@ class InboxBot(BotBase):
             /task glass-walls add email validation to signup form
             /task glass-walls fix CORS on staging priority=high
         """
-        if not self._is_authorized(update):
-            await update.message.reply_text("❌ Unauthorized")
-            return
-
         text = update.message.text.strip()
         parts = text.split(None, 2)
 
@@ -442,7 +497,7 @@ class InboxBot(BotBase):
 
         # Extract priority if present
         priority = "normal"
-        priority_match = re.search(r"\bpriority=(high|medium|low|normal)\b", remainder, re.I)
+        priority_match = _PRIORITY_RE.search(remainder)
         if priority_match:
             priority = priority_match.group(1).lower()
             remainder = remainder[:priority_match.start()] + remainder[priority_match.end():]
@@ -457,7 +512,9 @@ class InboxBot(BotBase):
             return
 
         user = update.effective_user
-        card_id = create_kanban_card(
+        card_id = await self._run_blocking(
+            create_kanban_card,
+            self.kanban_bridge,
             title=title,
             project=project,
             user_id=str(user.id),
@@ -478,20 +535,17 @@ class InboxBot(BotBase):
 
     # ── /mode ────────────────────────────────────────────────────────────────
 
+    @authorized
     async def cmd_mode(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """
         /mode               — show current mode
         /mode local         — switch to local mode
         /mode remote        — switch to remote mode
         """
-        if not self._is_authorized(update):
-            await update.message.reply_text("❌ Unauthorized")
-            return
-
         text  = update.message.text.strip()
         parts = text.split()
 
-        current = get_mode()
+        current = await self._run_blocking(get_mode)
 
         if len(parts) == 1:
             mode_icon = "🏠" if current == "local" else "🔒"
@@ -519,7 +573,7 @@ class InboxBot(BotBase):
             )
             return
 
-        ok = set_mode(new_mode)
+        ok = await self._run_blocking(set_mode, new_mode)
         user = update.effective_user
 
         if ok:
@@ -535,24 +589,18 @@ class InboxBot(BotBase):
 
     # ── /board ───────────────────────────────────────────────────────────────
 
+    @authorized
     async def cmd_board(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show Kanban board summary in Telegram."""
-        if not self._is_authorized(update):
-            await update.message.reply_text("❌ Unauthorized")
-            return
-
-        summary = get_board_summary()
+        summary = await self._run_blocking(get_board_summary)
         await update.message.reply_text(summary, parse_mode="Markdown")
 
     # ── /inbox ───────────────────────────────────────────────────────────────
 
+    @authorized
     async def cmd_inbox(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """List recent files saved to /workspace/inbox."""
-        if not self._is_authorized(update):
-            await update.message.reply_text("❌ Unauthorized")
-            return
-
-        listing = get_recent_inbox()
+        listing = await self._run_blocking(get_recent_inbox)
         await update.message.reply_text(listing, parse_mode="Markdown")
 
 
@@ -23,23 +23,70 @@ import asyncio
 import json
 import logging
 import sys
+import time
 from pathlib import Path
 from datetime import datetime, timezone
 
 from telegram import Update
 from telegram.ext import Application, CommandHandler, ContextTypes
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    from watchfiles import awatch
+    HAS_WATCHFILES = True
+except ImportError:
+    HAS_WATCHFILES = False
+
 sys.path.insert(0, str(Path(__file__).parent))
-from bot_base import BotBase, truncate
+from bot_base import BotBase, authorized, truncate
 
 CONFIG_PATH = Path(__file__).parent.parent / "config" / "picoclaw.yaml"
 
 logger = logging.getLogger(__name__)
 
 # How often to check for new audit events to push as notifications (seconds)
+# when watchfiles is not installed
 PUSH_POLL_INTERVAL = 5
+# With watchfiles: re-check this often anyway, for filesystems (NFS) where
+# inotify events may never arrive
+PUSH_HEARTBEAT_INTERVAL = 30
 # Notify on these statuses proactively
-NOTIFY_STATUSES = {"failed", "timeout"}
+NOTIFY_STATUSES = frozenset({"failed", "timeout"})
+# Raw-bytes prefilter: a line without one of these can't be an alert
+_NOTIFY_NEEDLES = tuple(f'"{status}"'.encode() for status in NOTIFY_STATUSES)
+# /recent: audit status → icon
+_STATUS_ICONS = {
+    "complete": "✅",
+    "failed": "❌",
+    "timeout": "⏰",
+    "submitted": "📤",
+    "confirmed": "✔️",
+    "cancelled": "🚫",
+    "rejected": "⛔",
+    "streaming": "📋",
+    "running": "⏳",
+}
+
+
+def _tail_lines(path: Path, n: int, chunk: int = 8192) -> list[bytes]:
+    """Last n lines of a file, read backwards from EOF in chunks."""
+    if n <= 0:
+        return []
+    with open(path, "rb") as f:
+        pos = f.seek(0, 2)
+        buf = b""
+        # n lines need n+1 newlines in view (one is the file's trailing one)
+        while pos > 0 and buf.count(b"\n") <= n:
+            step = min(chunk, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+    return buf.strip().splitlines()[-n:]
 
 
 class MonitorBot(BotBase):
@@ -62,13 +109,10 @@ class MonitorBot(BotBase):
     # /health — system health summary
     # ──────────────────────────────────────────
 
+    @authorized
     async def cmd_health(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
-        if not self._is_authorized(update):
-            await self._reject_unauthorized(update)
-            return
-
         await self.execute_command(
             update, command_name="health", raw_params={}
         )
@@ -77,13 +121,10 @@ class MonitorBot(BotBase):
     # /recent [n=10] — recent audit log entries
     # ──────────────────────────────────────────
 
+    @authorized
     async def cmd_recent(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
-        if not self._is_authorized(update):
-            await self._reject_unauthorized(update)
-            return
-
         text = update.message.text
         raw = self._parse_command_args(
             text, self.cfg.commands["recent"]["params"]
@@ -98,14 +139,16 @@ class MonitorBot(BotBase):
             return
 
         limit = params.get("limit", 10)
-        entries = self._read_recent_audit(limit)
+        entries = await self._run_blocking(self._read_recent_audit, limit)
 
         if not entries:
             await update.message.reply_text("📋 No recent activity found.")
             return
 
-        lines = ["*Recent Activity*\n"]
-        for entry in entries:
+        # Sized up front: one slot per entry plus the header
+        lines = [None] * (len(entries) + 1)
+        lines[0] = "*Recent Activity*\n"
+        for i, entry in enumerate(entries, 1):
             ts = entry.get("ts", "?")
             user = entry.get("username", entry.get("user_id", "?"))
             cmd = entry.get("command", "?")
@@ -113,41 +156,34 @@ class MonitorBot(BotBase):
             bot = entry.get("bot", "?")
             task_id = entry.get("task_id", "")
 
-            icon = {
-                "complete": "✅",
-                "failed": "❌",
-                "timeout": "⏰",
-                "submitted": "📤",
-                "confirmed": "✔️",
-                "cancelled": "🚫",
-                "rejected": "⛔",
-                "streaming": "📋",
-                "running": "⏳",
-            }.get(status, "❓")
-
-            # Show time portion only (HH:MM:SS)
-            time_str = ts[-9:-1] if len(ts) > 9 else ts
-            lines.append(
-                f"{icon} `{time_str}` {bot}/{cmd} → {status} ({user})"
-            )
+            icon = _STATUS_ICONS.get(status, "❓")
+
+            # Show time portion only (HH:MM:SS); older entries lack ts_ns
+            ts_ns = entry.get("ts_ns")
+            if isinstance(ts_ns, int):
+                time_str = time.strftime(
+                    "%H:%M:%S", time.gmtime(ts_ns // 1_000_000_000)
+                )
+            else:
+                time_str = ts[-9:-1] if len(ts) > 9 else ts
+            lines[i] = f"{icon} `{time_str}` {bot}/{cmd} → {status} ({user})"
 
         await update.message.reply_text(
             "\n".join(lines), parse_mode="Markdown"
         )
 
     def _read_recent_audit(self, limit: int) -> list[dict]:
-        """Read last N entries from the audit log."""
+        """Read last N entries from the audit log (tail-seek, not a full read)."""
         audit_path = self.cfg.audit_log
         if not audit_path.exists():
             return []
 
         try:
-            lines = audit_path.read_text().strip().splitlines()
             entries = []
-            for line in lines[-limit:]:
+            for line in _tail_lines(audit_path, limit):
                 try:
-                    entries.append(json.loads(line))
-                except json.JSONDecodeError:
+                    entries.append(_json_loads(line))
+                except ValueError:
                     continue  # skip malformed entries
             return entries
         except Exception:
@@ -157,17 +193,15 @@ class MonitorBot(BotBase):
     # /alerts_on / /alerts_off — push notifications
     # ──────────────────────────────────────────
 
+    @authorized
     async def cmd_alerts_on(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
-        if not self._is_authorized(update):
-            await self._reject_unauthorized(update)
-            return
-
         chat_id = update.effective_chat.id
         self._notification_chat_ids.add(chat_id)
 
-        self.audit.log(
+        await self._run_blocking(
+            self.audit.log,
             user_id=update.effective_user.id,
             username=update.effective_user.username or "",
             bot=self.cfg.bot_name,
@@ -181,17 +215,15 @@ class MonitorBot(BotBase):
             "Send /alerts_off to disable."
         )
 
+    @authorized
     async def cmd_alerts_off(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
-        if not self._is_authorized(update):
-            await self._reject_unauthorized(update)
-            return
-
         chat_id = update.effective_chat.id
         self._notification_chat_ids.discard(chat_id)
 
-        self.audit.log(
+        await self._run_blocking(
+            self.audit.log,
             user_id=update.effective_user.id,
             username=update.effective_user.username or "",
             bot=self.cfg.bot_name,
@@ -206,9 +238,38 @@ class MonitorBot(BotBase):
     # Background push notification loop
     # ──────────────────────────────────────────
 
+    async def _audit_changes(self, audit_path: Path):
+        """
+        Yield each time the audit log may have grown.
+
+        With watchfiles: on inotify events for the log (plus a heartbeat
+        every PUSH_HEARTBEAT_INTERVAL). Otherwise every PUSH_POLL_INTERVAL.
+        """
+        if HAS_WATCHFILES:
+            target = str(audit_path)
+            try:
+                async for _ in awatch(
+                    audit_path.parent,
+                    watch_filter=lambda _change, path: path == target,
+                    debounce=50,
+                    step=50,
+                    rust_timeout=PUSH_HEARTBEAT_INTERVAL * 1000,
+                    yield_on_timeout=True,
+                ):
+                    yield
+            except Exception as e:
+                logger.warning(
+                    "Watching %s failed (%s); polling every %ss",
+                    audit_path.parent, e, PUSH_POLL_INTERVAL,
+                )
+
+        while True:
+            await asyncio.sleep(PUSH_POLL_INTERVAL)
+            yield
+
     async def _push_notification_loop(self, app: Application):
         """
-        Polls the audit log for new failure/timeout entries and
+        Watches the audit log for new failure/timeout entries and
         pushes them to subscribed chats.
 
         Uses file seek position to only read new entries (no re-reading).
@@ -220,9 +281,7 @@ class MonitorBot(BotBase):
         if audit_path.exists():
             self._last_audit_pos = audit_path.stat().st_size
 
-        while True:
-            await asyncio.sleep(PUSH_POLL_INTERVAL)
-
+        async for _ in self._audit_changes(audit_path):
             if not audit_path.exists() or not self._notification_chat_ids:
                 continue
 
@@ -236,7 +295,7 @@ class MonitorBot(BotBase):
                 if current_size <= self._last_audit_pos:
                     continue
 
-                with open(audit_path) as f:
+                with open(audit_path, "rb") as f:
                     f.seek(self._last_audit_pos)
                     new_data = f.read()
                     self._last_audit_pos = f.tell()
@@ -245,13 +304,13 @@ class MonitorBot(BotBase):
                 logger.debug(f"Push notification read error: {e}")
                 continue
 
-            if not new_data.strip():
-                continue
-
-            for line in new_data.strip().splitlines():
+            for line in new_data.splitlines():
+                # Most entries are routine; skip them without a JSON parse
+                if not any(needle in line for needle in _NOTIFY_NEEDLES):
+                    continue
                 try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError:
+                    entry = _json_loads(line)
+                except ValueError:
                     continue
 
                 status = entry.get("status", "")
@@ -282,36 +341,33 @@ class MonitorBot(BotBase):
 
                 msg = "\n".join(msg_parts)
 
-                for chat_id in list(self._notification_chat_ids):
-                    try:
-                        await app.bot.send_message(
+                # Fan out to all subscribers at once: 1 RTT, not N
+                chat_ids = list(self._notification_chat_ids)
+                results = await asyncio.gather(
+                    *(
+                        app.bot.send_message(
                             chat_id, msg, parse_mode="Markdown"
                         )
-                    except Exception as e:
+                        for chat_id in chat_ids
+                    ),
+                    return_exceptions=True,
+                )
+                for chat_id, result in zip(chat_ids, results):
+                    if isinstance(result, Exception):
                         logger.error(
-                            f"Failed to send alert to {chat_id}: {e}"
+                            f"Failed to send alert to {chat_id}: {result}"
                         )
 
     # ──────────────────────────────────────────
     # Lifecycle override
     # ──────────────────────────────────────────
 
-    def run(self):
-        """Override run to also start the push notification background task."""
-        app = Application.builder().token(self.cfg.token).build()
-        self.register_handlers(app)
-
-        async def post_init(application):
-            await self.set_bot_commands(application)
-            # Start push notification loop as a background task
-            asyncio.get_event_loop().create_task(
-                self._push_notification_loop(application)
-            )
-
-        app.post_init = post_init
-
-        logger.info("Starting monitor_bot…")
-        app.run_polling(drop_pending_updates=True)
+    async def post_init(self, app: Application):
+        """Also start the push notification background task."""
+        await super().post_init(app)
+        asyncio.get_event_loop().create_task(
+            self._push_notification_loop(app)
+        )
 
 
 if __name__ == "__main__":
@@ -23,16 +23,31 @@ Commands:
 """
 
 import asyncio
+import functools
 import logging
 import sys
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 
 from telegram import Update
+from telegram.error import RetryAfter
 from telegram.ext import CommandHandler, ContextTypes
 
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as async_timeout
+else:
+    from async_timeout import timeout as async_timeout
+
+try:
+    from systemd import journal
+    HAS_JOURNAL = True
+except ImportError:
+    HAS_JOURNAL = False
+
 sys.path.insert(0, str(Path(__file__).parent))
-from bot_base import BotBase, make_task_id, truncate
+from bot_base import BotBase, authorized, make_task_id, truncate
 
 CONFIG_PATH = Path(__file__).parent.parent / "config" / "picoclaw.yaml"
 
@@ -40,16 +55,183 @@ logger = logging.getLogger(__name__)
 
 # ── Rate limit guards for log streaming ──
 LOG_SEND_INTERVAL = 2.0   # min seconds between Telegram messages per stream
-LOG_CHUNK_SIZE = 3000      # max chars to buffer before flushing
+LOG_CHUNK_SIZE = 3000      # max bytes to buffer before flushing
 LOG_MAX_LINES = 500        # hard cap per stream session
+LOG_READ_TIMEOUT = 10.0    # give up on journalctl after this long without output
+LOG_STREAM_MAX_SECONDS = 120.0  # hard wall-clock cap on reading one stream
+LOG_PIPE_LIMIT = 1 << 20   # journalctl stdout buffer / longest accepted line
+LOG_STDERR_MAX = 2048      # journalctl stderr bytes kept for the end-of-stream note
+# Most log streams kept at once; the least recently started is cancelled
+MAX_ACTIVE_STREAMS = 256
+# Telegram allows ~1 message/sec per chat; shared by all streams to a chat
+CHAT_SEND_RATE = 1.0       # tokens per second
+CHAT_SEND_BURST = 1
+# Log chunks go out as HTML <pre>; only these three need escaping there
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+# Escaped text allowed inside <pre></pre>, leaving room for the truncation note
+LOG_HTML_MAX = 3500
+# Journal readers kept open (one per recently streamed unit)
+JOURNAL_READER_CACHE = 16
+
+
+class TokenBucket:
+    """Async token bucket: `rate` sends per second, at most `burst` at once."""
+
+    def __init__(self, rate: float = CHAT_SEND_RATE, burst: int = CHAT_SEND_BURST):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._stamp = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._stamp) * self.rate
+        )
+        self._stamp = now
+
+    def ready(self) -> bool:
+        """True if acquire() would not wait right now."""
+        self._refill()
+        return self._tokens >= 1 and not self._lock.locked()
+
+    async def acquire(self):
+        """Wait for and take one token (callers are served in order)."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def hold(self, seconds: float):
+        """Empty the bucket for `seconds` (after a 429 retry_after)."""
+        self._refill()
+        self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+
+@functools.lru_cache(maxsize=JOURNAL_READER_CACHE)
+def _reader_for(service: str):
+    """
+    An open journal Reader matching one unit, plus the lock guarding it.
+
+    Kept across /logs calls so repeat requests for the same service skip
+    opening the journal files and re-adding the match. Evicted readers
+    close their files when garbage collected.
+    """
+    j = journal.Reader()
+    j.add_match(_SYSTEMD_UNIT=f"{service}.service")
+    # Sets up the inotify watch that process() drains on each use
+    j.fileno()
+    return j, threading.Lock()
+
+
+def _read_journal(service: str, lines: int) -> list[bytes]:
+    """
+    Last `lines` journal entries for a unit, via sd-journal.
+
+    Seeks straight to the tail of the unit's entries, so no journalctl
+    process and no boot-index scan. Lines mimic `--output short-iso`.
+    """
+    out = []
+    j, lock = _reader_for(service)
+    # Readers are not thread-safe and _run_blocking uses a thread pool
+    with lock:
+        # Pick up journal files rotated or created since the last call
+        j.process()
+        j.seek_tail()
+        entry = j.get_previous(lines)
+        while entry:
+            ts = entry.get("__REALTIME_TIMESTAMP")
+            ident = entry.get("SYSLOG_IDENTIFIER", service)
+            pid = entry.get("_PID")
+            out.append((
+                f"{ts.isoformat(timespec='seconds') if ts else '-'} "
+                f"{ident}{f'[{pid}]' if pid else ''}: "
+                f"{entry.get('MESSAGE', '')}\n"
+            ).encode("utf-8", errors="replace"))
+            entry = j.get_next()
+    return out
+
+
+def _pre_html(text: str, max_chars: int = LOG_HTML_MAX) -> str:
+    """
+    Text as an HTML <pre> block within Telegram's message limit.
+
+    Escapes first and trims the escaped text, since each &, < or > grows
+    to 4-5 chars; a cut never lands inside an &...; entity.
+    """
+    escaped = text.translate(_HTML_ESCAPE)
+    if len(escaped) > max_chars:
+        cut = escaped[:max_chars]
+        amp = cut.rfind("&")
+        if amp != -1 and ";" not in cut[amp:]:
+            cut = cut[:amp]
+        escaped = (
+            f"{cut}\n…[truncated, {len(escaped) - len(cut)} chars omitted]"
+        )
+    return f"<pre>{escaped}</pre>"
+
+
+async def _iter_async(items):
+    """Async iterator over an already-read list of lines."""
+    for item in items:
+        yield item
+
+
+async def _drain_stderr(stream, limit: int = LOG_STDERR_MAX) -> bytes:
+    """
+    Read a child's stderr to EOF, keeping only the last `limit` bytes.
+
+    Run alongside the stdout reader so a chatty stderr can never fill
+    its pipe and block the child.
+    """
+    tail = b""
+    while chunk := await stream.read(4096):
+        tail = (tail + chunk)[-limit:]
+    return tail
+
+
+async def _journalctl_lines(proc):
+    """
+    Raw stdout lines of a journalctl process, until EOF, a stall of
+    LOG_READ_TIMEOUT, or LOG_STREAM_MAX_SECONDS in total.
+
+    One timeout scope for the whole stream, re-armed around each read
+    (and disarmed while the caller handles a line) instead of a
+    wait_for task per line.
+    """
+    loop = asyncio.get_running_loop()
+    hard_deadline = loop.time() + LOG_STREAM_MAX_SECONDS
+    try:
+        async with async_timeout(None) as deadline:
+            while True:
+                deadline.reschedule(
+                    min(loop.time() + LOG_READ_TIMEOUT, hard_deadline)
+                )
+                line_bytes = await proc.stdout.readline()
+                deadline.reschedule(None)
+                if not line_bytes:
+                    return  # EOF
+                yield line_bytes
+    except asyncio.TimeoutError:
+        return  # No more output within timeout
 
 
 class OpsBot(BotBase):
 
     def __init__(self):
         super().__init__(str(CONFIG_PATH), "ops_bot")
-        # user_id → asyncio.Task running _stream_logs
-        self._active_streams: dict[int, asyncio.Task] = {}
+        # user_id → asyncio.Task running _stream_logs, oldest first
+        self._active_streams: OrderedDict[int, asyncio.Task] = OrderedDict()
+        # chat_id → TokenBucket pacing stream messages to that chat
+        self._send_buckets: dict[int, TokenBucket] = {}
+        # Param schemas looked up once, not per update
+        self._param_specs = {
+            name: self.cfg.commands[name]["params"]
+            for name in ("logs", "restart_service", "disk_usage", "process_info")
+        }
 
     def register_handlers(self, app):
         super().register_handlers(app)
@@ -64,17 +246,22 @@ class OpsBot(BotBase):
             CommandHandler("process_info", self.cmd_process_info)
         )
 
+    def _raw_params(self, update: Update, context, name: str) -> dict:
+        """Parse a command's arguments, preferring PTB's context.args split."""
+        params_spec = self._param_specs[name]
+        raw = self._parse_command_args_from_tokens(context.args, params_spec)
+        if raw is None:
+            raw = self._parse_command_args(update.message.text, params_spec)
+        return raw
+
     # ──────────────────────────────────────────
     # /status
     # ──────────────────────────────────────────
 
+    @authorized
     async def cmd_status(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
-        if not self._is_authorized(update):
-            await self._reject_unauthorized(update)
-            return
-
         await self.execute_command(
             update, command_name="status", raw_params={}
         )
@@ -84,17 +271,11 @@ class OpsBot(BotBase):
     # Streams log output to Telegram with rate limiting and buffering.
     # ──────────────────────────────────────────
 
+    @authorized
     async def cmd_logs(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
-        if not self._is_authorized(update):
-            await self._reject_unauthorized(update)
-            return
-
-        text = update.message.text
-        raw = self._parse_command_args(
-            text, self.cfg.commands["logs"]["params"]
-        )
+        raw = self._raw_params(update, context, "logs")
 
         service = raw.get("service")
         if not service:
@@ -108,9 +289,7 @@ class OpsBot(BotBase):
 
         # Validate params before starting the stream
         try:
-            params = self.validator.validate(
-                raw, self.cfg.commands["logs"]["params"]
-            )
+            params = self.validator.validate(raw, self._param_specs["logs"])
         except Exception as e:
             await update.message.reply_text(f"⚠️ {e}")
             return
@@ -130,7 +309,8 @@ class OpsBot(BotBase):
         )
 
         # Audit the log stream request
-        self.audit.log(
+        await self._run_blocking(
+            self.audit.log,
             user_id=user.id,
             username=user.username or "",
             bot=self.cfg.bot_name,
@@ -143,139 +323,192 @@ class OpsBot(BotBase):
 
         # Run streaming in background so the bot stays responsive
         task = asyncio.get_event_loop().create_task(
-            self._stream_logs(
-                update, user.id, service, params["lines"]
-            )
+            self._stream_logs(update, service, params["lines"])
         )
-        self._active_streams[user.id] = task
+        self._track_stream(user.id, task)
+
+    def _track_stream(self, user_id: int, task: asyncio.Task):
+        """
+        Register a user's stream task.
+
+        The entry removes itself when the task finishes, however it ends,
+        and beyond MAX_ACTIVE_STREAMS the oldest stream is cancelled.
+        """
+        self._active_streams[user_id] = task
+        self._active_streams.move_to_end(user_id)
+        task.add_done_callback(functools.partial(self._untrack_stream, user_id))
+        while len(self._active_streams) > MAX_ACTIVE_STREAMS:
+            _, oldest = self._active_streams.popitem(last=False)
+            oldest.cancel()
+
+    def _untrack_stream(self, user_id: int, task: asyncio.Task):
+        # Only if it is still this task: /logs may have replaced it already
+        if self._active_streams.get(user_id) is task:
+            del self._active_streams[user_id]
+
+    async def _send_paced(self, bot, chat_id: int, text: str, **kwargs):
+        """
+        send_message through the chat's token bucket.
+
+        On a 429 the bucket is held for retry_after and the send retried once.
+        """
+        bucket = self._send_buckets.setdefault(chat_id, TokenBucket())
+        for attempt in range(2):
+            await bucket.acquire()
+            try:
+                return await bot.send_message(chat_id, text, **kwargs)
+            except RetryAfter as e:
+                delay = e.retry_after
+                if hasattr(delay, "total_seconds"):
+                    delay = delay.total_seconds()
+                logger.warning(
+                    "Rate limited sending to %s; retry in %ss", chat_id, delay
+                )
+                bucket.hold(delay)
+                if attempt:
+                    raise
 
     async def _stream_logs(
         self,
         update: Update,
-        user_id: int,
         service: str,
         lines: int,
     ):
         """
-        Stream journalctl output to Telegram in buffered, rate-limited chunks.
+        Stream journal output to Telegram in buffered, rate-limited chunks.
 
         Flow:
-            1. Spawn journalctl as async subprocess
+            1. Read the unit's last entries via sd-journal (systemd-python),
+               or spawn journalctl as async subprocess without it
             2. Read lines, buffer them
             3. Flush buffer when size limit or time interval reached
             4. Stop at LOG_MAX_LINES or stream end
         """
         chat_id = update.effective_chat.id
         bot = update.get_bot()
+        bucket = self._send_buckets.setdefault(chat_id, TokenBucket())
+        proc = None
+        stderr_task = None
 
-        # Use journalctl for systemd services
-        cmd = [
-            "journalctl",
-            "-u", service,
-            "-n", str(lines),
-            "--no-pager",
-            "--output", "short-iso",
-        ]
+        if HAS_JOURNAL:
+            try:
+                entries = await self._run_blocking(
+                    _read_journal, service, min(lines, LOG_MAX_LINES)
+                )
+            except Exception as e:
+                await bot.send_message(
+                    chat_id, f"❌ Failed to read journal: {e}"
+                )
+                return
+            source = _iter_async(entries)
+        else:
+            # Use journalctl for systemd services
+            cmd = [
+                "journalctl",
+                "-u", service,
+                "-n", str(lines),
+                "--no-pager",
+                "--output", "short-iso",
+            ]
 
-        try:
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-        except FileNotFoundError:
-            await bot.send_message(
-                chat_id,
-                "❌ `journalctl` not found. Is systemd available?",
-                parse_mode="Markdown",
-            )
-            return
-        except Exception as e:
-            await bot.send_message(
-                chat_id, f"❌ Failed to start log stream: {e}"
-            )
-            return
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    limit=LOG_PIPE_LIMIT,
+                )
+            except FileNotFoundError:
+                await bot.send_message(
+                    chat_id,
+                    "❌ `journalctl` not found. Is systemd available?",
+                    parse_mode="Markdown",
+                )
+                return
+            except Exception as e:
+                await bot.send_message(
+                    chat_id, f"❌ Failed to start log stream: {e}"
+                )
+                return
+            source = _journalctl_lines(proc)
+            stderr_task = asyncio.create_task(_drain_stderr(proc.stderr))
 
-        buffer: list[str] = []
-        buffer_size = 0
+        # Raw bytes; decoded once per message rather than once per line
+        buffer = bytearray()
         last_sent = 0.0
         line_count = 0
 
         async def flush_buffer():
-            nonlocal buffer, buffer_size, last_sent
+            nonlocal last_sent
             if not buffer:
                 return
-            text = "".join(buffer)
-            buffer = []
-            buffer_size = 0
+            text = buffer.decode("utf-8", errors="replace")
+            buffer.clear()
             try:
-                await bot.send_message(
+                await self._send_paced(
+                    bot,
                     chat_id,
-                    f"```\n{truncate(text, 3500)}\n```",
-                    parse_mode="Markdown",
+                    _pre_html(text),
+                    parse_mode="HTML",
                 )
             except Exception as e:
                 logger.error(f"Failed to send log chunk: {e}")
             last_sent = time.monotonic()
 
         try:
-            while line_count < LOG_MAX_LINES:
-                try:
-                    line_bytes = await asyncio.wait_for(
-                        proc.stdout.readline(), timeout=10.0
-                    )
-                except asyncio.TimeoutError:
-                    # No more output within timeout
-                    break
-
-                if not line_bytes:
-                    break  # EOF
-
-                decoded = line_bytes.decode("utf-8", errors="replace")
-                buffer.append(decoded)
-                buffer_size += len(decoded)
+            async for line in source:
+                buffer += line
                 line_count += 1
 
+                # A full chunk waits for the chat's token; otherwise keep
+                # coalescing lines until the interval passed and a token is free
                 now = time.monotonic()
-                should_flush = (
-                    buffer_size >= LOG_CHUNK_SIZE
-                    or (now - last_sent) >= LOG_SEND_INTERVAL
+                should_flush = len(buffer) >= LOG_CHUNK_SIZE or (
+                    (now - last_sent) >= LOG_SEND_INTERVAL
+                    and bucket.ready()
                 )
                 if should_flush:
                     await flush_buffer()
+                if line_count >= LOG_MAX_LINES:
+                    break
 
             # Final flush
             await flush_buffer()
-            await bot.send_message(
-                chat_id, f"📋 Stream ended ({line_count} lines)"
+            note = ""
+            if stderr_task is not None and line_count == 0:
+                # Nothing on stdout: journalctl's stderr says why
+                await asyncio.wait({stderr_task}, timeout=1.0)
+                if stderr_task.done() and not stderr_task.cancelled():
+                    err = stderr_task.result().decode("utf-8", errors="replace")
+                    if err.strip():
+                        note = f"\n{truncate(err.strip(), 500)}"
+            await self._send_paced(
+                bot, chat_id, f"📋 Stream ended ({line_count} lines){note}"
             )
 
         except asyncio.CancelledError:
             await flush_buffer()
-            await bot.send_message(chat_id, "📋 Stream stopped by user")
+            await self._send_paced(bot, chat_id, "📋 Stream stopped by user")
         except Exception as e:
             await bot.send_message(chat_id, f"❌ Stream error: {e}")
         finally:
-            if proc.returncode is None:
+            if stderr_task is not None and not stderr_task.done():
+                stderr_task.cancel()
+            if proc is not None and proc.returncode is None:
                 try:
                     proc.kill()
                     await proc.wait()
                 except Exception:
                     pass
-            # Clean up active stream reference
-            self._active_streams.pop(user_id, None)
 
     # ──────────────────────────────────────────
     # /stop — cancel active log stream
     # ──────────────────────────────────────────
 
+    @authorized
     async def cmd_stop(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
-        if not self._is_authorized(update):
-            await self._reject_unauthorized(update)
-            return
-
         user = update.effective_user
         task = self._active_streams.pop(user.id, None)
 
@@ -291,23 +524,17 @@ class OpsBot(BotBase):
     # /restart_service <service>  (requires confirmation)
     # ──────────────────────────────────────────
 
+    @authorized
     async def cmd_restart_service(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
-        if not self._is_authorized(update):
-            await self._reject_unauthorized(update)
-            return
-
-        text = update.message.text
-        raw = self._parse_command_args(
-            text, self.cfg.commands["restart_service"]["params"]
-        )
+        raw = self._raw_params(update, context, "restart_service")
 
         service = raw.get("service")
         if not service:
-            allowed = self.cfg.commands["restart_service"]["params"][
-                "service"
-            ].get("allowed", [])
+            allowed = self._param_specs["restart_service"]["service"].get(
+                "allowed", []
+            )
             await update.message.reply_text(
                 "Usage: `/restart_service <service>`\n"
                 f"Allowed services: {', '.join(allowed)}\n\n"
@@ -327,17 +554,11 @@ class OpsBot(BotBase):
     # /disk_usage [path=/workspace]
     # ──────────────────────────────────────────
 
+    @authorized
     async def cmd_disk_usage(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
-        if not self._is_authorized(update):
-            await self._reject_unauthorized(update)
-            return
-
-        text = update.message.text
-        raw = self._parse_command_args(
-            text, self.cfg.commands["disk_usage"]["params"]
-        )
+        raw = self._raw_params(update, context, "disk_usage")
 
         await self.execute_command(
             update,
@@ -349,17 +570,11 @@ class OpsBot(BotBase):
     # /process_info <name>
     # ──────────────────────────────────────────
 
+    @authorized
     async def cmd_process_info(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
-        if not self._is_authorized(update):
-            await self._reject_unauthorized(update)
-            return
-
-        text = update.message.text
-        raw = self._parse_command_args(
-            text, self.cfg.commands["process_info"]["params"]
-        )
+        raw = self._raw_params(update, context, "process_info")
 
         name = raw.get("name")
         if not name:
@@ -26,15 +26,20 @@ API:
 
 Dependencies: flask (add to requirements if not present)
     pip install flask
+    pip install orjson   # optional: faster JSON responses
+    pip install waitress # optional: production WSGI server (keep-alive, thread pool)
 """
 
+import hashlib
 import json
 import hmac
 import os
 import sqlite3
 import sys
+import threading
+import time
 from datetime import datetime, timezone
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
 
 # ── Path setup ───────────────────────────────────────────────────────────────
@@ -45,13 +50,71 @@ FALLBACK_DB = Path("/tmp/picoclaw_test_kanban.db")  # used by verify_kanban.py
 UI_FILE = Path(__file__).parent / "kanban_ui.html"
 
 try:
-    from flask import Flask, jsonify, request, send_file, abort
+    from flask import Flask, Response, jsonify, request, send_file, abort
 except ImportError:
     print("Flask not installed. Run: pip install flask", file=sys.stderr)
     sys.exit(1)
 
+sys.path.insert(0, str(Path(__file__).parent))
+from pkg.kanban.categorizer import apply_categorization, categorize_by_rules
+from pkg.kanban.schema import KanbanCard, TaskCategory, TaskSource, TaskState
+from pkg.kanban.store import KanbanStore
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from waitress import serve
+    HAS_WAITRESS = True
+except ImportError:
+    HAS_WAITRESS = False
+
 app = Flask(__name__)
 
+
+def _dumps(obj) -> bytes:
+    """Encode obj as JSON bytes (orjson when available)."""
+    if HAS_ORJSON:
+        # NON_STR_KEYS: count maps can have a NULL (None) group key
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def jout(obj) -> Response:
+    """JSON response; orjson-encoded when available, else flask.jsonify."""
+    if HAS_ORJSON:
+        return Response(_dumps(obj), mimetype="application/json")
+    return jsonify(obj)
+
+
+# Cards per chunk when streaming a card list
+STREAM_BATCH = 50
+
+
+def _stream_object(fields: dict):
+    """
+    Yield a JSON object in pieces: list values are encoded STREAM_BATCH
+    items at a time, so no single buffer holds the whole document.
+    """
+    sep = b"{"
+    for key, value in fields.items():
+        yield sep + _dumps(key) + b":"
+        sep = b","
+        if isinstance(value, list):
+            yield b"["
+            for i in range(0, len(value), STREAM_BATCH):
+                prefix = b"," if i else b""
+                yield prefix + b",".join(
+                    _dumps(item) for item in value[i:i + STREAM_BATCH]
+                )
+            yield b"]"
+        else:
+            yield _dumps(value)
+    yield b"}" if fields else b"{}"
+
 # ── Auth ─────────────────────────────────────────────────────────────────────
 
 API_SECRET = os.environ.get("PICOCLAW_API_SECRET", "")
@@ -62,18 +125,25 @@ def require_api_key(f):
     @wraps(f)
     def decorated(*args, **kwargs):
         if not API_SECRET:
-            return jsonify({"error": "API_SECRET not set"}), 503
+            return jout({"error": "API_SECRET not set"}), 503
         provided = request.headers.get("X-API-Key", "").strip()
         if not hmac.compare_digest(provided, API_SECRET):
             code = 401 if not provided else 403
-            return jsonify({"error": "Unauthorized"}), code
+            return jout({"error": "Unauthorized"}), code
         return f(*args, **kwargs)
     return decorated
 
 
 # ── Config ───────────────────────────────────────────────────────────────────
 
+# Mode changes are rare; /api/board and /health poll it constantly
+MODE_CACHE_TTL = 2.0
+_mode_cache: tuple = ("", 0.0)  # (mode, monotonic expiry)
+
+
+@lru_cache(maxsize=1)
 def get_db_path() -> Path:
+    """Resolve the DB path once; later calls skip the env lookup and stats."""
     env = os.environ.get("PICOCLAW_DB")
     if env:
         return Path(env)
@@ -86,103 +156,218 @@ def get_db_path() -> Path:
     return DEFAULT_DB
 
 
+@lru_cache(maxsize=1)
+def get_store() -> KanbanStore:
+    """The KanbanStore for get_db_path(), built (and schema-checked) once."""
+    return KanbanStore(str(get_db_path()))
+
+
+@lru_cache(maxsize=1)
+def _ensure_schema() -> None:
+    """
+    Create every table and index the server touches, once per process.
+
+    KanbanStore owns the DDL (kanban_cards, system_state, indexes), so
+    this just builds the store. Runs on the first connection rather than
+    at import, so `--db` is applied before the path is resolved.
+    """
+    get_store()
+
+
+_tls = threading.local()
+
+
+def _conn() -> sqlite3.Connection:
+    """
+    This thread's connection to the kanban DB, opened on first use.
+
+    Flask serves each request on a worker thread; keeping one connection
+    per thread avoids a connect + schema parse on every query. Autocommit:
+    reads need no transaction and each write is a single statement.
+    """
+    conn = getattr(_tls, "conn", None)
+    if conn is None:
+        _ensure_schema()
+        conn = sqlite3.connect(
+            get_db_path(), check_same_thread=False, isolation_level=None
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=30000")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        _tls.conn = conn
+    return conn
+
+
 def get_mode() -> str:
     """Read current mode from SQLite system table, default local."""
+    global _mode_cache
+    mode, expires = _mode_cache
+    if time.monotonic() < expires:
+        return mode
     try:
-        db = get_db_path()
-        with sqlite3.connect(db) as conn:
-            conn.row_factory = sqlite3.Row
-            cur = conn.execute(
-                "SELECT value FROM system_state WHERE key='mode' LIMIT 1"
-            )
-            row = cur.fetchone()
-            return row["value"] if row else "local"
+        row = _conn().execute(
+            "SELECT value FROM system_state WHERE key='mode' LIMIT 1"
+        ).fetchone()
+        mode = row["value"] if row else "local"
     except Exception:
         return "local"
+    _mode_cache = (mode, time.monotonic() + MODE_CACHE_TTL)
+    return mode
 
 
 def set_mode(mode: str) -> dict:
+    global _mode_cache
     if mode not in ("local", "remote"):
         raise ValueError(f"Invalid mode: {mode}")
-    db = get_db_path()
     now = datetime.now(timezone.utc).isoformat()
-    with sqlite3.connect(db) as conn:
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS system_state (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL,
-                updated_at TEXT NOT NULL
-            )
-        """)
-        conn.execute("""
-            INSERT INTO system_state (key, value, updated_at)
-            VALUES ('mode', ?, ?)
-            ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=excluded.updated_at
-        """, (mode, now))
-        conn.commit()
+    _conn().execute("""
+        INSERT INTO system_state (key, value, updated_at)
+        VALUES ('mode', ?, ?)
+        ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=excluded.updated_at
+    """, (mode, now))
+    _mode_cache = ("", 0.0)
     return {"mode": mode, "changed_at": now}
 
 
-def get_cards(limit: int = 200) -> list:
-    """Fetch all non-archived cards from the Kanban store."""
-    db = get_db_path()
+# Card fields kanban_ui.html renders; /api/board sends only these
+BOARD_COLUMNS = (
+    "card_id, title, state, category, source, project, priority, tags, created_at"
+)
+# Display order: states by priority, oldest first within a state, then any
+# unknown state. One query per state, each an ordered range scan of
+# idx_kanban_state_created that stops at the remaining LIMIT, so SQLite
+# never sorts (and a long tail of done cards is never read past the limit).
+# The final catch-all for unknown states is a plain filtered scan.
+_STATE_ORDER = ("running", "blocked", "review", "planned", "inbox", "done")
+_CARDS_BY_STATE_SQL = tuple(
+    f"SELECT {{columns}} FROM kanban_cards WHERE state = '{state}'"
+    " ORDER BY created_at LIMIT ?"
+    for state in _STATE_ORDER
+) + (
+    "SELECT {columns} FROM kanban_cards WHERE state != 'archived'"
+    " AND state NOT IN (" + ", ".join(f"'{state}'" for state in _STATE_ORDER)
+    + ") ORDER BY created_at LIMIT ?",
+)
+# Columns get_counts() may group by
+COUNT_COLUMNS = frozenset({"state", "category", "project", "source", "priority"})
+
+
+# UI tabs poll /api/board every few seconds: serve repeats within this
+# window from memory. Card-mutating endpoints invalidate immediately.
+CARDS_CACHE_TTL = 1.0
+_cards_cache: dict = {}  # (limit, columns) → (generation, expires, cards)
+_cards_gen = 0
+
+
+def invalidate_cards():
+    """Drop cached get_cards() results (call after any card write)."""
+    global _cards_gen
+    _cards_gen += 1
+
+
+def _fetch_card_rows(columns: str, limit: int) -> list:
+    """Active card rows in display order, read in one snapshot."""
+    conn = _conn()
+    rows = []
+    conn.execute("BEGIN")
     try:
-        with sqlite3.connect(db) as conn:
-            conn.row_factory = sqlite3.Row
-            try:
-                rows = conn.execute(
-                    "SELECT * FROM kanban_cards WHERE state != 'archived' LIMIT ?",
-                    (limit,)
-                ).fetchall()
-            except sqlite3.OperationalError:
-                return []
-
-            cards = [dict(r) for r in rows]
-
-            # Normalize tags (stored as JSON string) and ensure keys exist
-            for c in cards:
-                if isinstance(c.get("tags"), str):
-                    try:
-                        c["tags"] = json.loads(c["tags"])
-                    except Exception:
-                        c["tags"] = []
-
-            # Order states according to desired display priority
-            order = {"running": 0, "blocked": 1, "review": 2, "planned": 3, "inbox": 4, "done": 5}
-            def sort_key(card):
-                return (order.get(card.get("state"), 6),
-                        card.get("created_at") or "")
-
-            cards.sort(key=sort_key)
-            return cards
+        for sql in _CARDS_BY_STATE_SQL:
+            if len(rows) >= limit:
+                break
+            rows += conn.execute(
+                sql.format(columns=columns), (limit - len(rows),)
+            ).fetchall()
+    finally:
+        conn.execute("COMMIT")
+    return rows
+
+
+def get_cards(limit: int = 200, columns: str = "*") -> list:
+    """
+    Fetch all non-archived cards from the Kanban store.
+
+    Results are shared from a short-lived cache; callers must not mutate
+    the returned list or its cards.
+    """
+    key = (limit, columns)
+    gen = _cards_gen
+    hit = _cards_cache.get(key)
+    if hit and hit[0] == gen and time.monotonic() < hit[1]:
+        return hit[2]
+    try:
+        try:
+            rows = _fetch_card_rows(columns, limit)
+        except sqlite3.OperationalError:
+            return []
+
+        cards = [dict(r) for r in rows]
+
+        # Normalize tags (stored as JSON string) and ensure keys exist
+        for c in cards:
+            if isinstance(c.get("tags"), str):
+                try:
+                    c["tags"] = json.loads(c["tags"])
+                except Exception:
+                    c["tags"] = []
+
+        _cards_cache[key] = (gen, time.monotonic() + CARDS_CACHE_TTL, cards)
+        return cards
     except Exception as e:
         app.logger.warning(f"get_cards error: {e}")
         return []
 
 
+def get_counts(*columns: str) -> dict:
+    """
+    Non-archived card counts per distinct value of each column,
+    grouped in SQL: {column: {value: count}}.
+    """
+    counts = {col: {} for col in columns}
+    if not columns:
+        return counts
+    if not COUNT_COLUMNS.issuperset(columns):
+        raise ValueError(f"Cannot count by {set(columns) - COUNT_COLUMNS}")
+    sql = " UNION ALL ".join(
+        f"SELECT '{col}', {col}, COUNT(*) FROM kanban_cards"
+        f" WHERE state != 'archived' GROUP BY {col}"
+        for col in columns
+    )
+    try:
+        rows = _conn().execute(sql).fetchall()
+    except sqlite3.OperationalError:
+        return counts
+    except Exception as e:
+        app.logger.warning(f"get_counts error: {e}")
+        return counts
+    for col, value, n in rows:
+        counts[col][value] = n
+    return counts
+
+
 def get_recent_events(limit: int = 50) -> list:
     """Fetch recent events for the event log panel."""
-    db = get_db_path()
     try:
-        with sqlite3.connect(db) as conn:
-            conn.row_factory = sqlite3.Row
-            try:
-                rows = conn.execute("""
-                    SELECT event_type, task_id as card_id, summary, created_at
-                    FROM execution_events
-                    ORDER BY created_at DESC
-                    LIMIT ?
-                """, (limit,)).fetchall()
-            except sqlite3.OperationalError:
-                return []
-
-            events = []
-            for row in rows:
-                e = dict(row)
-                e["timestamp"] = e.pop("created_at", None)
-                e["message"] = e.pop("summary", "")
-                events.append(e)
-            return events
+        try:
+            rows = _conn().execute("""
+                SELECT event_type, task_id as card_id, summary, created_at
+                FROM execution_events
+                ORDER BY created_at DESC
+                LIMIT ?
+            """, (limit,)).fetchall()
+        except sqlite3.OperationalError:
+            return []
+
+        events = []
+        for row in rows:
+            e = dict(row)
+            e["timestamp"] = e.pop("created_at", None)
+            e["message"] = e.pop("summary", "")
+            events.append(e)
+        return events
     except Exception as e:
         app.logger.warning(f"get_events error: {e}")
         return []
@@ -190,71 +375,77 @@ def get_recent_events(limit: int = 50) -> list:
 
 # ── Routes ───────────────────────────────────────────────────────────────────
 
+UI_SEARCH_PATHS = (
+    UI_FILE,
+    Path.home() / "picoclaw" / "kanban_ui.html",
+    Path("/home/g/workspace/kanban_ui.html"),
+)
+# (html bytes with the API key injected, ETag); built on first GET /
+_ui_page = None
+
+
+def _load_ui_page():
+    """Read kanban_ui.html once, inject the API key, hash it for the ETag."""
+    global _ui_page
+    if _ui_page is None:
+        html_path = next((p for p in UI_SEARCH_PATHS if p.exists()), None)
+        if not html_path:
+            return None
+        html = html_path.read_text(encoding="utf-8")
+        # Inject API key so the UI can call authenticated endpoints
+        html = html.replace(
+            "/* INJECT_API_KEY */",
+            f"const API_KEY = '{API_SECRET}';" if API_SECRET else "const API_KEY = '';"
+        )
+        body = html.encode("utf-8")
+        _ui_page = (body, hashlib.blake2b(body, digest_size=8).hexdigest())
+    return _ui_page
+
+
 @app.route("/")
 def index():
-    # Serve the Kanban HTML UI, injecting API key for authenticated JS calls
-    search_paths = [
-        UI_FILE,
-        Path(__file__).parent / "kanban_ui.html",
-        Path.home() / "picoclaw" / "kanban_ui.html",
-        Path("/home/g/workspace/kanban_ui.html"),
-    ]
-    html_path = None
-    for p in search_paths:
-        if p.exists():
-            html_path = p
-            break
-    if not html_path:
+    # Serve the Kanban HTML UI (cached in memory; 304 when the ETag matches)
+    page = _load_ui_page()
+    if page is None:
         abort(404, "kanban_ui.html not found. Place it alongside kanban_server.py")
-    html = html_path.read_text(encoding="utf-8")
-    # Inject API key so the UI can call authenticated endpoints
-    html = html.replace(
-        "/* INJECT_API_KEY */",
-        f"const API_KEY = '{API_SECRET}';" if API_SECRET else "const API_KEY = '';"
-    )
-    return html
+    body, etag = page
+    resp = Response(body, mimetype="text/html")
+    resp.set_etag(etag)
+    # private: the page embeds the API key, so no shared caches
+    resp.headers["Cache-Control"] = "private, max-age=60"
+    return resp.make_conditional(request)
 
 
 @app.route("/api/board")
 def api_board():
-    cards  = get_cards()
+    cards  = get_cards(columns=BOARD_COLUMNS)
     events = get_recent_events(20)
     mode   = get_mode()
+    counts = get_counts("state", "category", "project")
 
+    by_state = counts["state"]
     stats = {
-        "total":   len(cards),
-        "running": sum(1 for c in cards if c.get("state") == "running"),
-        "blocked": sum(1 for c in cards if c.get("state") == "blocked"),
-        "review":  sum(1 for c in cards if c.get("state") == "review"),
-        "done":    sum(1 for c in cards if c.get("state") == "done"),
+        "total":   sum(by_state.values()),
+        "running": by_state.get("running", 0),
+        "blocked": by_state.get("blocked", 0),
+        "review":  by_state.get("review", 0),
+        "done":    by_state.get("done", 0),
     }
 
-    # Category stats
-    categories = {}
-    for c in cards:
-        cat = c.get("category", "uncategorized")
-        categories[cat] = categories.get(cat, 0) + 1
-
-    # Project stats
-    projects = {}
-    for c in cards:
-        proj = c.get("project", "")
-        if proj:
-            projects[proj] = projects.get(proj, 0) + 1
-
-    return jsonify({
+    # Streamed: time-to-first-byte and peak memory don't grow with the board
+    return Response(_stream_object({
         "cards":      cards,
         "events":     events,
         "mode":       mode,
         "stats":      stats,
-        "categories": categories,
-        "projects":   projects,
-    })
+        "categories": counts["category"],
+        "projects":   {p: n for p, n in counts["project"].items() if p},
+    }), mimetype="application/json")
 
 
 @app.route("/api/mode", methods=["GET"])
 def api_mode_get():
-    return jsonify({"mode": get_mode()})
+    return jout({"mode": get_mode()})
 
 
 @app.route("/api/mode", methods=["POST"])
@@ -263,12 +454,12 @@ def api_mode_set():
     data = request.get_json(force=True, silent=True) or {}
     mode = data.get("mode", "").strip().lower()
     if mode not in ("local", "remote"):
-        return jsonify({"error": "mode must be 'local' or 'remote'"}), 400
+        return jout({"error": "mode must be 'local' or 'remote'"}), 400
     try:
         result = set_mode(mode)
-        return jsonify(result)
+        return jout(result)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return jout({"error": str(e)}), 500
 
 
 @app.route("/api/cards", methods=["GET"])
@@ -286,7 +477,7 @@ def api_cards():
         cards = [c for c in cards if c.get("project") == project]
     if source:
         cards = [c for c in cards if c.get("source") == source]
-    return jsonify({"cards": cards, "count": len(cards)})
+    return jout({"cards": cards, "count": len(cards)})
 
 
 @app.route("/api/cards", methods=["POST"])
@@ -296,15 +487,10 @@ def api_create_card():
     data = request.get_json(force=True, silent=True) or {}
     title = data.get("title", "").strip()
     if not title:
-        return jsonify({"error": "title is required"}), 400
+        return jout({"error": "title is required"}), 400
 
     try:
-        # Import store here to avoid circular dependency at module level
-        sys.path.insert(0, str(Path(__file__).parent))
-        from pkg.kanban.store import KanbanStore
-        from pkg.kanban.schema import KanbanCard, TaskCategory, TaskSource
-
-        store = KanbanStore(str(get_db_path()))
+        store = get_store()
         card_id = store.next_card_id()
 
         # Parse category
@@ -335,9 +521,10 @@ def api_create_card():
             assignee=data.get("assignee", ""),
         )
         store.save(card)
-        return jsonify({"card": card.to_dict(), "id": card_id}), 201
+        invalidate_cards()
+        return jout({"card": card.to_dict(), "id": card_id}), 201
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return jout({"error": str(e)}), 500
 
 
 @app.route("/api/cards/<card_id>", methods=["PUT"])
@@ -346,13 +533,10 @@ def api_update_card(card_id):
     """Update an existing task card."""
     data = request.get_json(force=True, silent=True) or {}
     try:
-        sys.path.insert(0, str(Path(__file__).parent))
-        from pkg.kanban.store import KanbanStore
-
-        store = KanbanStore(str(get_db_path()))
+        store = get_store()
         card = store.get(card_id)
         if not card:
-            return jsonify({"error": "Card not found"}), 404
+            return jout({"error": "Card not found"}), 404
 
         # Update allowed fields
         if "title" in data:
@@ -368,16 +552,16 @@ def api_update_card(card_id):
         if "assignee" in data:
             card.assignee = data["assignee"]
         if "category" in data:
-            from pkg.kanban.schema import TaskCategory
             try:
                 card.category = TaskCategory(data["category"])
             except ValueError:
                 pass
 
         store.save(card)
-        return jsonify({"card": card.to_dict()})
+        invalidate_cards()
+        return jout({"card": card.to_dict()})
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return jout({"error": str(e)}), 500
 
 
 @app.route("/api/cards/<card_id>/transition", methods=["POST"])
@@ -390,55 +574,42 @@ def api_transition_card(card_id):
     executor = data.get("executor", "api")
 
     if not new_state:
-        return jsonify({"error": "state is required"}), 400
+        return jout({"error": "state is required"}), 400
 
     try:
-        sys.path.insert(0, str(Path(__file__).parent))
-        from pkg.kanban.store import KanbanStore
-        from pkg.kanban.schema import TaskState
-
-        store = KanbanStore(str(get_db_path()))
+        store = get_store()
         card = store.get(card_id)
         if not card:
-            return jsonify({"error": "Card not found"}), 404
+            return jout({"error": "Card not found"}), 404
 
         try:
             target_state = TaskState(new_state)
         except ValueError:
-            return jsonify({"error": f"Invalid state: {new_state}"}), 400
+            return jout({"error": f"Invalid state: {new_state}"}), 400
 
         if not card.transition_to(target_state, reason=reason, executor=executor):
-            return jsonify({
+            return jout({
                 "error": f"Invalid transition: {card.state.value} → {new_state}"
             }), 400
 
         store.save(card)
-        return jsonify({"card": card.to_dict()})
+        invalidate_cards()
+        return jout({"card": card.to_dict()})
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return jout({"error": str(e)}), 500
 
 
 @app.route("/api/categories")
 def api_categories():
     """List all categories with counts."""
-    cards = get_cards()
-    categories = {}
-    for c in cards:
-        cat = c.get("category", "uncategorized")
-        categories[cat] = categories.get(cat, 0) + 1
-    return jsonify({"categories": categories})
+    return jout({"categories": get_counts("category")["category"]})
 
 
 @app.route("/api/projects")
 def api_projects():
     """List all projects with counts."""
-    cards = get_cards()
-    projects = {}
-    for c in cards:
-        proj = c.get("project", "")
-        if proj:
-            projects[proj] = projects.get(proj, 0) + 1
-    return jsonify({"projects": projects})
+    projects = get_counts("project")["project"]
+    return jout({"projects": {p: n for p, n in projects.items() if p}})
 
 
 @app.route("/api/categorize", methods=["POST"])
@@ -448,15 +619,13 @@ def api_categorize():
     data = request.get_json(force=True, silent=True) or {}
     title = data.get("title", "").strip()
     if not title:
-        return jsonify({"error": "title is required"}), 400
+        return jout({"error": "title is required"}), 400
 
     try:
-        sys.path.insert(0, str(Path(__file__).parent))
-        from pkg.kanban.categorizer import categorize_by_rules
         result = categorize_by_rules(title, data.get("description", ""))
-        return jsonify(result)
+        return jout(result)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return jout({"error": str(e)}), 500
 
 
 @app.route("/api/categorize/card/<card_id>", methods=["POST"])
@@ -464,64 +633,38 @@ def api_categorize():
 def api_categorize_card(card_id):
     """Auto-categorize an existing card."""
     try:
-        sys.path.insert(0, str(Path(__file__).parent))
-        from pkg.kanban.store import KanbanStore
-        from pkg.kanban.categorizer import categorize_by_rules, apply_categorization
-
-        store = KanbanStore(str(get_db_path()))
+        store = get_store()
         card = store.get(card_id)
         if not card:
-            return jsonify({"error": "Card not found"}), 404
+            return jout({"error": "Card not found"}), 404
 
         result = categorize_by_rules(card.title, card.description)
         card = apply_categorization(card, result, from_llm=False)
         store.save(card)
-        return jsonify({"card": card.to_dict(), "categorization": result})
+        invalidate_cards()
+        return jout({"card": card.to_dict(), "categorization": result})
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return jout({"error": str(e)}), 500
 
 
 @app.route("/api/stats")
 def api_stats():
     """Get comprehensive board statistics."""
-    cards = get_cards()
-    
-    by_state = {}
-    by_category = {}
-    by_project = {}
-    by_source = {}
-    by_priority = {}
-    
-    for c in cards:
-        state = c.get("state", "inbox")
-        by_state[state] = by_state.get(state, 0) + 1
-        
-        cat = c.get("category", "uncategorized")
-        by_category[cat] = by_category.get(cat, 0) + 1
-        
-        proj = c.get("project", "")
-        if proj:
-            by_project[proj] = by_project.get(proj, 0) + 1
-        
-        src = c.get("source", "manual")
-        by_source[src] = by_source.get(src, 0) + 1
-        
-        pri = c.get("priority", "normal")
-        by_priority[pri] = by_priority.get(pri, 0) + 1
-    
-    return jsonify({
-        "total": len(cards),
+    counts = get_counts("state", "category", "project", "source", "priority")
+    by_state = counts["state"]
+    return jout({
+        "total": sum(by_state.values()),
         "by_state": by_state,
-        "by_category": by_category,
-        "by_project": by_project,
-        "by_source": by_source,
-        "by_priority": by_priority,
+        "by_category": counts["category"],
+        "by_project": {p: n for p, n in counts["project"].items() if p},
+        "by_source": counts["source"],
+        "by_priority": counts["priority"],
     })
 
 
 @app.route("/health")
 def health():
-    return jsonify({"status": "ok", "db": str(get_db_path()), "mode": get_mode()})
+    return jout({"status": "ok", "db": str(get_db_path()), "mode": get_mode()})
 
 
 # ── Main ─────────────────────────────────────────────────────────────────────
@@ -555,4 +698,15 @@ if __name__ == "__main__":
     # In local mode: bind to localhost only
     # In remote mode: the systemd service should be called with --host 0.0.0.0
     # Tailscale controls external access; don't expose on 0.0.0.0 without it
-    app.run(host=args.host, port=args.port, debug=False, threaded=True)
+    if HAS_WAITRESS:
+        # Fixed worker pool + HTTP keep-alive for the UI's polling
+        serve(
+            app,
+            host=args.host,
+            port=args.port,
+            threads=16,
+            connection_limit=512,
+            channel_timeout=60,
+        )
+    else:
+        app.run(host=args.host, port=args.port, debug=False, threaded=True)
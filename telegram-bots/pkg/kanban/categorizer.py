@@ -18,6 +18,18 @@ import os
 import re
 from typing import Dict, Any, Optional, Tuple, List
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 from .schema import TaskCategory, KanbanCard
 
 
@@ -50,6 +62,149 @@ Rules:
 - Respond with ONLY the JSON object, no markdown, no explanation"""
 
 
+# ── Rule tables for categorize_by_rules ──
+# Keywords match anywhere in the text (substring), checked in rule order:
+# the first rule with a hit sets the category / priority (and its tag).
+
+# (category, keywords, tag added on match)
+_CATEGORY_RULES: Tuple[Tuple[str, Tuple[str, ...], Optional[str]], ...] = (
+    ("bug", ("fix", "bug", "broken", "error", "crash", "fail", "issue", "patch",
+             "hotfix"), "bugfix"),
+    ("feature", ("add", "implement", "new", "feature", "create", "build"), None),
+    ("infra", ("deploy", "ci/cd", "docker", "server", "infra", "setup", "install",
+               "nginx", "systemd", "tailscale", "ssh"), "devops"),
+    ("design", ("design", "ui", "ux", "mockup", "wireframe", "layout", "css",
+                "style"), None),
+    ("research", ("research", "investigate", "explore", "learn", "study",
+                  "evaluate", "compare"), None),
+    ("ops", ("monitor", "alert", "log", "backup", "maintain",
+             "update dependencies"), None),
+    ("meeting", ("meeting", "call", "sync", "review", "standup", "retro"), None),
+    ("code", ("code", "refactor", "test", "api", "endpoint", "function", "class",
+              "module", "import", "parse", "query"), None),
+)
+
+# (priority, keywords, tag added on match)
+_PRIORITY_RULES: Tuple[Tuple[str, Tuple[str, ...], Optional[str]], ...] = (
+    ("critical", ("urgent", "critical", "asap", "immediately", "emergency"), "urgent"),
+    ("high", ("important", "high priority", "blocker"), None),
+    ("low", ("nice to have", "low priority", "someday", "eventually"), None),
+)
+
+# (whole words, tag): every rule that matches adds its tag, in this order
+_TAG_RULES: Tuple[Tuple[Tuple[str, ...], str], ...] = (
+    (("auth", "authentication"), "auth"),
+    (("frontend", "ui", "client"), "frontend"),
+    (("backend", "server", "api"), "backend"),
+    (("database", "db", "sql", "sqlite"), "database"),
+    (("test", "testing", "spec"), "testing"),
+    (("doc", "docs", "documentation"), "docs"),
+    (("security", "auth", "encryption"), "security"),
+    (("performance", "perf", "speed", "slow"), "performance"),
+)
+
+# LLM reply cleanup: markdown fences, then the first {...} as a last resort
+_FENCE_OPEN = re.compile(r'^```(?:json)?\s*')
+_FENCE_CLOSE = re.compile(r'\s*```$')
+_JSON_OBJECT = re.compile(r'\{[^}]+\}', re.DOTALL)
+
+_PROJECT_PREFIX = re.compile(r'^(?:\[([^\]]+)\]|([a-z0-9_-]+):)\s*', re.I)
+
+# Without pyahocorasick, tags are looked up in the text's set of words: a
+# keyword is bounded by \b exactly when it is a whole \w+ run
+_WORD = re.compile(r'\w+')
+_TAG_WORDS = tuple(frozenset(words) for words, _ in _TAG_RULES)
+
+def _build_automaton():
+    """
+    One Aho-Corasick automaton over every keyword of every rule table.
+
+    Each keyword maps to everything it can signal at once: (lowest
+    category rule, lowest priority rule, tag rules, keyword length), with
+    len(rules) standing in for "no category / priority rule".
+    """
+    no_category, no_priority = len(_CATEGORY_RULES), len(_PRIORITY_RULES)
+    labels: Dict[str, List[Any]] = {}
+
+    def label(word: str) -> List[Any]:
+        return labels.setdefault(word, [no_category, no_priority, set()])
+
+    for rank, (_, words, _) in enumerate(_CATEGORY_RULES):
+        for word in words:
+            entry = label(word)
+            entry[0] = min(entry[0], rank)
+    for rank, (_, words, _) in enumerate(_PRIORITY_RULES):
+        for word in words:
+            entry = label(word)
+            entry[1] = min(entry[1], rank)
+    for rank, (words, _) in enumerate(_TAG_RULES):
+        for word in words:
+            label(word)[2].add(rank)
+
+    automaton = ahocorasick.Automaton()
+    for word, (category_rank, priority_rank, tag_ranks) in labels.items():
+        automaton.add_word(
+            word, (category_rank, priority_rank, tuple(sorted(tag_ranks)), len(word))
+        )
+    automaton.make_automaton()
+    return automaton
+
+
+if HAS_AHOCORASICK:
+    _AUTOMATON = _build_automaton()
+
+
+def _is_word_char(c: str) -> bool:
+    """Whether c counts as a word character for a regex word boundary."""
+    return c.isalnum() or c == "_"
+
+
+def _scan_automaton(text: str) -> Tuple[int, int, set]:
+    """
+    Every rule hit in one pass over text.
+
+    Returns the lowest matching category and priority rule indexes
+    (len(rules) when none matched) and the set of matching tag rules.
+    Tag keywords only count as whole words.
+    """
+    category_rank = len(_CATEGORY_RULES)
+    priority_rank = len(_PRIORITY_RULES)
+    tag_ranks = set()
+    last = len(text) - 1
+    for end, (category, priority, tags, length) in _AUTOMATON.iter(text):
+        if category < category_rank:
+            category_rank = category
+        if priority < priority_rank:
+            priority_rank = priority
+        if tags:
+            start = end - length + 1
+            if (start == 0 or not _is_word_char(text[start - 1])) and (
+                end == last or not _is_word_char(text[end + 1])
+            ):
+                tag_ranks.update(tags)
+    return category_rank, priority_rank, tag_ranks
+
+
+def _scan_rules(text: str) -> Tuple[int, int, set]:
+    """_scan_automaton without pyahocorasick: substring scans per rule."""
+    category_rank = next(
+        (rank for rank, (_, words, _) in enumerate(_CATEGORY_RULES)
+         if any(w in text for w in words)),
+        len(_CATEGORY_RULES),
+    )
+    priority_rank = next(
+        (rank for rank, (_, words, _) in enumerate(_PRIORITY_RULES)
+         if any(w in text for w in words)),
+        len(_PRIORITY_RULES),
+    )
+    words = frozenset(_WORD.findall(text))
+    tag_ranks = {
+        rank for rank, tag_words in enumerate(_TAG_WORDS)
+        if not words.isdisjoint(tag_words)
+    }
+    return category_rank, priority_rank, tag_ranks
+
+
 def categorize_task_with_prompt(title: str, description: str = "") -> str:
     """Build the user prompt for LLM categorization."""
     prompt = f"Task: {title}"
@@ -63,17 +218,17 @@ def parse_categorization_response(response: str) -> Dict[str, Any]:
     # Strip markdown code fences if present
     response = response.strip()
     if response.startswith("```"):
-        response = re.sub(r'^```(?:json)?\s*', '', response)
-        response = re.sub(r'\s*```$', '', response)
+        response = _FENCE_OPEN.sub('', response)
+        response = _FENCE_CLOSE.sub('', response)
     
     try:
-        result = json.loads(response)
-    except json.JSONDecodeError:
+        result = _json_loads(response)
+    except json.JSONDecodeError:  # orjson's error subclasses it
         # Try to extract JSON from the response
-        match = re.search(r'\{[^}]+\}', response, re.DOTALL)
+        match = _JSON_OBJECT.search(response)
         if match:
             try:
-                result = json.loads(match.group())
+                result = _json_loads(match.group())
             except json.JSONDecodeError:
                 return _default_categorization()
         else:
@@ -119,76 +274,35 @@ def categorize_by_rules(title: str, description: str = "") -> Dict[str, Any]:
     """
     text = (title + " " + description).lower()
     
-    # Category detection rules
-    category = "uncategorized"
-    priority = "normal"
-    tags = []
     project = ""
     
     # Project extraction: "project: xyz" or "[xyz]" prefix
-    proj_match = re.match(r'^(?:\[([^\]]+)\]|([a-z0-9_-]+):)\s*', title, re.I)
+    proj_match = _PROJECT_PREFIX.match(title)
     if proj_match:
         project = (proj_match.group(1) or proj_match.group(2)).lower().strip()
     
-    # Bug detection
-    bug_words = ["fix", "bug", "broken", "error", "crash", "fail", "issue", "patch", "hotfix"]
-    if any(w in text for w in bug_words):
-        category = "bug"
-        tags.append("bugfix")
-    
-    # Feature detection
-    elif any(w in text for w in ["add", "implement", "new", "feature", "create", "build"]):
-        category = "feature"
-    
-    # Infrastructure
-    elif any(w in text for w in ["deploy", "ci/cd", "docker", "server", "infra", "setup", "install",
-                                   "nginx", "systemd", "tailscale", "ssh"]):
-        category = "infra"
-        tags.append("devops")
-    
-    # Design
-    elif any(w in text for w in ["design", "ui", "ux", "mockup", "wireframe", "layout", "css", "style"]):
-        category = "design"
-    
-    # Research
-    elif any(w in text for w in ["research", "investigate", "explore", "learn", "study", "evaluate", "compare"]):
-        category = "research"
-    
-    # Ops
-    elif any(w in text for w in ["monitor", "alert", "log", "backup", "maintain", "update dependencies"]):
-        category = "ops"
-    
-    # Meeting
-    elif any(w in text for w in ["meeting", "call", "sync", "review", "standup", "retro"]):
-        category = "meeting"
-    
-    # Code (broad)
-    elif any(w in text for w in ["code", "refactor", "test", "api", "endpoint", "function", "class",
-                                   "module", "import", "parse", "query"]):
-        category = "code"
-    
-    # Priority detection
-    if any(w in text for w in ["urgent", "critical", "asap", "immediately", "emergency"]):
-        priority = "critical"
-        tags.append("urgent")
-    elif any(w in text for w in ["important", "high priority", "blocker"]):
-        priority = "high"
-    elif any(w in text for w in ["nice to have", "low priority", "someday", "eventually"]):
-        priority = "low"
+    if HAS_AHOCORASICK:
+        category_rank, priority_rank, tag_ranks = _scan_automaton(text)
+    else:
+        category_rank, priority_rank, tag_ranks = _scan_rules(text)
+    
+    # First matching rule wins for category and priority
+    category = "uncategorized"
+    priority = "normal"
+    tags = []
+    if category_rank < len(_CATEGORY_RULES):
+        category, _, tag = _CATEGORY_RULES[category_rank]
+        if tag:
+            tags.append(tag)
+    if priority_rank < len(_PRIORITY_RULES):
+        priority, _, tag = _PRIORITY_RULES[priority_rank]
+        if tag:
+            tags.append(tag)
     
     # Tag extraction from common patterns
-    tag_patterns = [
-        (r'\b(auth|authentication)\b', 'auth'),
-        (r'\b(frontend|ui|client)\b', 'frontend'),
-        (r'\b(backend|server|api)\b', 'backend'),
-        (r'\b(database|db|sql|sqlite)\b', 'database'),
-        (r'\b(test|testing|spec)\b', 'testing'),
-        (r'\b(docs?|documentation)\b', 'docs'),
-        (r'\b(security|auth|encryption)\b', 'security'),
-        (r'\b(performance|perf|speed|slow)\b', 'performance'),
-    ]
-    for pattern, tag in tag_patterns:
-        if re.search(pattern, text) and tag not in tags:
+    for rank in sorted(tag_ranks):
+        tag = _TAG_RULES[rank][1]
+        if tag not in tags:
             tags.append(tag)
     
     return {
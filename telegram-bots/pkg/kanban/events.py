@@ -4,7 +4,7 @@ Event bridge: connects Picoclaw executor events to Kanban card state updates.
 Picoclaw emits events (task_started, task_progress, task_completed, task_failed).
 This module listens and updates Kanban cards accordingly.
 """
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, Iterable
 from datetime import datetime, timezone
 from .schema import KanbanCard, TaskState
 from .store import KanbanStore
@@ -111,6 +111,52 @@ class KanbanEventBridge:
 
 # ── ExecutionEvent emission (new canonical API) ──────────────────────────────
 
+VALID_SOURCES = frozenset({"executor", "terminal", "vscode", "bot"})
+VALID_EVENT_TYPES = frozenset({"started", "progress", "completed", "failed"})
+# Event types that move the card to a new state (see _react_to_event)
+TERMINAL_EVENT_TYPES = frozenset({"started", "completed", "failed"})
+
+_SQL_INSERT_EVENT = """
+    INSERT INTO execution_events
+    (task_id, source, event_type, summary, details, exit_code, artifact_path, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+# Same text every call, so sqlite3's statement cache skips the re-parse.
+# Both read idx_execution_events_task / _created backwards: no sort step.
+_SQL_RECENT_BY_TASK = """
+    SELECT * FROM execution_events
+    WHERE task_id = ?
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+_SQL_RECENT_ALL = """
+    SELECT * FROM execution_events
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+
+
+def _event_row(
+    task_id: Optional[str],
+    source: str,
+    event_type: str,
+    summary: str,
+    details: Optional[str] = None,
+    exit_code: Optional[int] = None,
+    artifact_path: Optional[str] = None,
+    created_at: Optional[str] = None,
+) -> tuple:
+    """Validate one event and return its execution_events row."""
+    if source not in VALID_SOURCES:
+        raise ValueError(f"Invalid source: {source}")
+    if event_type not in VALID_EVENT_TYPES:
+        raise ValueError(f"Invalid event_type: {event_type}")
+    if created_at is None:
+        created_at = datetime.now(timezone.utc).isoformat()
+    return (task_id, source, event_type, summary, details, exit_code,
+            artifact_path, created_at)
+
+
 def emit_event(
     store: KanbanStore,
     task_id: Optional[str],
@@ -141,39 +187,51 @@ def emit_event(
         - Inserts row into execution_events table
         - If terminal event + task_id exists: updates card state
     """
-    import sqlite3
-    from datetime import datetime, timezone
-    
     # Validate enum values (strict)
-    valid_sources = {"executor", "terminal", "vscode", "bot"}
-    valid_types = {"started", "progress", "completed", "failed"}
-    
-    if source not in valid_sources:
-        raise ValueError(f"Invalid source: {source}")
-    if event_type not in valid_types:
-        raise ValueError(f"Invalid event_type: {event_type}")
+    row = _event_row(task_id, source, event_type, summary, details,
+                     exit_code, artifact_path)
 
-    # Insert event
-    now = datetime.now(timezone.utc).isoformat()
-    with sqlite3.connect(store.db_path) as conn:
-        cursor = conn.execute(
-            """
-            INSERT INTO execution_events 
-            (task_id, source, event_type, summary, details, exit_code, artifact_path, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (task_id, source, event_type, summary, details, exit_code, artifact_path, now),
-        )
-        event_id = cursor.lastrowid
-        conn.commit()
+    # Insert event on the store's shared connection (no connect per event)
+    with store._lock:
+        conn = store._shared_conn()
+        with conn:
+            event_id = conn.execute(_SQL_INSERT_EVENT, row).lastrowid
 
     # React to terminal events (update Kanban state)
-    if task_id and event_type in ("started", "completed", "failed"):
+    if task_id and event_type in TERMINAL_EVENT_TYPES:
         _react_to_event(store, task_id, event_type)
 
     return event_id
 
 
+def emit_events_batch(store: KanbanStore, events: Iterable[Dict[str, Any]]) -> int:
+    """
+    Emit many ExecutionEvents in one transaction (one commit for the batch).
+
+    Each event is a dict of emit_event's keyword arguments (task_id,
+    source, event_type, summary, and optionally details, exit_code,
+    artifact_path). All events are validated before anything is written;
+    card state reactions then run in event order, as with emit_event.
+
+    Returns:
+        Number of events inserted
+    """
+    rows = [_event_row(**event) for event in events]
+    if not rows:
+        return 0
+
+    with store._lock:
+        conn = store._shared_conn()
+        with conn:
+            conn.executemany(_SQL_INSERT_EVENT, rows)
+
+    for task_id, _, event_type, *_ in rows:
+        if task_id and event_type in TERMINAL_EVENT_TYPES:
+            _react_to_event(store, task_id, event_type)
+
+    return len(rows)
+
+
 def _react_to_event(store: KanbanStore, task_id: str, event_type: str):
     """
     Update Kanban card state based on terminal execution events.
@@ -215,28 +273,12 @@ def get_recent_events(store: KanbanStore, task_id: Optional[str] = None, limit:
     Returns:
         List of event dicts (most recent first)
     """
-    import sqlite3
-    with sqlite3.connect(store.db_path) as conn:
-        conn.row_factory = sqlite3.Row
+    with store._lock:
+        conn = store._shared_conn()
         if task_id:
-            rows = conn.execute(
-                """
-                SELECT * FROM execution_events 
-                WHERE task_id = ? 
-                ORDER BY created_at DESC 
-                LIMIT ?
-                """,
-                (task_id, limit),
-            ).fetchall()
+            rows = conn.execute(_SQL_RECENT_BY_TASK, (task_id, limit)).fetchall()
         else:
-            rows = conn.execute(
-                """
-                SELECT * FROM execution_events 
-                ORDER BY created_at DESC 
-                LIMIT ?
-                """,
-                (limit,),
-            ).fetchall()
+            rows = conn.execute(_SQL_RECENT_ALL, (limit,)).fetchall()
     
     return [dict(r) for r in rows]
 
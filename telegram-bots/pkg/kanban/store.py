@@ -5,18 +5,22 @@ Provides CRUD operations and queries for Kanban cards.
 """
 import sqlite3
 import json
+import threading
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from .schema import KanbanCard, TaskState, TaskMode, TaskCategory, TaskSource, StateTransition
 
 
-def _connect(db_path: str) -> sqlite3.Connection:
+def _connect(db_path: str, check_same_thread: bool = True) -> sqlite3.Connection:
     """Open a connection with FK enforcement and WAL mode."""
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, check_same_thread=check_same_thread)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
     conn.execute("PRAGMA journal_mode = WAL")
+    # WAL makes NORMAL durable across app crashes; skips an fsync per commit
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA mmap_size = 268435456")
     return conn
 
 
@@ -29,8 +33,21 @@ class KanbanStore:
             db_path = str(Path.home() / ".local" / "share" / "picoclaw" / "kanban.db")
         self.db_path = db_path
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        # One long-lived connection for the execution-event hot path,
+        # opened on first use and shared across threads under the lock
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
         self._init_schema()
     
+    def _shared_conn(self) -> sqlite3.Connection:
+        """
+        The store's long-lived connection. Callers must hold self._lock
+        for as long as they use it (statements and commit).
+        """
+        if self._conn is None:
+            self._conn = _connect(self.db_path, check_same_thread=False)
+        return self._conn
+    
     def _init_schema(self):
         """Create tables if they don't exist."""
         with _connect(self.db_path) as conn:
@@ -96,6 +113,11 @@ class KanbanStore:
                 CREATE INDEX IF NOT EXISTS idx_execution_events_task 
                 ON execution_events(task_id, created_at)
             """)
+            # Recent events across all tasks (dashboard event log)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_execution_events_created
+                ON execution_events(created_at)
+            """)
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS notes (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -121,8 +143,17 @@ class KanbanStore:
                     updated_at TEXT NOT NULL
                 )
             """)
-            # Performance indexes for task board
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_cards_state ON kanban_cards(state)")
+            # Performance indexes for task board.
+            # Board summary (per-state counts + newest running card) and the
+            # server's per-state card lists; also serves plain state lookups
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_kanban_state_created "
+                "ON kanban_cards(state, created_at DESC)"
+            )
+            # Superseded by idx_kanban_state_created: drop from older DBs so
+            # writes stop maintaining them
+            conn.execute("DROP INDEX IF EXISTS idx_cards_state")
+            conn.execute("DROP INDEX IF EXISTS idx_kanban_active")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_cards_category ON kanban_cards(category)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_cards_project ON kanban_cards(project)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_cards_source ON kanban_cards(source)")
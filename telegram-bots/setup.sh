@@ -91,7 +91,7 @@ mkdir -p "$SYSTEMD_DIR"
 
 write_user_service() {
     local name="$1"
-    local script="$2"
+    local target="$2"   # script path, or "-m package.module"
     cat > "$SYSTEMD_DIR/picoclaw-${name}.service" <<EOF
 [Unit]
 Description=PicoClaw ${name^} Bot
@@ -101,7 +101,7 @@ Wants=network.target
 [Service]
 Type=simple
 WorkingDirectory=$PICOCLAW_DIR
-ExecStart=$VENV_DIR/bin/python $PICOCLAW_DIR/bots/${script}
+ExecStart=$VENV_DIR/bin/python ${target}
 Restart=on-failure
 RestartSec=10
 StandardOutput=journal
@@ -116,9 +116,9 @@ EOF
     echo "      Wrote picoclaw-${name}.service (user)"
 }
 
-write_user_service "dev" "dev_bot.py"
-write_user_service "ops" "ops_bot.py"
-write_user_service "monitor" "monitor_bot.py"
+write_user_service "dev" "-m bots.dev_bot"
+write_user_service "ops" "$PICOCLAW_DIR/bots/ops_bot.py"
+write_user_service "monitor" "$PICOCLAW_DIR/bots/monitor_bot.py"
 
 # Executor runs as system service (needs sudo for systemctl restart)
 if sudo tee /etc/systemd/system/picoclaw-executor.service > /dev/null <<EOF
@@ -7,14 +7,18 @@ Covers:
     - utc_now()             — timestamp format
     - ParamValidator        — all validation rules
     - TaskWriter            — task file creation, confirmation status
+    - dump_task / load_task_data — JSON wire format, YAML compatibility
     - AuditLogger           — structured JSON audit trail
     - BotConfig             — config loading, error handling
-    - BotBase._parse_command_args — positional, named, mixed parsing
+    - parse_command_args    — positional, named, mixed parsing
+    - parse_command_tokens  — same rules on PTB's pre-split context.args
 """
 
+import asyncio
 import json
 import os
 import textwrap
+import time
 from pathlib import Path
 
 import pytest
@@ -27,7 +31,11 @@ from bot_base import (
     BotConfig,
     TaskWriter,
     AuditLogger,
+    dump_task,
+    load_task_data,
     make_task_id,
+    parse_command_args,
+    parse_command_tokens,
     truncate,
     utc_now,
 )
@@ -99,6 +107,13 @@ class TestUtcNow:
         assert "T" in ts
         assert len(ts) == 20  # 2024-01-15T10:30:00Z
 
+    def test_matches_datetime(self):
+        from datetime import datetime, timezone
+        before = datetime.now(timezone.utc).replace(microsecond=0)
+        ts = datetime.strptime(utc_now(), "%Y-%m-%dT%H:%M:%SZ")
+        after = datetime.now(timezone.utc).replace(microsecond=0)
+        assert before <= ts.replace(tzinfo=timezone.utc) <= after
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # ParamValidator
@@ -166,6 +181,12 @@ class TestParamValidator:
         with pytest.raises(ValidationError, match="does not match"):
             self.v.validate({"name": "MyProject!"}, schema)
 
+    def test_pattern_must_match_whole_value(self):
+        schema = {"name": {"type": "string", "pattern": "[a-z]+"}}
+        assert self.v.validate({"name": "abc"}, schema) == {"name": "abc"}
+        with pytest.raises(ValidationError, match="does not match"):
+            self.v.validate({"name": "abc1"}, schema)
+
     # -- Integer --
 
     def test_integer_coercion(self):
@@ -223,7 +244,7 @@ class TestTaskWriter:
 
     def test_write_creates_yaml(self, tmp_path):
         writer = TaskWriter(tmp_path, timeout=5)
-        task_file = writer.write(
+        task_file = asyncio.run(writer.write(
             task_id="task-123-abc",
             bot_name="dev_bot",
             command="run_tests",
@@ -231,13 +252,13 @@ class TestTaskWriter:
             username="testuser",
             params={"suite": "unit"},
             project="myproject",
-        )
+        ))
         assert task_file.exists()
         assert task_file.name == "task-123-abc.yaml"
 
     def test_write_correct_content(self, tmp_path):
         writer = TaskWriter(tmp_path, timeout=5)
-        task_file = writer.write(
+        task_file = asyncio.run(writer.write(
             task_id="task-456-def",
             bot_name="dev_bot",
             command="deploy",
@@ -245,7 +266,7 @@ class TestTaskWriter:
             username="admin",
             params={"env": "staging"},
             project="glass-walls",
-        )
+        ))
 
         with open(task_file) as f:
             task = yaml.safe_load(f)
@@ -262,7 +283,7 @@ class TestTaskWriter:
 
     def test_write_confirmation_status(self, tmp_path):
         writer = TaskWriter(tmp_path, timeout=5)
-        task_file = writer.write(
+        task_file = asyncio.run(writer.write(
             task_id="task-789-ghi",
             bot_name="ops_bot",
             command="restart_service",
@@ -270,7 +291,7 @@ class TestTaskWriter:
             username="admin",
             params={"service": "nginx"},
             confirmation_required=True,
-        )
+        ))
 
         with open(task_file) as f:
             task = yaml.safe_load(f)
@@ -280,14 +301,14 @@ class TestTaskWriter:
 
     def test_write_without_optional_fields(self, tmp_path):
         writer = TaskWriter(tmp_path, timeout=5)
-        task_file = writer.write(
+        task_file = asyncio.run(writer.write(
             task_id="task-000-aaa",
             bot_name="monitor_bot",
             command="health",
             user_id=11111,
             username="user",
             params={},
-        )
+        ))
 
         with open(task_file) as f:
             task = yaml.safe_load(f)
@@ -299,17 +320,78 @@ class TestTaskWriter:
     def test_no_temp_files_left(self, tmp_path):
         """Atomic write should not leave .tmp files."""
         writer = TaskWriter(tmp_path, timeout=5)
-        writer.write(
+        asyncio.run(writer.write(
             task_id="task-tmp-test",
             bot_name="dev_bot",
             command="status",
             user_id=12345,
             username="test",
             params={},
-        )
+        ))
         tmp_files = list(tmp_path.glob("*.tmp"))
         assert len(tmp_files) == 0
 
+    def test_poll_result_reads_yaml_result(self, tmp_path):
+        """Executor results come back as YAML in the same file."""
+        writer = TaskWriter(tmp_path, timeout=5)
+        task_file = asyncio.run(writer.write(
+            task_id="task-poll-1",
+            bot_name="dev_bot",
+            command="status",
+            user_id=12345,
+            username="test",
+            params={},
+        ))
+        task = yaml.safe_load(task_file.read_text())
+        task.update(status="complete", exit_code=0)
+        task_file.write_text(yaml.dump(task))
+
+        result = asyncio.run(writer.poll_result(task_file))
+        assert result["status"] == "complete"
+        assert result["id"] == "task-poll-1"
+
+
+    def test_poll_result_shared_poller(self, tmp_path):
+        """Concurrent waits resolve independently through one poller."""
+        writer = TaskWriter(tmp_path, timeout=5)
+        files = [tmp_path / f"task-{i}.yaml" for i in range(3)]
+        for i, f in enumerate(files):
+            f.write_text(yaml.dump({"id": f"task-{i}", "status": "pending"}))
+
+        async def scenario():
+            waits = [asyncio.create_task(writer.poll_result(f)) for f in files]
+            await asyncio.sleep(0)
+            assert len(writer._pending_tasks) == 3
+            for i, f in enumerate(files):
+                f.write_text(yaml.dump({"id": f"task-{i}", "status": "complete"}))
+            return await asyncio.gather(*waits)
+
+        results = asyncio.run(scenario())
+        assert [r["id"] for r in results] == ["task-0", "task-1", "task-2"]
+        assert writer._pending_tasks == {}
+
+    def test_poll_result_timeout(self, tmp_path):
+        writer = TaskWriter(tmp_path, timeout=0.2)
+        task_file = tmp_path / "task-slow.yaml"
+        task_file.write_text(yaml.dump({"id": "task-slow", "status": "pending"}))
+        assert asyncio.run(writer.poll_result(task_file)) is None
+
+
+class TestTaskSerialization:
+
+    def test_round_trip(self):
+        task = {"id": "t-1", "params": {"n": 3, "msg": "héllo"}, "ok": True}
+        assert load_task_data(dump_task(task)) == task
+
+    def test_json_is_valid_yaml(self):
+        task = {"id": "t-2", "params": {"project": "glass-walls"}}
+        assert yaml.safe_load(dump_task(task)) == task
+
+    def test_loads_yaml(self):
+        assert load_task_data(b"id: t-3\nstatus: complete\n") == {
+            "id": "t-3", "status": "complete",
+        }
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # AuditLogger
@@ -341,6 +423,17 @@ class TestAuditLogger:
         assert entry["status"] == "submitted"
         assert "ts" in entry
 
+    def test_log_includes_epoch_ns(self, tmp_path):
+        log_file = tmp_path / "audit.jsonl"
+        before = time.time_ns()
+        AuditLogger(log_file).log(
+            user_id=1, username="", bot="dev_bot",
+            command="status", task_id="", status="submitted",
+        )
+        entry = json.loads(log_file.read_text())
+        assert isinstance(entry["ts_ns"], int)
+        assert before <= entry["ts_ns"] <= time.time_ns()
+
     def test_log_appends(self, tmp_path):
         log_file = tmp_path / "audit.jsonl"
         logger = AuditLogger(log_file)
@@ -439,9 +532,22 @@ class TestBotConfig:
             assert not cfg.is_authorized(99999)
             assert cfg.get_command("ping") is not None
             assert cfg.get_command("nonexistent") is None
+            assert cfg.polling_timeout == 50
+            assert cfg.allowed_user_ids == frozenset({12345})
+            assert cfg.webhook_url is None
+            assert cfg.projects == frozenset()
         finally:
             del os.environ["TEST_BOT_TOKEN"]
 
+    def test_config_parse_cached_until_file_changes(self, tmp_path):
+        from bot_base import load_config
+        config_file = self._write_config(tmp_path, {"bots": {}})
+        first = load_config(str(config_file))
+        assert load_config(str(config_file)) is first
+
+        config_file.write_text(yaml.dump({"bots": {"x": {}}, "pad": 1}))
+        assert load_config(str(config_file)) == {"bots": {"x": {}}, "pad": 1}
+
     def test_missing_bot_raises(self, tmp_path):
         os.environ["TEST_BOT_TOKEN"] = "fake-token"
         try:
@@ -483,25 +589,10 @@ class TestBotConfig:
 
 
 class TestParseCommandArgs:
-    """Test _parse_command_args as a standalone function by importing BotBase."""
+    """Test the parser BotBase._parse_command_args delegates to."""
 
     def _parse(self, text, schema):
-        """Call _parse_command_args without needing a full BotBase instance."""
-        from bot_base import BotBase
-        # Use the method as unbound (it only uses self for nothing)
-        parts = text.split()[1:]
-        schema_keys = list(schema.keys())
-        result = {}
-        positional_idx = 0
-        for part in parts:
-            if "=" in part:
-                key, _, value = part.partition("=")
-                result[key] = value
-            else:
-                if positional_idx < len(schema_keys):
-                    result[schema_keys[positional_idx]] = part
-                    positional_idx += 1
-        return result
+        return parse_command_args(text, schema)
 
     def test_positional_args(self):
         schema = {"project": {}, "suite": {}}
@@ -527,3 +618,12 @@ class TestParseCommandArgs:
         schema = {"project": {}}
         result = self._parse("/cmd myapp extra1 extra2", schema)
         assert result == {"project": "myapp"}
+
+    def test_tokens_match_text_parse(self):
+        schema = {"project": {}, "suite": {}}
+        assert parse_command_tokens(["myapp", "suite=unit"], schema) == (
+            self._parse("/run_tests myapp suite=unit", schema)
+        )
+
+    def test_tokens_empty(self):
+        assert parse_command_tokens([], {"project": {}}) == {}
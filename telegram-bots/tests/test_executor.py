@@ -41,6 +41,21 @@ from executor import (
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 
+class TestUtcNow:
+
+    def test_matches_datetime_format(self):
+        from datetime import datetime, timezone
+        from executor import utc_now
+        before = datetime.now(timezone.utc).replace(microsecond=0)
+        stamp = utc_now()
+        after = datetime.now(timezone.utc)
+        parsed = datetime.strptime(stamp, "%Y-%m-%dT%H:%M:%SZ").replace(
+            tzinfo=timezone.utc
+        )
+        assert before <= parsed <= after
+        assert stamp == parsed.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
 class TestValidateProjectName:
 
     def test_valid_names(self):
@@ -96,6 +111,21 @@ class TestSafePath:
         with pytest.raises(ValueError, match="Path traversal"):
             safe_path(tmp_path, "..", "..")
 
+    def test_sibling_prefix_blocked(self, tmp_path):
+        """/base2 shares a string prefix with /base but is outside it."""
+        base = tmp_path / "projects"
+        base.mkdir()
+        (tmp_path / "projects2").mkdir()
+        with pytest.raises(ValueError, match="Path traversal"):
+            safe_path(base, "..", "projects2", "secret")
+
+    def test_symlink_escape_blocked(self, tmp_path):
+        base = tmp_path / "projects"
+        base.mkdir()
+        (base / "link").symlink_to(tmp_path)
+        with pytest.raises(ValueError, match="Path traversal"):
+            safe_path(base, "link", "other")
+
 
 class TestTruncateOutput:
 
@@ -115,6 +145,65 @@ class TestTruncateOutput:
         assert "truncated" in result
 
 
+class TestRunBounded:
+
+    def test_captures_output(self):
+        from executor import run_bounded
+        result = run_bounded(
+            [sys.executable, "-c",
+             "import sys; print('out'); print('err', file=sys.stderr)"],
+            timeout=10,
+        )
+        assert result.returncode == 0
+        assert result.stdout == "out\n"
+        assert result.stderr == "err\n"
+
+    def test_noisy_output_bounded(self):
+        from executor import run_bounded
+        result = run_bounded(
+            [sys.executable, "-c", "print('x' * 200000)"],
+            timeout=10,
+            limit=100,
+        )
+        assert result.returncode == 0
+        assert len(result.stdout) <= 100
+        assert result.stdout.startswith("xxx")
+        assert "truncated" in result.stdout
+        # Already within MAX_OUTPUT, so not truncated again
+        assert truncate_output(result.stdout) == result.stdout
+
+    def test_pinned_child_deprioritized(self):
+        import os
+        import executor
+        cpus = os.sched_getaffinity(0)
+        with patch.object(executor, "_child_cpus", cpus), \
+                patch.object(executor, "_deprioritize_child",
+                             wraps=executor._deprioritize_child) as spy:
+            result = executor.run_bounded(
+                [sys.executable, "-c",
+                 "import os, time; time.sleep(0.2); print(os.nice(0))"],
+                timeout=10,
+            )
+        spy.assert_called_once()
+        assert result.returncode == 0
+        assert int(result.stdout) >= executor.CHILD_NICE
+
+    def test_cores_counts_cpus_from_before_pinning(self):
+        import executor
+        # Pinned to CPU 0, commands on 1-3: the host still has 4 cores
+        with patch.object(executor, "_child_cpus", {1, 2, 3}):
+            assert executor._cores() == 4
+
+    def test_timeout_kills_process(self):
+        import subprocess
+        from executor import run_bounded
+        with pytest.raises(subprocess.TimeoutExpired):
+            run_bounded(
+                [sys.executable, "-c", "import time; time.sleep(10)"],
+                timeout=0.2,
+            )
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Task file I/O
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -133,6 +222,14 @@ class TestLoadTask:
         assert loaded["command"] == "status"
         assert loaded["status"] == "pending"
 
+    def test_json_task(self, tmp_path):
+        """Bots write pending tasks as JSON under the .yaml name."""
+        task = {"id": "test-2", "command": "status", "params": {"n": 1}}
+        task_file = tmp_path / "test.yaml"
+        task_file.write_text(json.dumps(task, indent=2))
+
+        assert load_task(task_file) == task
+
     def test_missing_file_returns_none(self, tmp_path):
         result = load_task(tmp_path / "nonexistent.yaml")
         assert result is None
@@ -165,6 +262,57 @@ class TestWriteResult:
         tmp_files = list(tmp_path.glob("*.tmp"))
         assert len(tmp_files) == 0
 
+    def test_emitter_round_trips(self, tmp_path):
+        nasty = "".join(chr(c) for c in range(0x300)) + "\u2028\u2029\ufeff😀"
+        task = {
+            "id": "dev-1", "status": "failed", "exit_code": -1,
+            "duration_s": 0.25, "stdout": nasty, "stderr": "a: b\n- c #d",
+            "summary": None, "params": {"suite": "all", "limit": 3},
+            "tags": ["x", "y"], "extra": {},
+        }
+        task_file = tmp_path / "test.yaml"
+        write_result(task_file, task)
+
+        data = task_file.read_bytes()
+        assert yaml.safe_load(data) == task
+        assert load_task(task_file) == task
+
+    def test_unusual_shapes_fall_back_to_yaml_dump(self, tmp_path):
+        from executor import _emit_task_yaml
+        task = {
+            "id": "dev-2", "status": "complete", "ratio": 1e-20,
+            "params": {"on": "x"}, "nested": {"a": {"b": 1}},
+        }
+        for key in ("ratio", "params", "nested"):
+            assert _emit_task_yaml({key: task[key]}) is None
+        assert _emit_task_yaml({"stdout": "\udcff"}) is None
+
+        task_file = tmp_path / "test.yaml"
+        write_result(task_file, task)
+        loaded = load_task(task_file)
+        assert loaded["nested"] == {"a": {"b": 1}}
+        assert loaded["params"] == {"on": "x"}
+        assert loaded["ratio"] == 1e-20
+
+
+class TestAuditLog:
+
+    def test_batched_entries_flushed(self, tmp_path):
+        import executor
+        log_path = tmp_path / "logs" / "audit.jsonl"
+        with patch.object(executor, "AUDIT_LOG_PATH", log_path):
+            for i in range(100):
+                executor.audit_log(f"t-{i}", "status", "complete", exit_code=0)
+            executor.flush_audit_log()
+
+        lines = log_path.read_text().splitlines()
+        assert len(lines) == 100
+        first = json.loads(lines[0])
+        assert first["task_id"] == "t-0"
+        assert first["source"] == "executor"
+        assert isinstance(first["ts_ns"], int)
+        assert json.loads(lines[-1])["task_id"] == "t-99"
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Command dispatch table
@@ -185,6 +333,12 @@ class TestCommandTable:
         for name, handler in COMMAND_TABLE.items():
             assert callable(handler), f"{name} is not callable"
 
+    def test_fast_commands_are_known(self):
+        from executor import FAST_COMMANDS
+        assert FAST_COMMANDS <= COMMAND_TABLE.keys()
+        assert "run_tests" not in FAST_COMMANDS
+        assert "deploy" not in FAST_COMMANDS
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # process_task()
@@ -338,6 +492,332 @@ class TestProcessTask:
         assert result["status"] == "complete"
         assert "Health check" in result["summary"]
 
+    @patch("executor.audit_log")
+    def test_kanban_events_queued_in_order(self, mock_audit, tmp_path):
+        import executor
+        bridge = MagicMock()
+        mock_handler = MagicMock(return_value=(1, "", "boom", "Failed"))
+
+        task_file = self._write_task(tmp_path, {
+            "id": "test-9",
+            "command": "deploy",
+            "status": "pending",
+            "params": {"env": "staging"},
+            "project": "myapp",
+            "card_id": "card-1",
+        })
+
+        original = COMMAND_TABLE["deploy"]
+        COMMAND_TABLE["deploy"] = mock_handler
+        try:
+            with patch.object(executor, "get_kanban_bridge", return_value=bridge):
+                process_task(task_file)
+                executor.flush_kanban_events()
+        finally:
+            COMMAND_TABLE["deploy"] = original
+
+        assert [c[0] for c in bridge.method_calls] == [
+            "on_task_started", "on_task_failed",
+        ]
+        bridge.on_task_started.assert_called_once_with(
+            "card-1", executor="executor"
+        )
+        bridge.on_task_failed.assert_called_once_with(
+            "card-1", error="boom", log_url=""
+        )
+
+    @patch("executor.audit_log")
+    def test_fast_command_single_write(self, mock_audit, tmp_path):
+        import executor
+        mock_handler = MagicMock(return_value=(0, "clean", "", "Git status"))
+
+        task_file = self._write_task(tmp_path, {
+            "id": "test-7",
+            "command": "git_status",
+            "status": "pending",
+            "params": {},
+            "project": "myapp",
+        })
+
+        original = COMMAND_TABLE["git_status"]
+        COMMAND_TABLE["git_status"] = mock_handler
+        try:
+            with patch.object(
+                executor, "write_result", wraps=executor.write_result
+            ) as mock_write:
+                process_task(task_file)
+        finally:
+            COMMAND_TABLE["git_status"] = original
+
+        mock_write.assert_called_once()
+        assert mock_write.call_args[0][1]["status"] == "complete"
+        statuses = [c.args[2] for c in mock_audit.call_args_list]
+        assert statuses == ["complete"]
+
+    @patch("executor.audit_log")
+    def test_slow_command_marked_running(self, mock_audit, tmp_path):
+        import time
+        import executor
+        seen = {}
+
+        def slow_handler(task):
+            time.sleep(0.3)
+            with open(task_file) as f:
+                seen.update(yaml.safe_load(f))
+            return 0, "", "", "Done"
+
+        task_file = self._write_task(tmp_path, {
+            "id": "test-8",
+            "command": "run_tests",
+            "status": "pending",
+            "params": {},
+            "project": "myapp",
+        })
+
+        original = COMMAND_TABLE["run_tests"]
+        COMMAND_TABLE["run_tests"] = slow_handler
+        try:
+            with patch.object(executor, "RUNNING_WRITE_DELAY", 0.05):
+                process_task(task_file)
+        finally:
+            COMMAND_TABLE["run_tests"] = original
+
+        mock_audit.assert_any_call("test-8", "run_tests", "running")
+        assert seen["status"] == "running"
+        assert "started_at" in seen
+        with open(task_file) as f:
+            assert yaml.safe_load(f)["status"] == "complete"
+
+
+class TestSubmitTask:
+
+    def test_duplicate_submission_ignored(self, tmp_path):
+        import threading
+        import executor
+        release = threading.Event()
+        calls = []
+
+        def fake_process(task_file):
+            calls.append(task_file)
+            release.wait(5)
+
+        task_file = tmp_path / "dup.yaml"
+        with patch.object(executor, "process_task", fake_process):
+            first = executor.submit_task(task_file)
+            second = executor.submit_task(task_file)
+            release.set()
+            first.result(5)
+            # Finished tasks can be submitted again
+            third = executor.submit_task(task_file)
+            third.result(5)
+
+        assert second is None
+        assert calls == [task_file, task_file]
+
+
+class TestRecent:
+
+    def test_tail_across_chunks(self, tmp_path):
+        from executor import _tail
+        log = tmp_path / "audit.jsonl"
+        log.write_text("".join(f'{{"n": {i}}}\n' for i in range(1000)))
+        assert _tail(log, 3, chunk=16) == ['{"n": 997}', '{"n": 998}', '{"n": 999}']
+        assert len(_tail(log, 5000)) == 1000
+        assert _tail(log, 0) == []
+
+    def test_recent_reads_last_entries(self, tmp_path):
+        import executor
+        log = tmp_path / "audit.jsonl"
+        log.write_text("".join(f"line-{i}\n" for i in range(50)))
+        with patch.object(executor, "AUDIT_LOG_PATH", log):
+            code, output, _, summary = executor.recent({"params": {"limit": 2}})
+        assert code == 0
+        assert output == "line-48\nline-49"
+        assert summary == "Last 2 audit entries"
+
+
+class TestSystemStatus:
+
+    def test_service_states_single_systemctl_call(self):
+        import executor
+        fake = MagicMock(stdout="active\ninactive\n")
+        with patch.object(executor, "HAS_PYSTEMD", False), \
+                patch("executor.subprocess.run", return_value=fake) as run:
+            states = executor.service_states(["nginx", "redis", "docker"])
+
+        run.assert_called_once()
+        assert run.call_args[0][0] == [
+            "systemctl", "is-active", "nginx", "redis", "docker"
+        ]
+        assert states == {
+            "nginx": "active", "redis": "inactive", "docker": "unknown"
+        }
+
+    def test_mem_parses_meminfo(self, tmp_path):
+        from executor import _mem
+        meminfo = tmp_path / "meminfo"
+        meminfo.write_text(
+            "MemTotal:        8000000 kB\n"
+            "MemFree:         1000000 kB\n"
+            "MemAvailable:    4000000 kB\n"
+            "HugePages_Total:       0\n"
+        )
+        mem = _mem(str(meminfo))
+        assert mem["MemTotal"] == 8000000 * 1024
+        assert mem["MemAvailable"] == 4000000 * 1024
+        assert mem["HugePages_Total"] == 0
+
+    def test_load_parses_loadavg(self, tmp_path):
+        from executor import _load
+        loadavg = tmp_path / "loadavg"
+        loadavg.write_text("0.52 0.41 0.30 1/123 4567\n")
+        assert _load(str(loadavg)) == (0.52, 0.41, 0.30)
+
+    def test_human_sizes(self):
+        from executor import _human
+        assert _human(0) == "0B"
+        assert _human(512 * 1024) == "512K"
+        assert _human(int(3.9 * 1024 ** 3)) == "3.9G"
+        assert _human(120 * 1024 ** 3) == "120G"
+
+    def test_process_info_finds_self(self):
+        import os
+        from executor import process_info
+        with open("/proc/self/comm") as f:
+            comm = f.read().strip()
+        # comm is at most 15 chars; use a prefix valid for the name pattern
+        name = "".join(c for c in comm if c.isalnum() or c in "_-")[:6]
+        code, output, _, summary = process_info({"params": {"name": name}})
+        assert code == 0
+        assert output.splitlines()[0].split()[:3] == ["USER", "PID", "%MEM"]
+        pids = [line.split()[1] for line in output.splitlines()[1:]]
+        assert str(os.getpid()) in pids
+
+    def test_process_info_matches_cmdline(self):
+        import subprocess
+        import sys
+        import time
+        from executor import process_info
+        # comm is "python3"; the name only appears in the argument list
+        child = subprocess.Popen([
+            sys.executable, "-c", "import time; time.sleep(30)",
+            "my_kanban_server_with_a_long_name",
+        ])
+        try:
+            # Wait until the child has exec'd and its cmdline is visible
+            deadline = time.monotonic() + 5
+            while time.monotonic() < deadline:
+                with open(f"/proc/{child.pid}/cmdline", "rb") as f:
+                    if b"my_kanban_server" in f.read():
+                        break
+                time.sleep(0.01)
+            code, output, _, summary = process_info(
+                {"params": {"name": "my_kanban_server_with_a_long_name"}}
+            )
+            assert code == 0
+            pids = [line.split()[1] for line in output.splitlines()[1:]]
+            assert str(child.pid) in pids
+        finally:
+            child.kill()
+            child.wait()
+
+    def test_process_info_no_match(self):
+        from executor import process_info
+        code, output, _, summary = process_info(
+            {"params": {"name": "no-such-process-xyz"}}
+        )
+        assert code == 0
+        assert "No processes found" in output
+        assert "(0 matches)" in summary
+
+    def test_disk_usage_walks_tree(self, tmp_path):
+        from executor import disk_usage
+        (tmp_path / "a" / "deep").mkdir(parents=True)
+        (tmp_path / "a" / "deep" / "blob").write_bytes(b"x" * 300_000)
+        (tmp_path / "b").mkdir()
+        (tmp_path / "top.txt").write_text("hi")
+
+        code, output, _, summary = disk_usage(
+            {"params": {"path": str(tmp_path)}}
+        )
+        assert code == 0
+        lines = [line.split("\t") for line in output.splitlines()]
+        assert [p for _, p in lines] == [
+            str(tmp_path / "a"), str(tmp_path / "b"), str(tmp_path.resolve())
+        ]
+        assert lines[0][0].endswith("K")  # ~300K of allocated blocks
+
+    def test_disk_usage_counts_hard_links_once(self, tmp_path):
+        import os
+        from executor import disk_usage
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+        blob = tmp_path / "a" / "blob"
+        blob.write_bytes(b"x" * 3_000_000)
+        for i in range(5):
+            os.link(blob, tmp_path / "b" / f"link{i}")
+        os.link(blob, tmp_path / "top-link")
+
+        code, output, _, _ = disk_usage({"params": {"path": str(tmp_path)}})
+        assert code == 0
+        total = output.splitlines()[-1].split("\t")[0]
+        # One ~2.9M copy (plus directory blocks), not seven (~20M)
+        assert total.endswith("M") and float(total[:-1]) < 4
+
+    def test_disk_usage_deadline(self, tmp_path):
+        import subprocess
+        import executor
+        (tmp_path / "a").mkdir()
+        with patch.object(executor, "DU_TIMEOUT", -1):
+            with pytest.raises(subprocess.TimeoutExpired):
+                executor.disk_usage({"params": {"path": str(tmp_path)}})
+
+    def test_disk_percentage(self):
+        from executor import _disk
+        size, used, avail, pct = _disk("/")
+        assert size > 0
+        assert 0 <= pct <= 100
+        assert used + avail <= size
+
+
+class TestEventBatching:
+
+    def test_batch_deduplicated_and_filtered(self):
+        from collections import namedtuple
+        from executor import _event_task_files
+        Event = namedtuple("Event", "wd mask cookie name")
+        dev, ops = Path("/tasks/dev"), Path("/tasks/ops")
+        events = [
+            Event(1, 0, 0, "a.yaml.tmp"),
+            Event(1, 0, 0, "a.yaml"),
+            Event(1, 0, 0, b"a.yaml"),
+            Event(2, 0, 0, "a.yaml"),
+            Event(1, 0, 0, "notes.txt"),
+            Event(9, 0, 0, "orphan.yaml"),
+            Event(1, 0, 0, "b.yaml"),
+        ]
+        assert _event_task_files(events, {1: dev, 2: ops}) == [
+            dev / "a.yaml", ops / "a.yaml", dev / "b.yaml",
+        ]
+
+
+class TestRecentPaths:
+
+    def test_repeat_within_ttl_dropped(self):
+        from executor import RecentPaths
+        recent = RecentPaths(ttl=60)
+        assert recent.seen("/tasks/a.yaml") is False
+        assert recent.seen("/tasks/a.yaml") is True
+        assert recent.seen("/tasks/b.yaml") is False
+
+    def test_expired_entries_pass_and_are_evicted(self):
+        from executor import RecentPaths
+        recent = RecentPaths(ttl=0, evict_after=0)
+        assert recent.seen("/tasks/a.yaml") is False
+        assert recent.seen("/tasks/a.yaml") is False
+        recent.seen("/tasks/b.yaml")
+        assert "/tasks/a.yaml" not in recent._seen
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Command input validation (defense in depth)
@@ -8,9 +8,17 @@ from datetime import datetime
 
 from pkg.kanban.schema import KanbanCard, TaskState, TaskMode
 from pkg.kanban.store import KanbanStore
-from pkg.kanban.events import KanbanEventBridge
+from pkg.kanban.events import (
+    KanbanEventBridge,
+    emit_event,
+    emit_events_batch,
+    get_recent_events,
+    get_task_events,
+)
 from pkg.kanban.mode import LinuxModeManager, ModeViolation
 from pkg.kanban.telegram_bridge import TelegramKanbanBridge
+from pkg.kanban import categorizer
+from pkg.kanban.categorizer import categorize_by_rules, parse_categorization_response
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -262,6 +270,65 @@ def test_event_bridge_task_failed():
         Path(db_path).unlink(missing_ok=True)
 
 
+def test_emit_event_records_and_reacts():
+    """emit_event stores the event and moves the card on terminal events"""
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
+        db_path = tmp.name
+    
+    try:
+        store = KanbanStore(db_path)
+        card = KanbanCard(card_id="KAN-001", title="Test", state=TaskState.INBOX)
+        card.transition_to(TaskState.PLANNED, reason="Ready")
+        store.save(card)
+        
+        first = emit_event(store, "KAN-001", "executor", "started", "go")
+        second = emit_event(store, "KAN-001", "executor", "progress", "50%")
+        assert second > first
+        assert store.get("KAN-001").state == TaskState.RUNNING
+        
+        events = get_task_events(store, "KAN-001")
+        assert [e["summary"] for e in events] == ["50%", "go"]
+        
+        with pytest.raises(ValueError, match="Invalid source"):
+            emit_event(store, "KAN-001", "cron", "started", "nope")
+    
+    finally:
+        Path(db_path).unlink(missing_ok=True)
+
+
+def test_emit_events_batch():
+    """A batch is validated up front, inserted together, then reacted to"""
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
+        db_path = tmp.name
+    
+    try:
+        store = KanbanStore(db_path)
+        card = KanbanCard(card_id="KAN-001", title="Test", state=TaskState.RUNNING)
+        store.save(card)
+        
+        with pytest.raises(ValueError, match="Invalid event_type"):
+            emit_events_batch(store, [
+                {"task_id": "KAN-001", "source": "bot", "event_type": "progress", "summary": "a"},
+                {"task_id": "KAN-001", "source": "bot", "event_type": "paused", "summary": "b"},
+            ])
+        assert get_recent_events(store) == []
+        
+        inserted = emit_events_batch(store, [
+            {"task_id": "KAN-001", "source": "executor", "event_type": "progress", "summary": "a"},
+            {"task_id": "KAN-001", "source": "executor", "event_type": "completed",
+             "summary": "b", "exit_code": 0},
+            {"task_id": None, "source": "terminal", "event_type": "progress", "summary": "c"},
+        ])
+        assert inserted == 3
+        assert emit_events_batch(store, []) == 0
+        assert len(get_recent_events(store)) == 3
+        assert len(get_recent_events(store, task_id="KAN-001")) == 2
+        assert store.get("KAN-001").state == TaskState.REVIEW
+    
+    finally:
+        Path(db_path).unlink(missing_ok=True)
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Mode Manager Tests
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -405,3 +472,59 @@ def test_telegram_bridge_list_summary():
     
     finally:
         Path(db_path).unlink(missing_ok=True)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Rule Categorizer Tests
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+@pytest.fixture(params=["automaton", "rules"])
+def rule_scanner(request, monkeypatch):
+    """Run each test with and without the Aho-Corasick automaton"""
+    if request.param == "automaton":
+        if not categorizer.HAS_AHOCORASICK:
+            pytest.skip("pyahocorasick not installed")
+    else:
+        monkeypatch.setattr(categorizer, "HAS_AHOCORASICK", False)
+
+
+def test_rules_first_category_wins(rule_scanner):
+    """Bug outranks feature, and keywords match inside longer words"""
+    result = categorize_by_rules("Add retry to the failing upload")
+    assert result["category"] == "bug"
+    assert result["tags"][0] == "bugfix"
+
+
+def test_rules_priority_and_project(rule_scanner):
+    """Priority keywords and the [project] prefix are picked up"""
+    result = categorize_by_rules("[Web-App] deploy asap", "low priority")
+    assert result["project"] == "web-app"
+    assert result["category"] == "infra"
+    assert result["priority"] == "critical"
+    assert result["tags"] == ["devops", "urgent"]
+
+
+def test_rules_tags_need_whole_words(rule_scanner):
+    """Tag keywords only count on word boundaries, in rule order"""
+    result = categorize_by_rules("research oauth; db auth docs")
+    assert result["category"] == "research"
+    assert result["tags"] == ["auth", "database", "docs", "security"]
+    assert categorize_by_rules("study authors")["tags"] == []
+
+
+
+def test_parse_categorization_response_cleans_up_replies():
+    """Fenced and chatty LLM replies still yield a normalized result"""
+    fenced = parse_categorization_response(
+        '```json\n{"category": "bug", "tags": ["Auth"]}\n```'
+    )
+    assert fenced["category"] == "bug"
+    assert fenced["tags"] == ["auth"]
+    assert fenced["priority"] == "normal"
+
+    chatty = parse_categorization_response('Sure: {"priority": "high"} done')
+    assert chatty["priority"] == "high"
+    assert chatty["category"] == "uncategorized"
+
+    assert parse_categorization_response("no json here")["tags"] == []